@@ -7,6 +7,8 @@ from .occurrences import (
 from .cooccurrences import ContainerTermsAnalyzer, DomainContainerTerms
 from .concats import TermLeftRightFrequencyAnalyzer, DomainLeftRightFrequency
 from .charfonts import TermMaxsizeAnalyzer, DomainTermMaxsize
+from .aggregates import TermStatisticsAnalyzer, PDFTermStatistics, DomainTermStatistics
+from .share import TermVocabulary
 
 __all__ = [
     "TermOccurrenceAnalyzer",
@@ -14,9 +16,13 @@ __all__ = [
     "ContainerTermsAnalyzer",
     "TermLeftRightFrequencyAnalyzer",
     "TermMaxsizeAnalyzer",
+    "TermStatisticsAnalyzer",
     "DomainTermOccurrence",
     "DomainLinguOccurrence",
     "DomainContainerTerms",
     "DomainLeftRightFrequency",
     "DomainTermMaxsize",
+    "PDFTermStatistics",
+    "DomainTermStatistics",
+    "TermVocabulary",
 ]
@@ -0,0 +1,8 @@
+from .analyzer import TermStatisticsAnalyzer
+from .data import PDFTermStatistics, DomainTermStatistics
+
+__all__ = [
+    "TermStatisticsAnalyzer",
+    "PDFTermStatistics",
+    "DomainTermStatistics",
+]
@@ -0,0 +1,167 @@
+from typing import List, Set, Dict, Tuple, Iterator, Optional
+
+from .data import PDFTermStatistics, DomainTermStatistics
+from ..concats import TermLeftRightFrequencyAnalyzer, DomainLeftRightFrequency
+from ..share import CandidateTermTrie, TermVocabulary
+from py_slides_term.candidates import DomainCandidateTermList, PDFCandidateTermList
+from py_slides_term.share.data import Term, LinguSeq
+from py_slides_term.share.utils import term_separator
+
+TERM_STATISTICS = [
+    "term_occurrence",
+    "lingu_occurrence",
+    "container_terms",
+    "left_right_frequency",
+    "term_maxsize",
+]
+
+
+class TermStatisticsAnalyzer:
+    # public
+    def __init__(
+        self, ignore_augmented: bool = True, statistics: Optional[List[str]] = None
+    ):
+        if statistics is None:
+            statistics = TERM_STATISTICS
+
+        for statistic in statistics:
+            if statistic not in TERM_STATISTICS:
+                raise ValueError(f"unknown term statistic '{statistic}'")
+
+        self._ignore_augmented = ignore_augmented
+        self._collect_term_occurrence = "term_occurrence" in statistics
+        self._collect_lingu_occurrence = "lingu_occurrence" in statistics
+        self._collect_container_terms = "container_terms" in statistics
+        self._collect_lrfreq = "left_right_frequency" in statistics
+        self._collect_maxsize = "term_maxsize" in statistics
+        self._lrfreq_analyzer = TermLeftRightFrequencyAnalyzer(
+            ignore_augmented=ignore_augmented
+        )
+
+    def analyze(
+        self, domain_candidates: DomainCandidateTermList
+    ) -> DomainTermStatistics:
+        # statistics of subcandidates which are not candidates of the domain
+        # are dropped when they are converted into ranking data
+        # so only subcandidates found in the trie of the candidates are counted
+        candidate_trie = CandidateTermTrie(
+            str(candidate)
+            for pdf_candidates in domain_candidates.pdfs
+            for page_candidates in pdf_candidates.pages
+            for candidate in page_candidates.candidates
+        )
+
+        # terms of all PDFs are interned into the vocabulary of the domain
+        # so that the statistics are added without translating ids
+        domain_stats = DomainTermStatistics(domain_candidates.domain)
+        for pdf_candidates in domain_candidates.pdfs:
+            domain_stats.add(
+                self._analyze_pdf(pdf_candidates, domain_stats.vocab, candidate_trie)
+            )
+        return domain_stats
+
+    def analyze_pdf(self, pdf_candidates: PDFCandidateTermList) -> PDFTermStatistics:
+        # all subcandidates are counted since whether they are candidates
+        # depends on the other PDFs of the domain
+        # the PDF has its own vocabulary since its statistics are stored separately
+        return self._analyze_pdf(pdf_candidates, TermVocabulary(), None)
+
+    # private
+    def _analyze_pdf(
+        self,
+        pdf_candidates: PDFCandidateTermList,
+        vocab: TermVocabulary,
+        candidate_trie: Optional[CandidateTermTrie],
+    ) -> PDFTermStatistics:
+        candidates: Set[int] = set()
+        container_candidates: Set[int] = set()
+        lrfreq = DomainLeftRightFrequency(pdf_candidates.pdf_path, dict(), dict())
+
+        term_freq: Dict[int, int] = dict()
+        term_maxsize: Dict[int, float] = dict()
+        lingu_freq: Dict[int, Dict[LinguSeq, int]] = dict()
+        container_terms: Dict[int, Dict[int, int]] = dict()
+
+        collect_subcandidates = (
+            self._collect_term_occurrence
+            or self._collect_lingu_occurrence
+            or self._collect_container_terms
+            or self._collect_maxsize
+        )
+
+        # all statistics are collected in a single pass
+        for page_candidates in pdf_candidates.pages:
+            for candidate in page_candidates.candidates:
+                candidate_id = vocab.intern(str(candidate))
+                candidates.add(candidate_id)
+                if self._ignore_augmented and candidate.augmented:
+                    continue
+
+                if self._collect_container_terms:
+                    container_candidates.add(candidate_id)
+                if self._collect_lrfreq:
+                    self._lrfreq_analyzer.update_by_candidate(lrfreq, candidate)
+
+                if not collect_subcandidates:
+                    continue
+
+                num_morphemes = len(candidate.morphemes)
+                lingu_seq = candidate.linguistic_sequence()
+                subcandidates = (
+                    candidate_trie.find_subcandidates(candidate)
+                    if candidate_trie is not None
+                    else self._iter_subcandidates(candidate)
+                )
+                for i, j, subcandidate_str in subcandidates:
+                    subcandidate_id = vocab.intern(subcandidate_str)
+                    term_freq[subcandidate_id] = term_freq.get(subcandidate_id, 0) + 1
+
+                    if self._collect_maxsize:
+                        term_maxsize[subcandidate_id] = max(
+                            term_maxsize.get(subcandidate_id, 0),
+                            candidate.fontsize,
+                        )
+
+                    if self._collect_lingu_occurrence:
+                        lingu = lingu_freq.get(subcandidate_id, dict())
+                        sub_lingu_seq = lingu_seq[i:j]
+                        lingu[sub_lingu_seq] = lingu.get(sub_lingu_seq, 0) + 1
+                        lingu_freq[subcandidate_id] = lingu
+
+                    if self._collect_container_terms and not (
+                        i == 0 and j == num_morphemes
+                    ):
+                        containers = container_terms.get(subcandidate_id, dict())
+                        containers[candidate_id] = containers.get(candidate_id, 0) + 1
+                        container_terms[subcandidate_id] = containers
+
+        return PDFTermStatistics(
+            pdf_candidates.pdf_path,
+            vocab,
+            candidates,
+            container_candidates,
+            term_freq if self._collect_term_occurrence else dict(),
+            term_maxsize,
+            lingu_freq,
+            container_terms,
+            lrfreq.left_freq,
+            lrfreq.right_freq,
+        )
+
+    def _iter_subcandidates(self, candidate: Term) -> Iterator[Tuple[int, int, str]]:
+        # yield (i, j, subcandidate_str) for each morphemes[i:j]
+        # strings of subcandidates are built incrementally from morphemes
+        # instead of creating and stringifying a term for each subcandidate
+        morpheme_strs = list(map(str, candidate.morphemes))
+        num_morphemes = len(morpheme_strs)
+        segments = [""] + [
+            term_separator(morpheme_strs[k - 1], morpheme_strs[k]) + morpheme_strs[k]
+            for k in range(1, num_morphemes)
+        ]
+
+        for i in range(num_morphemes):
+            subcandidate_str = morpheme_strs[i]
+            yield i, i + 1, subcandidate_str
+            for j in range(i + 2, num_morphemes + 1):
+                subcandidate_str += segments[j - 1]
+                yield i, j, subcandidate_str
@@ -0,0 +1,391 @@
+from dataclasses import dataclass, field
+from typing import List, Set, Dict, Any, Sequence, Hashable, TypeVar
+
+from ..occurrences import DomainLinguOccurrence
+from ..concats import DomainLeftRightFrequency
+from ..share import TermVocabulary
+from py_slides_term.share.data import LinguSeq
+
+CountKey = TypeVar("CountKey", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class PDFTermStatistics:
+    pdf_path: str
+    # path to the PDF file
+    vocab: TermVocabulary
+    # vocabulary of subcandidates, which is shared with the domain
+    # when the PDF is analyzed together with the domain
+    # terms below are represented by ids of the vocabulary
+    candidates: Set[int]
+    # set of candidate terms in the PDF
+    container_candidates: Set[int]
+    # set of candidate terms in the PDF which can be containers of other terms
+    # augmented candidate terms are not included
+    term_freq: Dict[int, int]
+    # brute force counting of subcandidate occurrences in the PDF
+    # subcandidates which are not candidate terms in the domain are also counted
+    term_maxsize: Dict[int, float]
+    # max fontsize of the subcandidate in the PDF
+    lingu_freq: Dict[int, Dict[LinguSeq, int]]
+    # brute force counting of (subcandidate, linguistic sequence) in the PDF
+    container_terms: Dict[int, Dict[int, int]]
+    # number of occurrences of (subcandidate, container) in the PDF
+    # (subcandidate, container) is valid iff the container contains the subcandidate
+    # as a proper subsequence
+    left_freq: Dict[str, Dict[str, int]]
+    # number of occurrences of (left, morpheme) in the PDF
+    right_freq: Dict[str, Dict[str, int]]
+    # number of occurrences of (morpheme, right) in the PDF
+
+    def to_json(self) -> Dict[str, Any]:
+        get_term = self.vocab.get_term
+        return {
+            "pdf_path": self.pdf_path,
+            "candidates": list(map(get_term, self.candidates)),
+            "container_candidates": list(map(get_term, self.container_candidates)),
+            "term_freq": {
+                get_term(term_id): freq for term_id, freq in self.term_freq.items()
+            },
+            "term_maxsize": {
+                get_term(term_id): maxsize
+                for term_id, maxsize in self.term_maxsize.items()
+            },
+            "lingu_freq": {
+                get_term(term_id): [
+                    [list(map(list, lingu_seq)), freq]
+                    for lingu_seq, freq in lingu.items()
+                ]
+                for term_id, lingu in self.lingu_freq.items()
+            },
+            "container_terms": {
+                get_term(term_id): {
+                    get_term(container_id): freq
+                    for container_id, freq in containers.items()
+                }
+                for term_id, containers in self.container_terms.items()
+            },
+            "left_freq": self.left_freq,
+            "right_freq": self.right_freq,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        vocab = TermVocabulary()
+        intern = vocab.intern
+        return cls(
+            obj["pdf_path"],
+            vocab,
+            set(map(intern, obj["candidates"])),
+            set(map(intern, obj["container_candidates"])),
+            {intern(term): freq for term, freq in obj["term_freq"].items()},
+            {intern(term): maxsize for term, maxsize in obj["term_maxsize"].items()},
+            {
+                intern(term): {
+                    tuple(map(tuple, lingu_seq)): freq for lingu_seq, freq in lingu
+                }
+                for term, lingu in obj["lingu_freq"].items()
+            },
+            {
+                intern(term): {
+                    intern(container): freq for container, freq in containers.items()
+                }
+                for term, containers in obj["container_terms"].items()
+            },
+            obj["left_freq"],
+            obj["right_freq"],
+        )
+
+
+@dataclass(frozen=True)
+class DomainTermStatistics:
+    domain: str
+    # unique domain name
+    vocab: TermVocabulary = field(default_factory=TermVocabulary)
+    # vocabulary of subcandidates in the domain
+    # statistics of terms below are lists indexed by ids of the vocabulary
+    # and zero or empty values mean that the term is not counted
+    pdf_freq: Dict[str, int] = field(default_factory=dict)
+    # number of times the PDF is added to the domain
+    candidate_freq: List[int] = field(default_factory=list)
+    # number of PDFs in the domain where the term is a candidate term
+    container_candidate_freq: List[int] = field(default_factory=list)
+    # number of PDFs in the domain where the term is a non-augmented candidate term
+    term_freq: List[int] = field(default_factory=list)
+    # brute force counting of subcandidate occurrences in the domain
+    doc_term_freq: List[int] = field(default_factory=list)
+    # number of PDFs in the domain that contain the subcandidate
+    term_maxsize: List[Dict[str, float]] = field(default_factory=list)
+    # max fontsize of the subcandidate in each PDF of the domain
+    lingu_freq: List[Dict[LinguSeq, int]] = field(default_factory=list)
+    # brute force counting of (subcandidate, linguistic sequence) in the domain
+    lingu_docs: List[Dict[LinguSeq, Set[str]]] = field(default_factory=list)
+    # set of PDFs in the domain that contain (subcandidate, linguistic sequence)
+    container_terms: List[Dict[int, int]] = field(default_factory=list)
+    # number of PDFs in the domain that contain (subcandidate, container)
+    morpheme_freq: Dict[str, int] = field(default_factory=dict)
+    # number of PDFs in the domain that contain the morpheme
+    left_freq: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # number of occurrences of (left, morpheme) in the domain
+    right_freq: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # number of occurrences of (morpheme, right) in the domain
+
+    def add(self, pdf_stats: PDFTermStatistics):
+        self._update(pdf_stats, 1)
+
+    def subtract(self, pdf_stats: PDFTermStatistics):
+        if self.pdf_freq.get(pdf_stats.pdf_path, 0) == 0:
+            raise ValueError(
+                f"'{pdf_stats.pdf_path}' is not added to the domain '{self.domain}'"
+            )
+        self._update(pdf_stats, -1)
+
+    def num_docs(self) -> int:
+        return sum(self.pdf_freq.values())
+
+    # statistics of subcandidates which are not candidate terms of the domain
+    # are dropped by the following methods
+    # lists returned by them are indexed by ids of to_candidate_vocabulary()
+    def to_candidate_vocabulary(self) -> TermVocabulary:
+        return TermVocabulary(map(self.vocab.get_term, self._candidate_ids()))
+
+    def to_term_freq(self) -> List[int]:
+        return [self.term_freq[term_id] for term_id in self._candidate_ids()]
+
+    def to_doc_term_freq(self) -> List[int]:
+        return [self.doc_term_freq[term_id] for term_id in self._candidate_ids()]
+
+    def to_container_terms(self) -> List[Set[int]]:
+        candidate_ids = self._candidate_ids()
+        candidate_index = {term_id: i for i, term_id in enumerate(candidate_ids)}
+        # containers are candidate terms of some PDFs in the domain
+        return [
+            {candidate_index[container] for container in self.container_terms[term_id]}
+            for term_id in candidate_ids
+        ]
+
+    def to_term_maxsize(self) -> List[float]:
+        return [
+            max(0, max(self.term_maxsize[term_id].values(), default=0))
+            for term_id in self._candidate_ids()
+        ]
+
+    def to_lingu_occurrence(self) -> DomainLinguOccurrence:
+        lingu_freq: Dict[LinguSeq, int] = dict()
+        doc_lingu_set: Dict[LinguSeq, Set[str]] = dict()
+        for term_id in self._candidate_ids():
+            for lingu_seq, freq in self.lingu_freq[term_id].items():
+                lingu_freq[lingu_seq] = lingu_freq.get(lingu_seq, 0) + freq
+            for lingu_seq, pdf_paths in self.lingu_docs[term_id].items():
+                doc_lingu_set[lingu_seq] = doc_lingu_set.get(lingu_seq, set())
+                doc_lingu_set[lingu_seq].update(pdf_paths)
+
+        doc_lingu_freq = {
+            lingu_seq: sum(map(lambda pdf_path: self.pdf_freq[pdf_path], pdf_paths))
+            for lingu_seq, pdf_paths in doc_lingu_set.items()
+        }
+        return DomainLinguOccurrence(self.domain, lingu_freq, doc_lingu_freq)
+
+    def to_left_right_frequency(self) -> DomainLeftRightFrequency:
+        left_freq = {morpheme: dict(left) for morpheme, left in self.left_freq.items()}
+        right_freq = {
+            morpheme: dict(right) for morpheme, right in self.right_freq.items()
+        }
+        return DomainLeftRightFrequency(self.domain, left_freq, right_freq)
+
+    def to_json(self) -> Dict[str, Any]:
+        # terms are written as strings since ids depend on the order of PDFs
+        terms = self.vocab.terms()
+        return {
+            "domain": self.domain,
+            "pdf_freq": self.pdf_freq,
+            "candidate_freq": _list_to_json(terms, self.candidate_freq),
+            "container_candidate_freq": _list_to_json(
+                terms, self.container_candidate_freq
+            ),
+            "term_freq": _list_to_json(terms, self.term_freq),
+            "doc_term_freq": _list_to_json(terms, self.doc_term_freq),
+            "term_maxsize": _list_to_json(terms, self.term_maxsize),
+            "lingu_freq": _list_to_json(
+                terms,
+                [
+                    [[list(map(list, lingu_seq)), freq] for lingu_seq, freq in lingu]
+                    for lingu in map(dict.items, self.lingu_freq)
+                ],
+            ),
+            "lingu_docs": _list_to_json(
+                terms,
+                [
+                    [
+                        [list(map(list, lingu_seq)), list(pdf_paths)]
+                        for lingu_seq, pdf_paths in lingu
+                    ]
+                    for lingu in map(dict.items, self.lingu_docs)
+                ],
+            ),
+            "container_terms": _list_to_json(
+                terms,
+                [
+                    {terms[container]: freq for container, freq in containers.items()}
+                    for containers in self.container_terms
+                ],
+            ),
+            "morpheme_freq": self.morpheme_freq,
+            "left_freq": self.left_freq,
+            "right_freq": self.right_freq,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        domain_stats = cls(
+            obj["domain"],
+            pdf_freq=obj["pdf_freq"],
+            morpheme_freq=obj["morpheme_freq"],
+            left_freq=obj["left_freq"],
+            right_freq=obj["right_freq"],
+        )
+        intern = domain_stats._intern
+
+        for term, freq in obj["candidate_freq"].items():
+            domain_stats.candidate_freq[intern(term)] = freq
+        for term, freq in obj["container_candidate_freq"].items():
+            domain_stats.container_candidate_freq[intern(term)] = freq
+        for term, freq in obj["term_freq"].items():
+            domain_stats.term_freq[intern(term)] = freq
+        for term, freq in obj["doc_term_freq"].items():
+            domain_stats.doc_term_freq[intern(term)] = freq
+        for term, pdf_maxsize in obj["term_maxsize"].items():
+            domain_stats.term_maxsize[intern(term)] = pdf_maxsize
+        for term, lingu in obj["lingu_freq"].items():
+            domain_stats.lingu_freq[intern(term)] = {
+                tuple(map(tuple, lingu_seq)): freq for lingu_seq, freq in lingu
+            }
+        for term, lingu in obj["lingu_docs"].items():
+            domain_stats.lingu_docs[intern(term)] = {
+                tuple(map(tuple, lingu_seq)): set(pdf_paths)
+                for lingu_seq, pdf_paths in lingu
+            }
+        for term, containers in obj["container_terms"].items():
+            term_id = intern(term)
+            domain_stats.container_terms[term_id] = {
+                intern(container): freq for container, freq in containers.items()
+            }
+
+        return domain_stats
+
+    # private
+    def _candidate_ids(self) -> List[int]:
+        return [term_id for term_id, freq in enumerate(self.candidate_freq) if freq > 0]
+
+    def _intern(self, term_str: str) -> int:
+        term_id = self.vocab.intern(term_str)
+        self._grow()
+        return term_id
+
+    def _grow(self):
+        # lists are extended to the size of the vocabulary,
+        # which may be grown by the analyzer sharing it
+        num_new_terms = len(self.vocab) - len(self.candidate_freq)
+        if num_new_terms <= 0:
+            return
+
+        self.candidate_freq.extend([0] * num_new_terms)
+        self.container_candidate_freq.extend([0] * num_new_terms)
+        self.term_freq.extend([0] * num_new_terms)
+        self.doc_term_freq.extend([0] * num_new_terms)
+        for _ in range(num_new_terms):
+            self.term_maxsize.append(dict())
+            self.lingu_freq.append(dict())
+            self.lingu_docs.append(dict())
+            self.container_terms.append(dict())
+
+    def _update(self, pdf_stats: PDFTermStatistics, sign: int):
+        pdf_path = pdf_stats.pdf_path
+        _add_count(self.pdf_freq, pdf_path, sign)
+        # contributions of a PDF added more than once are kept
+        # until the PDF is subtracted as many times as it is added
+        pdf_remains = pdf_path in self.pdf_freq
+
+        # ids of the PDF statistics are translated into ids of the domain
+        # unless they are counted with the vocabulary of the domain
+        term_ids: Sequence[int] = (
+            range(len(self.vocab))
+            if pdf_stats.vocab is self.vocab
+            else list(map(self.vocab.intern, pdf_stats.vocab.terms()))
+        )
+        self._grow()
+
+        for candidate in pdf_stats.candidates:
+            self.candidate_freq[term_ids[candidate]] += sign
+        for candidate in pdf_stats.container_candidates:
+            self.container_candidate_freq[term_ids[candidate]] += sign
+
+        for term, freq in pdf_stats.term_freq.items():
+            self.term_freq[term_ids[term]] += sign * freq
+            self.doc_term_freq[term_ids[term]] += sign
+
+        for term, maxsize in pdf_stats.term_maxsize.items():
+            pdf_maxsize = self.term_maxsize[term_ids[term]]
+            if sign > 0:
+                pdf_maxsize[pdf_path] = maxsize
+            elif not pdf_remains:
+                pdf_maxsize.pop(pdf_path, None)
+
+        for term, lingu in pdf_stats.lingu_freq.items():
+            term_lingu_freq = self.lingu_freq[term_ids[term]]
+            term_lingu_docs = self.lingu_docs[term_ids[term]]
+            for lingu_seq, freq in lingu.items():
+                _add_count(term_lingu_freq, lingu_seq, sign * freq)
+
+                pdf_paths = term_lingu_docs.get(lingu_seq, set())
+                if sign > 0:
+                    pdf_paths.add(pdf_path)
+                elif not pdf_remains:
+                    pdf_paths.discard(pdf_path)
+                _set_or_remove(term_lingu_docs, lingu_seq, pdf_paths)
+
+        for term, containers in pdf_stats.container_terms.items():
+            term_containers = self.container_terms[term_ids[term]]
+            for container in containers:
+                _add_count(term_containers, term_ids[container], sign)
+
+        morphemes = dict.fromkeys(
+            list(pdf_stats.left_freq) + list(pdf_stats.right_freq)
+        )
+        for morpheme in morphemes:
+            # the morpheme is kept with empty frequencies while some PDFs contain it
+            self.left_freq[morpheme] = self.left_freq.get(morpheme, dict())
+            self.right_freq[morpheme] = self.right_freq.get(morpheme, dict())
+
+        for morpheme, left in pdf_stats.left_freq.items():
+            for left_morpheme, freq in left.items():
+                _add_count(self.left_freq[morpheme], left_morpheme, sign * freq)
+        for morpheme, right in pdf_stats.right_freq.items():
+            for right_morpheme, freq in right.items():
+                _add_count(self.right_freq[morpheme], right_morpheme, sign * freq)
+
+        for morpheme in morphemes:
+            _add_count(self.morpheme_freq, morpheme, sign)
+            if morpheme not in self.morpheme_freq:
+                self.left_freq.pop(morpheme, None)
+                self.right_freq.pop(morpheme, None)
+
+
+def _list_to_json(terms: List[str], values: List[Any]) -> Dict[str, Any]:
+    # terms with zero or empty values are not counted in the domain
+    return {terms[term_id]: value for term_id, value in enumerate(values) if value}
+
+
+def _add_count(counter: Dict[CountKey, int], key: CountKey, delta: int):
+    count = counter.get(key, 0) + delta
+    if count != 0:
+        counter[key] = count
+    else:
+        counter.pop(key, None)
+
+
+def _set_or_remove(container: Dict[CountKey, Any], key: CountKey, value: Any):
+    if value:
+        container[key] = value
+    else:
+        container.pop(key, None)
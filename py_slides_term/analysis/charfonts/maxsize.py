@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Dict
 
-from ..share import AnalysisRunner
+from ..share import AnalysisRunner, CandidateTermTrie
 from py_slides_term.candidates import DomainCandidateTermList
 from py_slides_term.share.data import Term
 
@@ -21,25 +21,27 @@ class TermMaxsizeAnalyzer:
         self._runner = AnalysisRunner(ignore_augmented=ignore_augmented)
 
     def analyze(self, domain_candidates: DomainCandidateTermList) -> DomainTermMaxsize:
-        domain_candidates_set = domain_candidates.to_domain_candidate_term_set()
+        candidate_trie = CandidateTermTrie(
+            domain_candidates.to_domain_candidate_term_set().candidates
+        )
 
         def update(
             term_maxsize: DomainTermMaxsize,
             pdf_id: int,
             page_num: int,
-            subcandidate: Term,
+            candidate: Term,
+            start: int,
+            end: int,
+            subcandidate_str: str,
         ):
-            subcandidate_str = str(subcandidate)
-            if subcandidate_str not in domain_candidates_set.candidates:
-                return
-
             term_maxsize.term_maxsize[subcandidate_str] = max(
                 term_maxsize.term_maxsize.get(subcandidate_str, 0),
-                subcandidate.fontsize,
+                candidate.fontsize,
             )
 
-        term_maxsize = self._runner.run_through_subcandidates(
+        term_maxsize = self._runner.run_through_indexed_subcandidates(
             domain_candidates,
+            candidate_trie,
             DomainTermMaxsize(domain_candidates.domain, dict()),
             update,
         )
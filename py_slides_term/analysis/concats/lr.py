@@ -42,17 +42,7 @@ class TermLeftRightFrequencyAnalyzer:
             page_num: int,
             candidate: Term,
         ):
-            num_morphemes = len(candidate.morphemes)
-            for i in range(num_morphemes):
-                morpheme = candidate.morphemes[i]
-                morpheme_str = str(morpheme)
-                if self._is_meaningless_morpheme(morpheme):
-                    lrfreq.left_freq[morpheme_str] = dict()
-                    lrfreq.right_freq[morpheme_str] = dict()
-                    continue
-
-                self._update_left_freq(lrfreq, candidate, i)
-                self._update_right_freq(lrfreq, candidate, i)
+            self.update_by_candidate(lrfreq, candidate)
 
         lrfreq = self._runner.run_through_candidates(
             domain_candidates,
@@ -62,6 +52,22 @@ class TermLeftRightFrequencyAnalyzer:
 
         return lrfreq
 
+    def update_by_candidate(self, lrfreq: DomainLeftRightFrequency, candidate: Term):
+        num_morphemes = len(candidate.morphemes)
+        for i in range(num_morphemes):
+            morpheme = candidate.morphemes[i]
+            morpheme_str = str(morpheme)
+            if self._is_meaningless_morpheme(morpheme):
+                left = lrfreq.left_freq.get(morpheme_str, dict())
+                lrfreq.left_freq[morpheme_str] = left
+                right = lrfreq.right_freq.get(morpheme_str, dict())
+                lrfreq.right_freq[morpheme_str] = right
+                continue
+
+            self._update_left_freq(lrfreq, candidate, i)
+            self._update_right_freq(lrfreq, candidate, i)
+
+    # private
     def _update_left_freq(
         self, lrfreq: DomainLeftRightFrequency, candidate: Term, idx: int
     ):
@@ -109,7 +115,7 @@ class TermLeftRightFrequencyAnalyzer:
             lrfreq.right_freq[morpheme_str] = right
 
             left = lrfreq.left_freq.get(right_morpheme_str, dict())
-            left[morpheme_str] = right.get(morpheme_str, 0) + 1
+            left[morpheme_str] = left.get(morpheme_str, 0) + 1
             lrfreq.left_freq[right_morpheme_str] = left
         else:
             right = lrfreq.right_freq.get(morpheme_str, dict())
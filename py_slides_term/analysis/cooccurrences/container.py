@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Set, Dict
 
-from ..share import AnalysisRunner
+from ..share import AnalysisRunner, CandidateTermTrie
 from py_slides_term.candidates import DomainCandidateTermList
 from py_slides_term.share.data import Term
 
@@ -24,7 +24,9 @@ class ContainerTermsAnalyzer:
     def analyze(
         self, domain_candidates: DomainCandidateTermList
     ) -> DomainContainerTerms:
-        domain_candidates_set = domain_candidates.to_domain_candidate_term_set()
+        candidate_trie = CandidateTermTrie(
+            domain_candidates.to_domain_candidate_term_set().candidates
+        )
 
         def update(
             container_terms: DomainContainerTerms,
@@ -33,30 +35,20 @@ class ContainerTermsAnalyzer:
             candidate: Term,
         ):
             candidate_str = str(candidate)
-            container_terms.container_terms[
-                candidate_str
-            ] = container_terms.container_terms.get(candidate_str, set())
+            container_terms.container_terms[candidate_str] = (
+                container_terms.container_terms.get(candidate_str, set())
+            )
 
             num_morphemes = len(candidate.morphemes)
-            for i in range(num_morphemes):
-                jstart, jstop = i + 1, (num_morphemes + 1 if i > 0 else num_morphemes)
-                for j in range(jstart, jstop):
-                    subcandidate = Term(
-                        candidate.morphemes[i:j],
-                        candidate.fontsize,
-                        candidate.augmented,
-                    )
-                    subcandidate_str = str(subcandidate)
-                    if subcandidate_str not in domain_candidates_set.candidates:
-                        continue
-
-                    container_term_set = container_terms.container_terms.get(
-                        subcandidate_str, set()
-                    )
-                    container_term_set.add(candidate_str)
-                    container_terms.container_terms[
-                        subcandidate_str
-                    ] = container_term_set
+            for i, j, subcandidate_str in candidate_trie.find_subcandidates(candidate):
+                if i == 0 and j == num_morphemes:
+                    continue
+
+                container_term_set = container_terms.container_terms.get(
+                    subcandidate_str, set()
+                )
+                container_term_set.add(candidate_str)
+                container_terms.container_terms[subcandidate_str] = container_term_set
 
         container_terms = self._runner.run_through_candidates(
             domain_candidates,
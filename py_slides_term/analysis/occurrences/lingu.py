@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Set, Dict
 
-from ..share import AnalysisRunner
+from ..share import AnalysisRunner, CandidateTermTrie
 from py_slides_term.candidates import DomainCandidateTermList
 from py_slides_term.share.data import Term, LinguSeq
 
@@ -38,27 +38,33 @@ class LinguOccurrenceAnalyzer:
     def analyze(
         self, domain_candidates: DomainCandidateTermList
     ) -> DomainLinguOccurrence:
-        domain_candidates_set = domain_candidates.to_domain_candidate_term_set()
+        candidate_trie = CandidateTermTrie(
+            domain_candidates.to_domain_candidate_term_set().candidates
+        )
 
         def update(
             lingu_occ: _DomainLinguOccurrence,
             pdf_id: int,
             page_num: int,
-            subcandidate: Term,
+            candidate: Term,
+            start: int,
+            end: int,
+            subcandidate_str: str,
         ):
-            if str(subcandidate) not in domain_candidates_set.candidates:
-                return
-            sub_lingu_seq = subcandidate.linguistic_sequence()
+            sub_lingu_seq = tuple(
+                (morpheme.pos, morpheme.category, morpheme.subcategory)
+                for morpheme in candidate.morphemes[start:end]
+            )
             lingu_occ.lingu_freq[sub_lingu_seq] = (
                 lingu_occ.lingu_freq.get(sub_lingu_seq, 0) + 1
             )
-            sub_lingu_seq = subcandidate.linguistic_sequence()
             doc_lingu_set = lingu_occ.doc_lingu_set.get(sub_lingu_seq, set())
             doc_lingu_set.add(pdf_id)
             lingu_occ.doc_lingu_set[sub_lingu_seq] = doc_lingu_set
 
-        lingu_occ = self._runner.run_through_subcandidates(
+        lingu_occ = self._runner.run_through_indexed_subcandidates(
             domain_candidates,
+            candidate_trie,
             _DomainLinguOccurrence(domain_candidates.domain, dict(), dict()),
             update,
         )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Set, Dict
 
-from ..share import AnalysisRunner
+from ..share import AnalysisRunner, CandidateTermTrie
 from py_slides_term.candidates import DomainCandidateTermList
 from py_slides_term.share.data import Term
 
@@ -38,17 +38,19 @@ class TermOccurrenceAnalyzer:
     def analyze(
         self, domain_candidates: DomainCandidateTermList
     ) -> DomainTermOccurrence:
-        domain_candidates_set = domain_candidates.to_domain_candidate_term_set()
+        candidate_trie = CandidateTermTrie(
+            domain_candidates.to_domain_candidate_term_set().candidates
+        )
 
         def update(
             term_occ: _DomainTermOccurrence,
             pdf_id: int,
             page_num: int,
-            subcandidate: Term,
+            candidate: Term,
+            start: int,
+            end: int,
+            subcandidate_str: str,
         ):
-            subcandidate_str = str(subcandidate)
-            if subcandidate_str not in domain_candidates_set.candidates:
-                return
             term_occ.term_freq[subcandidate_str] = (
                 term_occ.term_freq.get(subcandidate_str, 0) + 1
             )
@@ -56,8 +58,9 @@ class TermOccurrenceAnalyzer:
             doc_term_set.add(pdf_id)
             term_occ.doc_term_set[subcandidate_str] = doc_term_set
 
-        term_occ = self._runner.run_through_subcandidates(
+        term_occ = self._runner.run_through_indexed_subcandidates(
             domain_candidates,
+            candidate_trie,
             _DomainTermOccurrence(domain_candidates.domain, dict(), dict()),
             update,
         )
@@ -1,6 +1,10 @@
 from .runner import AnalysisRunner, AnalysisResult
+from .trie import CandidateTermTrie
+from .vocab import TermVocabulary
 
 __all__ = [
     "AnalysisRunner",
     "AnalysisResult",
+    "CandidateTermTrie",
+    "TermVocabulary",
 ]
@@ -1,5 +1,6 @@
 from typing import Callable, TypeVar
 
+from .trie import CandidateTermTrie
 from py_slides_term.candidates import DomainCandidateTermList
 from py_slides_term.share.data import Term
 
@@ -55,3 +56,31 @@ class AnalysisRunner:
                             update_result(result, pdf_id, page_num, subcandidate)
 
         return result
+
+    def run_through_indexed_subcandidates(
+        self,
+        domain_candidates: DomainCandidateTermList,
+        candidate_trie: CandidateTermTrie,
+        initial_result: AnalysisResult,
+        update_result: Callable[[AnalysisResult, int, int, Term, int, int, str], None],
+    ) -> AnalysisResult:
+        # only subcandidates found in candidate_trie are passed to update_result
+        # as (candidate, start, end, subcandidate_str),
+        # where the subcandidate is candidate.morphemes[start:end]
+        result = initial_result
+
+        for pdf_id, pdf_candidates in enumerate(domain_candidates.pdfs):
+            for page_candidates in pdf_candidates.pages:
+                page_num = page_candidates.page_num
+                for candidate in page_candidates.candidates:
+                    if self._ignore_augmented and candidate.augmented:
+                        continue
+
+                    for i, j, subcandidate_str in candidate_trie.find_subcandidates(
+                        candidate
+                    ):
+                        update_result(
+                            result, pdf_id, page_num, candidate, i, j, subcandidate_str
+                        )
+
+        return result
@@ -0,0 +1,64 @@
+from typing import Iterable, Iterator, Tuple, Dict, Any, Optional
+
+from py_slides_term.share.data import Term
+from py_slides_term.share.utils import term_separator
+
+# key of the trie node that holds the candidate string ending at the node
+# this never conflicts with the keys of children, which are single characters
+_TERM_KEY = ""
+
+
+class CandidateTermTrie:
+    # public
+    def __init__(self, candidates: Iterable[str]):
+        self._root: Dict[str, Any] = dict()
+        for candidate_str in candidates:
+            self.add(candidate_str)
+
+    def add(self, candidate_str: str):
+        node = self._root
+        for char in candidate_str:
+            child = node.get(char)
+            if child is None:
+                child = dict()
+                node[char] = child
+            node = child
+        node[_TERM_KEY] = candidate_str
+
+    def __contains__(self, term_str: object) -> bool:
+        if not isinstance(term_str, str):
+            return False
+        node = self._walk(self._root, term_str)
+        return node is not None and _TERM_KEY in node
+
+    def find_subcandidates(self, candidate: Term) -> Iterator[Tuple[int, int, str]]:
+        # yield (i, j, subcandidate_str) for each morphemes[i:j] which is a candidate
+        # walking from morphemes[i] stops as soon as no candidate has the prefix,
+        # so no term is created for slices which are not candidates
+        morpheme_strs = list(map(str, candidate.morphemes))
+        num_morphemes = len(morpheme_strs)
+        segments = [""] + [
+            term_separator(morpheme_strs[k - 1], morpheme_strs[k]) + morpheme_strs[k]
+            for k in range(1, num_morphemes)
+        ]
+
+        for i in range(num_morphemes):
+            node = self._walk(self._root, morpheme_strs[i])
+            j = i + 1
+            while node is not None:
+                subcandidate_str = node.get(_TERM_KEY)
+                if subcandidate_str is not None:
+                    yield i, j, subcandidate_str
+                if j == num_morphemes:
+                    break
+                node = self._walk(node, segments[j])
+                j += 1
+
+    # private
+    def _walk(self, node: Dict[str, Any], segment: str) -> Optional[Dict[str, Any]]:
+        for char in segment:
+            child = node.get(char)
+            if child is None:
+                return None
+            node = child
+        return node
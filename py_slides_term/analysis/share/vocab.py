@@ -0,0 +1,43 @@
+from typing import List, Dict, Iterable, Optional
+
+
+class TermVocabulary:
+    # public
+    def __init__(self, term_strs: Iterable[str] = ()):
+        self._term_ids: Dict[str, int] = dict()
+        self._terms: List[str] = []
+        for term_str in term_strs:
+            self.intern(term_str)
+
+    def intern(self, term_str: str) -> int:
+        term_id = self._term_ids.get(term_str)
+        if term_id is None:
+            # ids are assigned in order of first occurrence
+            # and never change, so arrays indexed by ids only grow
+            term_id = len(self._terms)
+            self._term_ids[term_str] = term_id
+            self._terms.append(term_str)
+        return term_id
+
+    def get_id(self, term_str: str) -> Optional[int]:
+        return self._term_ids.get(term_str)
+
+    def get_term(self, term_id: int) -> str:
+        return self._terms[term_id]
+
+    def terms(self) -> List[str]:
+        return list(self._terms)
+
+    def __getitem__(self, term_str: str) -> int:
+        return self._term_ids[term_str]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term_str: object) -> bool:
+        return term_str in self._term_ids
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TermVocabulary):
+            return NotImplemented
+        return self._terms == other._terms
@@ -1,8 +1,9 @@
-from dataclasses import dataclass, asdict
-from typing import List, Set, Dict, Any, Type
+from dataclasses import dataclass, asdict, fields
+from typing import List, Set, Dict, Any, Type, Optional
 
-from py_slides_term.morphemes import BaseMorpheme, SpaCyMorpheme
+from py_slides_term.morphemes import BaseMorpheme, SpaCyMorpheme, MorphemeTable
 from py_slides_term.share.data import Term
+from py_slides_term.share.slots import add_slots
 
 
 @dataclass(frozen=True)
@@ -48,11 +49,15 @@ class DomainCandidateTermDict:
         )
 
 
+@add_slots
 @dataclass(frozen=True)
 class PageCandidateTermList:
     page_num: int
     candidates: List[Term]
 
+    def __hash__(self) -> int:
+        return hash((self.page_num, tuple(self.candidates)))
+
     def to_json(self) -> Dict[str, Any]:
         return {
             "page_num": self.page_num,
@@ -64,19 +69,29 @@ class PageCandidateTermList:
         cls,
         obj: Dict[str, Any],
         morpheme_cls: Type[BaseMorpheme] = SpaCyMorpheme,
+        morpheme_table: Optional[MorphemeTable] = None,
     ):
         page_num, candidates = obj["page_num"], obj["candidates"]
         return cls(
             page_num,
-            list(map(lambda item: Term.from_json(item, morpheme_cls), candidates)),
+            list(
+                map(
+                    lambda item: Term.from_json(item, morpheme_cls, morpheme_table),
+                    candidates,
+                )
+            ),
         )
 
 
+@add_slots
 @dataclass(frozen=True)
 class PDFCandidateTermList:
     pdf_path: str
     pages: List[PageCandidateTermList]
 
+    def __hash__(self) -> int:
+        return hash((self.pdf_path, tuple(self.pages)))
+
     def to_json(self) -> Dict[str, Any]:
         return {
             "pdf_path": self.pdf_path,
@@ -88,18 +103,89 @@ class PDFCandidateTermList:
         cls,
         obj: Dict[str, Any],
         morpheme_cls: Type[BaseMorpheme] = SpaCyMorpheme,
+        morpheme_table: Optional[MorphemeTable] = None,
     ):
+        # equal morphemes are shared by all candidates of the PDF
+        # or by all candidates of PDFs loaded with the same morpheme_table
+        if morpheme_table is None:
+            morpheme_table = MorphemeTable()
+
         pdf_path, pages = obj["pdf_path"], obj["pages"]
         return cls(
             pdf_path,
             list(
                 map(
-                    lambda item: PageCandidateTermList.from_json(item, morpheme_cls),
+                    lambda item: PageCandidateTermList.from_json(
+                        item, morpheme_cls, morpheme_table
+                    ),
                     pages,
                 )
             ),
         )
 
+    def to_compact_json(self) -> Dict[str, Any]:
+        # each distinct morpheme is stored once in a table of attribute values
+        # and candidates refer to morphemes by their indices in the table
+        morpheme_table = MorphemeTable()
+        pages = [
+            {
+                "page_num": page.page_num,
+                "candidates": [
+                    [
+                        list(map(morpheme_table.intern, candidate.morphemes)),
+                        candidate.fontsize,
+                        candidate.augmented,
+                    ]
+                    for candidate in page.candidates
+                ],
+            }
+            for page in self.pages
+        ]
+
+        morpheme_objs = list(
+            map(lambda morpheme: morpheme.to_json(), morpheme_table.morphemes())
+        )
+        return {
+            "pdf_path": self.pdf_path,
+            "morpheme_keys": list(morpheme_objs[0].keys()) if morpheme_objs else [],
+            "morphemes": list(map(lambda item: list(item.values()), morpheme_objs)),
+            "pages": pages,
+        }
+
+    @classmethod
+    def from_compact_json(
+        cls,
+        obj: Dict[str, Any],
+        morpheme_cls: Type[BaseMorpheme] = SpaCyMorpheme,
+        morpheme_table: Optional[MorphemeTable] = None,
+    ):
+        morpheme_keys = obj["morpheme_keys"] or [
+            morpheme_field.name for morpheme_field in fields(morpheme_cls)
+        ]
+        # candidates share the morpheme objects created from the table
+        morphemes = list(
+            map(
+                lambda values: morpheme_cls.from_json(dict(zip(morpheme_keys, values))),
+                obj["morphemes"],
+            )
+        )
+        if morpheme_table is not None:
+            morphemes = morpheme_table.canonicalize(morphemes)
+
+        return cls(
+            obj["pdf_path"],
+            [
+                PageCandidateTermList(
+                    page["page_num"],
+                    [
+                        Term([morphemes[i] for i in ids], fontsize, augmented)
+                        for ids, fontsize, augmented in page["candidates"]
+                    ],
+                )
+                for page in obj["pages"]
+            ],
+        )
+
 
 @dataclass(frozen=True)
 class DomainCandidateTermList:
@@ -146,12 +232,16 @@ class DomainCandidateTermList:
         obj: Dict[str, Any],
         morpheme_cls: Type[BaseMorpheme] = SpaCyMorpheme,
     ):
+        # equal morphemes are shared by all candidates of the domain
+        morpheme_table = MorphemeTable()
         domain, pdfs = obj["domain"], obj["pdfs"]
         return cls(
             domain,
             list(
                 map(
-                    lambda item: PDFCandidateTermList.from_json(item, morpheme_cls),
+                    lambda item: PDFCandidateTermList.from_json(
+                        item, morpheme_cls, morpheme_table
+                    ),
                     pdfs,
                 )
             ),
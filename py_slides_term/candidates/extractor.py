@@ -1,5 +1,5 @@
 from xml.etree.ElementTree import parse, Element
-from typing import List, Optional, Type, cast
+from typing import List, Iterable, Iterator, Optional, Type, cast
 
 from .filters import (
     FilterCombiner,
@@ -10,7 +10,13 @@ from .splitters import SplitterCombiner, BaseSplitter
 from .augmenters import AugmenterCombiner, BaseAugmenter
 from .data import DomainCandidateTermList, PDFCandidateTermList, PageCandidateTermList
 from py_slides_term.pdftoxml import PDFnXMLPath, PDFnXMLElement
-from py_slides_term.morphemes import SpaCyTokenizer, BaseMorpheme
+from py_slides_term.morphemes import (
+    SpaCyTokenizer,
+    TokenizationCache,
+    TokenizationCacheInfo,
+    BaseMorpheme,
+    MorphemeTable,
+)
 from py_slides_term.share.data import Term
 
 
@@ -22,8 +28,23 @@ class CandidateTermExtractor:
         term_filter_clses: Optional[List[Type[BaseCandidateTermFilter]]] = None,
         splitter_clses: Optional[List[Type[BaseSplitter]]] = None,
         augmenter_clses: Optional[List[Type[BaseAugmenter]]] = None,
+        morpheme_attrs: Optional[List[str]] = None,
+        tokenizer_batch_size: Optional[int] = None,
+        tokenizer_n_process: int = 1,
+        tokenizer_cache_size: Optional[int] = 0,
+        tokenizer_cache_dir: Optional[str] = None,
     ):
-        self._tokenizer = SpaCyTokenizer()
+        tokenizer_cache = (
+            TokenizationCache(tokenizer_cache_size, tokenizer_cache_dir)
+            if tokenizer_cache_size != 0 or tokenizer_cache_dir is not None
+            else None
+        )
+        self._tokenizer = SpaCyTokenizer(
+            morpheme_attrs=morpheme_attrs,
+            batch_size=tokenizer_batch_size,
+            n_process=tokenizer_n_process,
+            cache=tokenizer_cache,
+        )
 
         morpheme_filters = (
             list(map(lambda cls: cls(), morpheme_filter_clses))
@@ -54,7 +75,14 @@ class CandidateTermExtractor:
     def extract_from_domain_files(
         self, domain: str, pdfnxmls: List[PDFnXMLPath]
     ) -> DomainCandidateTermList:
-        xmls = list(map(self.extract_from_xml_file, pdfnxmls))
+        # equal morphemes are shared by all candidates of the domain
+        morpheme_table = MorphemeTable()
+        xmls = [
+            self._extract_from_xmlroot(
+                pdfnxml.pdf_path, parse(pdfnxml.xml_path).getroot(), morpheme_table
+            )
+            for pdfnxml in pdfnxmls
+        ]
         return DomainCandidateTermList(domain, xmls)
 
     def extract_from_xml_file(self, pdfnxml: PDFnXMLPath) -> PDFCandidateTermList:
@@ -65,16 +93,82 @@ class CandidateTermExtractor:
     def extract_from_domain_elements(
         self, domain: str, pdfnxmls: List[PDFnXMLElement]
     ) -> DomainCandidateTermList:
-        xmls = list(map(self.extract_from_xml_element, pdfnxmls))
+        # equal morphemes are shared by all candidates of the domain
+        morpheme_table = MorphemeTable()
+        xmls = [
+            self._extract_from_xmlroot(
+                pdfnxml.pdf_path, pdfnxml.xml_root, morpheme_table
+            )
+            for pdfnxml in pdfnxmls
+        ]
         return DomainCandidateTermList(domain, xmls)
 
     def extract_from_xml_element(self, pdfnxml: PDFnXMLElement) -> PDFCandidateTermList:
         xml_candidates = self._extract_from_xmlroot(pdfnxml.pdf_path, pdfnxml.xml_root)
         return xml_candidates
 
+    def extract_from_page_elements(
+        self, pages: Iterable[Element]
+    ) -> Iterator[PageCandidateTermList]:
+        morpheme_table = MorphemeTable()
+        for page in pages:
+            yield from self._extract_from_pages([page], morpheme_table)
+
     def extract_from_text(self, text: str, fontsize: float = 0.0) -> List[Term]:
         morphemes = self._tokenizer.tokenize(text)
+        return self._extract_from_morphemes(morphemes, fontsize)
+
+    def tokenizer_cache_info(self) -> Optional[TokenizationCacheInfo]:
+        return self._tokenizer.cache_info()
+
+    # private
+    def _extract_from_xmlroot(
+        self,
+        pdf_path: str,
+        xml_root: Element,
+        morpheme_table: Optional[MorphemeTable] = None,
+    ) -> PDFCandidateTermList:
+        page_candidates = self._extract_from_pages(
+            list(xml_root.iter("page")), morpheme_table
+        )
+        return PDFCandidateTermList(pdf_path, page_candidates)
+
+    def _extract_from_pages(
+        self, pages: List[Element], morpheme_table: Optional[MorphemeTable] = None
+    ) -> List[PageCandidateTermList]:
+        # equal morphemes are shared by all candidates of the pages
+        # instead of being duplicated for each text
+        if morpheme_table is None:
+            morpheme_table = MorphemeTable()
+
+        # tokenize texts of all pages at once to make use of batch processing
+        text_nodes_list = list(map(lambda page: list(page.iter("text")), pages))
+        texts = [
+            cast(str, text_node.text)
+            for text_nodes in text_nodes_list
+            for text_node in text_nodes
+        ]
+        morphemes_iter = iter(self._tokenizer.tokenize_many(texts))
+
+        page_candidates: List[PageCandidateTermList] = []
+        for page, text_nodes in zip(pages, text_nodes_list):
+            page_num = int(cast(str, page.get("id")))
 
+            candicate_terms: List[Term] = []
+            for text_node in text_nodes:
+                morphemes = morpheme_table.canonicalize(next(morphemes_iter))
+                fontsize = float(cast(str, text_node.get("size")))
+                candicate_terms.extend(
+                    self._extract_from_morphemes(morphemes, fontsize)
+                )
+
+            page_candidates.append(PageCandidateTermList(page_num, candicate_terms))
+
+        return page_candidates
+
+    def _extract_from_morphemes(
+        self, morphemes: List[BaseMorpheme], fontsize: float
+    ) -> List[Term]:
         candicate_terms: List[Term] = []
         candicate_morphemes: List[BaseMorpheme] = []
         for idx, morpheme in enumerate(morphemes):
@@ -91,27 +185,6 @@ class CandidateTermExtractor:
 
         return candicate_terms
 
-    # private
-    def _extract_from_xmlroot(
-        self, pdf_path: str, xml_root: Element
-    ) -> PDFCandidateTermList:
-        page_candidates: List[PageCandidateTermList] = []
-        for page in xml_root.iter("page"):
-            page_candidates.append(self._extract_from_page(page))
-
-        return PDFCandidateTermList(pdf_path, page_candidates)
-
-    def _extract_from_page(self, page: Element) -> PageCandidateTermList:
-        page_num = int(cast(str, page.get("id")))
-
-        candicate_terms: List[Term] = []
-        for text_node in page.iter("text"):
-            text = cast(str, text_node.text)
-            fontsize = float(cast(str, text_node.get("size")))
-            candicate_terms.extend(self.extract_from_text(text, fontsize))
-
-        return PageCandidateTermList(page_num, candicate_terms)
-
     def _terms_from_morphemes(
         self, morphemes: List[BaseMorpheme], fontsize: float
     ) -> List[Term]:
@@ -1,12 +1,34 @@
 from .xml import XMLLayerCache
 from .candidate import CandidateLayerCache
-from .method import MethodLayerRankingCache, MethodLayerDataCache
-from .consts import DEFAULT_CACHE_DIR
+from .method import (
+    MethodLayerRankingCache,
+    MethodLayerDataCache,
+    MethodLayerStatisticsCache,
+)
+from .memory import LayerMemoryCache
+from .store import (
+    BaseCacheStore,
+    FileCacheStore,
+    SQLiteCacheStore,
+    SQLITE_CACHE_EXTS,
+    create_cache_store,
+    create_tokenizer_cache_dir,
+)
+from .consts import DEFAULT_CACHE_DIR, TOKENIZER_CACHE_DIR_NAME
 
 __all__ = [
     "XMLLayerCache",
     "CandidateLayerCache",
     "MethodLayerRankingCache",
     "MethodLayerDataCache",
+    "MethodLayerStatisticsCache",
+    "LayerMemoryCache",
+    "BaseCacheStore",
+    "FileCacheStore",
+    "SQLiteCacheStore",
+    "SQLITE_CACHE_EXTS",
+    "create_cache_store",
+    "create_tokenizer_cache_dir",
     "DEFAULT_CACHE_DIR",
+    "TOKENIZER_CACHE_DIR_NAME",
 ]
@@ -1,41 +1,59 @@
-import os
-import json
-from typing import Union
+from typing import List, Union, ContextManager
 
 from py_slides_term.candidates import PDFCandidateTermList
-from .util import create_dir_name_from_config, create_file_name_from_path
+from .serializer import create_cache_serializer
+from .store import create_cache_store
+from .util import create_dir_name_from_config, create_file_name_from_key
 from ..configs import CandidateLayerConfig
 
 
 class CandidateLayerCache:
     # public
     def __init__(self, cache_dir: str):
-        self._cache_dir = cache_dir
+        # cache_dir may also be a SQLite database file (see store.py)
+        self._store = create_cache_store(cache_dir)
 
     def load(
         self, pdf_path: str, config: CandidateLayerConfig
     ) -> Union[PDFCandidateTermList, None]:
+        serializer = create_cache_serializer(config.cache_format, indent=2)
         dir_name = create_dir_name_from_config(config)
-        file_name = create_file_name_from_path(pdf_path, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_name = self.create_key(pdf_path, config)
 
-        if not os.path.isfile(cache_file_path):
+        content = self._store.load(dir_name, file_name)
+        obj = serializer.loads(content) if content is not None else None
+        if obj is None:
             return None
 
-        with open(cache_file_path, "r") as json_file:
-            try:
-                obj = json.load(json_file)
-            except json.JSONDecodeError:
-                return None
-
-        return PDFCandidateTermList.from_json(obj)
+        # caches stored before the compact layout have no table of morphemes
+        if "morpheme_keys" in obj:
+            candidates = PDFCandidateTermList.from_compact_json(obj)
+        else:
+            candidates = PDFCandidateTermList.from_json(obj)
+        # the cache may be stored by the PDF with the same content at another path
+        return PDFCandidateTermList(pdf_path, candidates.pages)
 
     def store(self, candidates: PDFCandidateTermList, config: CandidateLayerConfig):
+        serializer = create_cache_serializer(config.cache_format, indent=2)
+        dir_name = create_dir_name_from_config(config)
+        file_name = self.create_key(candidates.pdf_path, config)
+
+        content = serializer.dumps(candidates.to_compact_json())
+        self._store.store(dir_name, file_name, content)
+
+    def lock(
+        self, pdf_paths: List[str], config: CandidateLayerConfig
+    ) -> ContextManager[None]:
+        # caches of the PDFs are locked against other threads and processes
         dir_name = create_dir_name_from_config(config)
-        file_name = create_file_name_from_path(candidates.pdf_path, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_names = [self.create_key(pdf_path, config) for pdf_path in pdf_paths]
+        return self._store.lock(dir_name, file_names)
 
-        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+    def create_key(self, pdf_path: str, config: CandidateLayerConfig) -> str:
+        # PDFs with the same key share the cache
+        serializer = create_cache_serializer(config.cache_format)
+        return create_file_name_from_key(pdf_path, serializer.ext, config.cache_key)
 
-        with open(cache_file_path, "w") as json_file:
-            json.dump(candidates.to_json(), json_file, ensure_ascii=False, indent=2)
+    def batch(self) -> ContextManager[None]:
+        # writes of all caches sharing cache_dir in the context may be applied at once
+        return self._store.batch()
@@ -3,3 +3,7 @@ import os
 DEFAULT_CACHE_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..", "__py_slides_term_cache__")
 )
+# name of the directory under the cache directory where morphemes of texts are cached
+TOKENIZER_CACHE_DIR_NAME = "tokenizer"
+# name of the directory under the cache directory where lock files of entries are put
+LOCK_DIR_NAME = "locks"
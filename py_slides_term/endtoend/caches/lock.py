@@ -0,0 +1,79 @@
+import os
+from contextlib import contextmanager, ExitStack
+from threading import Lock, RLock
+from typing import List, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # locks are not shared between processes on platforms without fcntl
+    fcntl = None  # type: ignore
+
+
+class CacheKeyLock:
+    # public
+    def __init__(self, lock_dir: str):
+        self._lock_dir = lock_dir
+        self._lock = Lock()
+        # threads in the process are excluded by RLocks
+        # and processes are excluded by flock on a lock file per key
+        self._key_locks: Dict[str, RLock] = dict()
+        self._depths: Dict[str, int] = dict()
+        self._lock_fds: Dict[str, Optional[int]] = dict()
+
+    @contextmanager
+    def acquire(self, keys: List[str]) -> Iterator[None]:
+        # keys are always locked in the same order to avoid deadlocks
+        with ExitStack() as stack:
+            for key in sorted(set(keys)):
+                stack.enter_context(self._acquire_key(key))
+            yield
+
+    # private
+    @contextmanager
+    def _acquire_key(self, key: str) -> Iterator[None]:
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = RLock()
+                self._key_locks[key] = key_lock
+
+        with key_lock:
+            # the lock is reentrant in the thread which holds it
+            depth = self._depths.get(key, 0)
+            if depth == 0:
+                self._lock_fds[key] = self._lock_file(key)
+            self._depths[key] = depth + 1
+
+            try:
+                yield
+            finally:
+                self._depths[key] -= 1
+                if self._depths[key] == 0:
+                    self._unlock_file(self._lock_fds.pop(key))
+                    del self._depths[key]
+
+    def _lock_file(self, key: str) -> Optional[int]:
+        if fcntl is None:
+            return None
+
+        os.makedirs(self._lock_dir, exist_ok=True)
+        # lock files are left after unlocking
+        # because removing them would race with other processes waiting for them
+        lock_fd = os.open(
+            os.path.join(self._lock_dir, f"{key}.lock"), os.O_RDWR | os.O_CREAT, 0o644
+        )
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(lock_fd)
+            raise
+
+        return lock_fd
+
+    def _unlock_file(self, lock_fd: Optional[int]):
+        if fcntl is None or lock_fd is None:
+            return
+
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
@@ -0,0 +1,52 @@
+from threading import Lock
+from collections import OrderedDict
+from typing import Tuple, Hashable, Generic, TypeVar, Union
+
+from .util import create_dir_name_from_config
+from ..configs import BaseLayerConfig
+
+MemoryCacheValue = TypeVar("MemoryCacheValue")
+
+
+class LayerMemoryCache(Generic[MemoryCacheValue]):
+    # public
+    def __init__(self, max_size: int):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+
+        self._max_size = max_size
+        self._memory: "OrderedDict[Tuple[str, Hashable], MemoryCacheValue]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def load(
+        self, key: Hashable, config: BaseLayerConfig
+    ) -> Union[MemoryCacheValue, None]:
+        memory_key = self._create_memory_key(key, config)
+        with self._lock:
+            value = self._memory.get(memory_key)
+            if value is not None:
+                self._memory.move_to_end(memory_key)
+            return value
+
+    def store(self, key: Hashable, value: MemoryCacheValue, config: BaseLayerConfig):
+        if self._max_size == 0:
+            return
+
+        memory_key = self._create_memory_key(key, config)
+        with self._lock:
+            self._memory[memory_key] = value
+            self._memory.move_to_end(memory_key)
+            if len(self._memory) > self._max_size:
+                self._memory.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    # private
+    def _create_memory_key(
+        self, key: Hashable, config: BaseLayerConfig
+    ) -> Tuple[str, Hashable]:
+        return (create_dir_name_from_config(config), key)
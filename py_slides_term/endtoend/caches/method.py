@@ -1,11 +1,14 @@
-import os
-import json
-from glob import glob
-from shutil import rmtree
-from typing import List, Dict, Any, Union, Callable, Generic
-
-from .util import create_dir_name_from_config, create_file_name_from_paths
+from typing import List, Dict, Any, Union, Callable, Generic, ContextManager
+
+from .serializer import BaseCacheSerializer, create_cache_serializer
+from .store import create_cache_store
+from .util import (
+    create_dir_name_from_config,
+    create_file_name_from_path,
+    create_file_name_from_paths,
+)
 from ..configs import MethodLayerConfig
+from py_slides_term.analysis import PDFTermStatistics, DomainTermStatistics
 from py_slides_term.methods import DomainTermRanking
 from py_slides_term.methods.rankingdata import RankingData
 
@@ -13,26 +16,22 @@ from py_slides_term.methods.rankingdata import RankingData
 class MethodLayerRankingCache:
     # public
     def __init__(self, cache_dir: str):
-        self._cache_dir = cache_dir
+        # cache_dir may also be a SQLite database file (see store.py)
+        self._store = create_cache_store(cache_dir)
 
     def load(
         self,
         pdf_paths: List[str],
         config: MethodLayerConfig,
     ) -> Union[DomainTermRanking, None]:
+        serializer = create_cache_serializer(config.cache_format, indent=2)
         dir_name = create_dir_name_from_config(config, prefix="rank")
-        file_name = create_file_name_from_paths(pdf_paths, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_name = create_file_name_from_paths(pdf_paths, serializer.ext)
 
-        if not os.path.isfile(cache_file_path):
+        obj = _load_obj(self._store.load(dir_name, file_name), serializer)
+        if obj is None:
             return None
 
-        with open(cache_file_path, "r") as json_file:
-            try:
-                obj = json.load(json_file)
-            except json.JSONDecodeError:
-                return None
-
         return DomainTermRanking.from_json(obj)
 
     def store(
@@ -41,20 +40,35 @@ class MethodLayerRankingCache:
         term_ranking: DomainTermRanking,
         config: MethodLayerConfig,
     ):
+        serializer = create_cache_serializer(config.cache_format, indent=2)
         dir_name = create_dir_name_from_config(config, prefix="rank")
-        file_name = create_file_name_from_paths(pdf_paths, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_name = create_file_name_from_paths(pdf_paths, serializer.ext)
 
-        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        content = serializer.dumps(term_ranking.to_json())
+        self._store.store(dir_name, file_name, content)
+
+    def lock(
+        self, pdf_paths_list: List[List[str]], config: MethodLayerConfig
+    ) -> ContextManager[None]:
+        # rankings of the PDF lists are locked against other threads and processes
+        serializer = create_cache_serializer(config.cache_format)
+        dir_name = create_dir_name_from_config(config, prefix="rank")
+        file_names = [
+            create_file_name_from_paths(pdf_paths, serializer.ext)
+            for pdf_paths in pdf_paths_list
+        ]
+        return self._store.lock(dir_name, file_names)
 
-        with open(cache_file_path, "w") as json_file:
-            json.dump(term_ranking.to_json(), json_file, ensure_ascii=False, indent=2)
+    def batch(self) -> ContextManager[None]:
+        # writes of all caches sharing cache_dir in the context may be applied at once
+        return self._store.batch()
 
 
 class MethodLayerDataCache(Generic[RankingData]):
     # public
     def __init__(self, cache_dir: str):
-        self._cache_dir = cache_dir
+        # cache_dir may also be a SQLite database file (see store.py)
+        self._store = create_cache_store(cache_dir)
 
     def load(
         self,
@@ -62,44 +76,108 @@ class MethodLayerDataCache(Generic[RankingData]):
         config: MethodLayerConfig,
         from_json: Callable[[Dict[str, Any]], RankingData],
     ) -> Union[RankingData, None]:
+        serializer = create_cache_serializer(config.cache_format, indent=2)
         dir_name = create_dir_name_from_config(config, prefix="data")
-        file_name = create_file_name_from_paths(pdf_paths, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_name = create_file_name_from_paths(pdf_paths, serializer.ext)
 
-        if not os.path.isfile(cache_file_path):
+        obj = _load_obj(self._store.load(dir_name, file_name), serializer)
+        if obj is None:
             return None
 
-        with open(cache_file_path, "r") as json_file:
-            obj = json.load(json_file)
-
         return from_json(obj)
 
+    def load_warm_start(
+        self, domain: str, config: MethodLayerConfig
+    ) -> Union[Dict[str, Any], None]:
+        serializer = create_cache_serializer(config.cache_format)
+        dir_name = create_dir_name_from_config(config, prefix="data")
+        file_name = create_file_name_from_path(domain, serializer.ext, "warm")
+
+        return _load_obj(self._store.load(dir_name, file_name), serializer)
+
+    def store_warm_start(
+        self, domain: str, obj: Dict[str, Any], config: MethodLayerConfig
+    ):
+        # warm start data is stored per domain, not per PDF list,
+        # so that it can be reused after PDFs are added to or removed from the domain
+        serializer = create_cache_serializer(config.cache_format)
+        dir_name = create_dir_name_from_config(config, prefix="data")
+        file_name = create_file_name_from_path(domain, serializer.ext, "warm")
+
+        self._store.store(dir_name, file_name, serializer.dumps(obj))
+
     def store(
         self,
         pdf_paths: List[str],
         ranking_data: RankingData,
         config: MethodLayerConfig,
     ):
+        serializer = create_cache_serializer(config.cache_format, indent=2)
         dir_name = create_dir_name_from_config(config, prefix="data")
-        file_name = create_file_name_from_paths(pdf_paths, "json")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
-
-        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        file_name = create_file_name_from_paths(pdf_paths, serializer.ext)
 
-        with open(cache_file_path, "w") as json_file:
-            json.dump(ranking_data.to_json(), json_file, ensure_ascii=False, indent=2)
+        content = serializer.dumps(ranking_data.to_json())
+        self._store.store(dir_name, file_name, content)
 
     def remove(self, pdf_paths: List[str], config: MethodLayerConfig):
+        serializer = create_cache_serializer(config.cache_format)
         dir_name = create_dir_name_from_config(config, prefix="data")
-        file_name = create_file_name_from_paths(pdf_paths, "json")
-        cache_dir_path = os.path.join(self._cache_dir, dir_name)
-        cache_file_path = os.path.join(cache_dir_path, file_name)
+        file_name = create_file_name_from_paths(pdf_paths, serializer.ext)
+
+        self._store.remove(dir_name, file_name)
+
+
+class MethodLayerStatisticsCache:
+    # public
+    def __init__(self, cache_dir: str):
+        # cache_dir may also be a SQLite database file (see store.py)
+        self._store = create_cache_store(cache_dir)
+
+    def load_domain(
+        self, domain: str, config: MethodLayerConfig
+    ) -> Union[DomainTermStatistics, None]:
+        obj = self._load(domain, "domain", config)
+        return DomainTermStatistics.from_json(obj) if obj is not None else None
+
+    def store_domain(
+        self, domain_stats: DomainTermStatistics, config: MethodLayerConfig
+    ):
+        self._store_obj(domain_stats.domain, "domain", domain_stats.to_json(), config)
+
+    def load_pdf(
+        self, pdf_path: str, config: MethodLayerConfig
+    ) -> Union[PDFTermStatistics, None]:
+        obj = self._load(pdf_path, "pdf", config)
+        return PDFTermStatistics.from_json(obj) if obj is not None else None
+
+    def store_pdf(self, pdf_stats: PDFTermStatistics, config: MethodLayerConfig):
+        self._store_obj(pdf_stats.pdf_path, "pdf", pdf_stats.to_json(), config)
+
+    def batch(self) -> ContextManager[None]:
+        # writes of all caches sharing cache_dir in the context may be applied at once
+        return self._store.batch()
+
+    # private
+    def _load(
+        self, path: str, prefix: str, config: MethodLayerConfig
+    ) -> Union[Dict[str, Any], None]:
+        serializer = create_cache_serializer(config.cache_format)
+        dir_name = create_dir_name_from_config(config, prefix="stats")
+        file_name = create_file_name_from_path(path, serializer.ext, prefix)
+
+        return _load_obj(self._store.load(dir_name, file_name), serializer)
+
+    def _store_obj(
+        self, path: str, prefix: str, obj: Dict[str, Any], config: MethodLayerConfig
+    ):
+        serializer = create_cache_serializer(config.cache_format)
+        dir_name = create_dir_name_from_config(config, prefix="stats")
+        file_name = create_file_name_from_path(path, serializer.ext, prefix)
 
-        if not os.path.isfile(cache_file_path):
-            return
+        self._store.store(dir_name, file_name, serializer.dumps(obj))
 
-        os.remove(cache_file_path)
 
-        cache_file_paths = glob(os.path.join(cache_dir_path, "*.json"))
-        if not cache_file_paths:
-            rmtree(cache_dir_path)
+def _load_obj(
+    content: Union[bytes, None], serializer: BaseCacheSerializer
+) -> Union[Any, None]:
+    return serializer.loads(content) if content is not None else None
@@ -0,0 +1,80 @@
+import json
+from abc import ABCMeta, abstractmethod
+from typing import Any, Union, Optional
+
+CACHE_FORMATS = ["json", "msgpack"]
+
+
+class BaseCacheSerializer(metaclass=ABCMeta):
+    # public
+    def __init__(self):
+        pass
+
+    @property
+    @abstractmethod
+    def ext(self) -> str:
+        # extension of cache files
+        raise NotImplementedError(f"{self.__class__.__name__}.ext")
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError(f"{self.__class__.__name__}.dumps()")
+
+    @abstractmethod
+    def loads(self, content: bytes) -> Union[Any, None]:
+        # None means the content is broken
+        raise NotImplementedError(f"{self.__class__.__name__}.loads()")
+
+
+class JSONCacheSerializer(BaseCacheSerializer):
+    # public
+    def __init__(self, indent: Optional[int] = None):
+        self._indent = indent
+
+    @property
+    def ext(self) -> str:
+        return "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=self._indent).encode()
+
+    def loads(self, content: bytes) -> Union[Any, None]:
+        try:
+            return json.loads(content.decode())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+
+class MsgpackCacheSerializer(BaseCacheSerializer):
+    # public
+    def __init__(self):
+        # msgpack is an optional dependency required only by this serializer
+        import msgpack
+
+        self._msgpack = msgpack
+
+    @property
+    def ext(self) -> str:
+        return "msgpack"
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, content: bytes) -> Union[Any, None]:
+        try:
+            return self._msgpack.unpackb(content, raw=False, strict_map_key=False)
+        except ValueError:
+            # all errors of broken data are subclasses of ValueError
+            return None
+
+
+def create_cache_serializer(
+    cache_format: str, indent: Optional[int] = None
+) -> BaseCacheSerializer:
+    # indent is used only by the JSON serializer
+    if cache_format == "json":
+        return JSONCacheSerializer(indent=indent)
+    elif cache_format == "msgpack":
+        return MsgpackCacheSerializer()
+    else:
+        raise ValueError(f"unknown cache format '{cache_format}'")
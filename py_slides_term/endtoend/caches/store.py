@@ -0,0 +1,252 @@
+import os
+import sqlite3
+from tempfile import mkstemp
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import List, Dict, Tuple, Iterator, ContextManager, Union, Optional
+
+from .lock import CacheKeyLock
+from .consts import TOKENIZER_CACHE_DIR_NAME, LOCK_DIR_NAME
+
+SQLITE_CACHE_EXTS = [".sqlite3", ".sqlite", ".db"]
+# a cache_dir with one of these extensions is a SQLite database file
+
+
+class BaseCacheStore(metaclass=ABCMeta):
+    # public
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    def load(self, dir_name: str, file_name: str) -> Union[bytes, None]:
+        raise NotImplementedError(f"{self.__class__.__name__}.load()")
+
+    @abstractmethod
+    def store(self, dir_name: str, file_name: str, content: bytes):
+        raise NotImplementedError(f"{self.__class__.__name__}.store()")
+
+    @abstractmethod
+    def remove(self, dir_name: str, file_name: str):
+        raise NotImplementedError(f"{self.__class__.__name__}.remove()")
+
+    @abstractmethod
+    def lock(self, dir_name: str, file_names: List[str]) -> ContextManager[None]:
+        # entries are locked against other threads and processes sharing the store
+        raise NotImplementedError(f"{self.__class__.__name__}.lock()")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # writes in the context may be deferred and applied at once
+        yield
+
+
+class FileCacheStore(BaseCacheStore):
+    # public
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+        self._key_lock = CacheKeyLock(os.path.join(cache_dir, LOCK_DIR_NAME))
+
+    def load(self, dir_name: str, file_name: str) -> Union[bytes, None]:
+        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        # the file may be removed by another process after it is found
+        try:
+            with open(cache_file_path, "rb") as cache_file:
+                return cache_file.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, dir_name: str, file_name: str, content: bytes):
+        cache_dir_path = os.path.join(self._cache_dir, dir_name)
+        cache_file_path = os.path.join(cache_dir_path, file_name)
+
+        # the content is written to a temporary file and renamed to the cache file
+        # so that readers never see a half-written cache file
+        temp_fd, temp_file_path = self._create_temp_file(cache_dir_path, file_name)
+        try:
+            with open(temp_fd, "wb") as temp_file:
+                temp_file.write(content)
+            os.replace(temp_file_path, cache_file_path)
+        except BaseException:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+            raise
+
+    def remove(self, dir_name: str, file_name: str):
+        cache_dir_path = os.path.join(self._cache_dir, dir_name)
+        cache_file_path = os.path.join(cache_dir_path, file_name)
+
+        if not os.path.isfile(cache_file_path):
+            return
+
+        try:
+            os.remove(cache_file_path)
+            # fails if another process is writing a file into the directory
+            os.rmdir(cache_dir_path)
+        except OSError:
+            pass
+
+    def lock(self, dir_name: str, file_names: List[str]) -> ContextManager[None]:
+        return self._key_lock.acquire(
+            [f"{dir_name}-{file_name}" for file_name in file_names]
+        )
+
+    # private
+    def _create_temp_file(self, cache_dir_path: str, file_name: str) -> Tuple[int, str]:
+        # the directory may be removed by another process
+        # between creating it and creating the temporary file, so it is retried
+        num_retries = 3
+        for retry in range(num_retries + 1):
+            os.makedirs(cache_dir_path, exist_ok=True)
+            try:
+                return mkstemp(
+                    dir=cache_dir_path, prefix=f".{file_name}.", suffix=".tmp"
+                )
+            except FileNotFoundError:
+                if retry == num_retries:
+                    raise
+
+        raise RuntimeError("unreachable statement")
+
+
+class SQLiteCacheStore(BaseCacheStore):
+    # public
+    def __init__(self, db_path: str, batch_size: int = 64):
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        self._db_path = db_path
+        self._batch_size = batch_size
+        self._key_lock = CacheKeyLock(f"{os.path.splitext(db_path)[0]}_{LOCK_DIR_NAME}")
+        # connections cannot be shared between threads or forked processes
+        # and batches are also counted per thread
+        self._local = local()
+        self._lock = Lock()
+        # None means the entry is removed
+        self._pending: Dict[Tuple[str, str], Optional[bytes]] = dict()
+
+    def load(self, dir_name: str, file_name: str) -> Union[bytes, None]:
+        key = (dir_name, file_name)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+
+        row = (
+            self._connect()
+            .execute(
+                "SELECT content FROM entries WHERE dir_name = ? AND file_name = ?", key
+            )
+            .fetchone()
+        )
+        return bytes(row[0]) if row is not None else None
+
+    def store(self, dir_name: str, file_name: str, content: bytes):
+        self._write((dir_name, file_name), content)
+
+    def remove(self, dir_name: str, file_name: str):
+        self._write((dir_name, file_name), None)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self._local.batch_depth = self._get_batch_depth() + 1
+        try:
+            yield
+        finally:
+            self._local.batch_depth -= 1
+            if self._local.batch_depth == 0:
+                with self._lock:
+                    self._flush()
+
+    def lock(self, dir_name: str, file_names: List[str]) -> ContextManager[None]:
+        return self._key_lock.acquire(
+            [f"{dir_name}-{file_name}" for file_name in file_names]
+        )
+
+    # private
+    def _write(self, key: Tuple[str, str], content: Optional[bytes]):
+        with self._lock:
+            self._pending[key] = content
+            if self._get_batch_depth() == 0 or len(self._pending) >= self._batch_size:
+                self._flush()
+
+    def _get_batch_depth(self) -> int:
+        return getattr(self._local, "batch_depth", 0)
+
+    def _flush(self):
+        # pending writes are applied in a single transaction
+        if not self._pending:
+            return
+
+        stored = [
+            key + (content,)
+            for key, content in self._pending.items()
+            if content is not None
+        ]
+        removed = [key for key, content in self._pending.items() if content is None]
+
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (dir_name, file_name, content) "
+                "VALUES (?, ?, ?)",
+                stored,
+            )
+            connection.executemany(
+                "DELETE FROM entries WHERE dir_name = ? AND file_name = ?", removed
+            )
+
+        self._pending.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        db_dir = os.path.dirname(os.path.abspath(self._db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        # other processes sharing the database wait for the lock up to the timeout
+        connection = sqlite3.connect(self._db_path, timeout=60.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "dir_name TEXT NOT NULL, file_name TEXT NOT NULL, content BLOB NOT NULL, "
+            "PRIMARY KEY (dir_name, file_name))"
+        )
+        connection.commit()
+
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+
+def is_sqlite_cache(cache_dir: str) -> bool:
+    return os.path.splitext(cache_dir)[1] in SQLITE_CACHE_EXTS
+
+
+def create_tokenizer_cache_dir(cache_dir: str) -> str:
+    # morphemes of texts are always cached in files
+    if is_sqlite_cache(cache_dir):
+        return f"{os.path.splitext(cache_dir)[0]}_{TOKENIZER_CACHE_DIR_NAME}"
+    return os.path.join(cache_dir, TOKENIZER_CACHE_DIR_NAME)
+
+
+# stores are shared by all caches in the process with the same cache_dir
+_cache_stores: Dict[str, BaseCacheStore] = dict()
+_cache_stores_lock = Lock()
+
+
+def create_cache_store(cache_dir: str) -> BaseCacheStore:
+    abs_cache_dir = os.path.abspath(cache_dir)
+    with _cache_stores_lock:
+        cache_store = _cache_stores.get(abs_cache_dir)
+        if cache_store is None:
+            if is_sqlite_cache(abs_cache_dir):
+                cache_store = SQLiteCacheStore(abs_cache_dir)
+            else:
+                cache_store = FileCacheStore(abs_cache_dir)
+            _cache_stores[abs_cache_dir] = cache_store
+
+    return cache_store
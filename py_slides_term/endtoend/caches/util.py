@@ -1,6 +1,8 @@
+import os
 import json
 from hashlib import sha256
-from typing import List
+from threading import Lock
+from typing import List, Dict, Tuple
 
 from ..configs import BaseLayerConfig
 
@@ -14,8 +16,49 @@ def create_file_name_from_path(file_path: str, ext: str, prefix: str = "") -> st
     return f"{prefix}{sha256(file_path.encode()).hexdigest()}.{ext}"
 
 
+def create_file_name_from_content(file_path: str, ext: str, prefix: str = "") -> str:
+    return f"{prefix}{_compute_content_hash(file_path)}.{ext}"
+
+
+def create_file_name_from_key(
+    file_path: str, ext: str, cache_key: str, prefix: str = ""
+) -> str:
+    if cache_key == "path":
+        return create_file_name_from_path(file_path, ext, prefix)
+    elif cache_key == "content":
+        return create_file_name_from_content(file_path, ext, prefix)
+    else:
+        raise ValueError(f"unknown cache key '{cache_key}'")
+
+
 def create_file_name_from_paths(
     file_paths: List[str], ext: str, prefix: str = ""
 ) -> str:
     sorted_paths = sorted(file_paths)
     return f"{prefix}{sha256(json.dumps(sorted_paths).encode()).hexdigest()}.{ext}"
+
+
+# content hashes are reused while modification time and size of the file are unchanged
+_content_hashes: Dict[str, Tuple[int, int, str]] = dict()
+_content_hashes_lock = Lock()
+
+
+def _compute_content_hash(file_path: str) -> str:
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+
+    with _content_hashes_lock:
+        entry = _content_hashes.get(abs_path)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+
+    content_hash = sha256()
+    with open(abs_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            content_hash.update(chunk)
+    digest = content_hash.hexdigest()
+
+    with _content_hashes_lock:
+        _content_hashes[abs_path] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    return digest
@@ -1,59 +1,58 @@
-import os
-from glob import glob
-from shutil import rmtree
 from xml.etree.ElementTree import fromstring, tostring, ParseError
-from typing import Union
+from typing import List, Union, ContextManager
 
 from ..configs import XMLLayerConfig
-from .util import create_dir_name_from_config, create_file_name_from_path
+from .store import create_cache_store
+from .util import create_dir_name_from_config, create_file_name_from_key
 from py_slides_term.pdftoxml import PDFnXMLElement
 
 
 class XMLLayerCache:
     # public
     def __init__(self, cache_dir: str):
-        self._cache_dir = cache_dir
+        # cache_dir may also be a SQLite database file (see store.py)
+        self._store = create_cache_store(cache_dir)
 
     def load(
         self, pdf_path: str, config: XMLLayerConfig
     ) -> Union[PDFnXMLElement, None]:
         dir_name = create_dir_name_from_config(config)
-        file_name = create_file_name_from_path(pdf_path, "xml")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
+        file_name = create_file_name_from_key(pdf_path, "xml", config.cache_key)
 
-        if not os.path.isfile(cache_file_path):
+        xml_content = self._store.load(dir_name, file_name)
+        if xml_content is None:
             return None
 
-        with open(cache_file_path, "r") as xml_file:
-            try:
-                xml_root = fromstring(xml_file.read())
-            except ParseError:
-                return None
+        try:
+            xml_root = fromstring(xml_content)
+        except ParseError:
+            return None
 
         return PDFnXMLElement(pdf_path, xml_root)
 
     def store(self, pdfnxml: PDFnXMLElement, config: XMLLayerConfig):
         dir_name = create_dir_name_from_config(config)
-        file_name = create_file_name_from_path(pdfnxml.pdf_path, "xml")
-        cache_file_path = os.path.join(self._cache_dir, dir_name, file_name)
-
-        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        file_name = create_file_name_from_key(pdfnxml.pdf_path, "xml", config.cache_key)
 
-        with open(cache_file_path, "wb") as xml_file:
-            xml_content = tostring(pdfnxml.xml_root, encoding="utf-8")
-            xml_file.write(xml_content)
+        xml_content = tostring(pdfnxml.xml_root, encoding="utf-8")
+        self._store.store(dir_name, file_name, xml_content)
 
     def remove(self, pdf_path: str, config: XMLLayerConfig):
         dir_name = create_dir_name_from_config(config)
-        file_name = create_file_name_from_path(pdf_path, "xml")
-        cache_dir_path = os.path.join(self._cache_dir, dir_name)
-        cache_file_path = os.path.join(cache_dir_path, file_name)
-
-        if not os.path.isfile(cache_file_path):
+        try:
+            file_name = create_file_name_from_key(pdf_path, "xml", config.cache_key)
+        except FileNotFoundError:
+            # the cache of a deleted or moved PDF cannot be found by its content
             return
+        self._store.remove(dir_name, file_name)
 
-        os.remove(cache_file_path)
-
-        cache_file_paths = glob(os.path.join(cache_dir_path, "*.xml"))
-        if not cache_file_paths:
-            rmtree(cache_dir_path)
+    def lock(
+        self, pdf_paths: List[str], config: XMLLayerConfig
+    ) -> ContextManager[None]:
+        # caches of the PDFs are locked against other threads and processes
+        dir_name = create_dir_name_from_config(config)
+        file_names = [
+            create_file_name_from_key(pdf_path, "xml", config.cache_key)
+            for pdf_path in pdf_paths
+        ]
+        return self._store.lock(dir_name, file_names)
@@ -1,7 +1,22 @@
 from typing import Dict, Any, Type, TypeVar
 from dataclasses import dataclass, asdict
 
-CACHE_CONFIGS = ["use_cache", "remove_lower_layer_cache"]
+CACHE_CONFIGS = [
+    "use_cache",
+    "remove_lower_layer_cache",
+    "use_tokenizer_disk_cache",
+    "cache_key",
+    "cache_format",
+    "use_incremental_data",
+]
+# configs which do not affect outputs of the layer
+RUNTIME_CONFIGS = [
+    "num_workers",
+    "pages_per_chunk",
+    "tokenizer_batch_size",
+    "tokenizer_n_process",
+    "tokenizer_cache_size",
+]
 
 
 @dataclass(frozen=True)
@@ -15,6 +30,8 @@ class BaseLayerConfig:
         config_dict = asdict(self)
         for cache_config in CACHE_CONFIGS:
             config_dict.pop(cache_config, None)
+        for runtime_config in RUNTIME_CONFIGS:
+            config_dict.pop(runtime_config, None)
         return config_dict
 
     @classmethod
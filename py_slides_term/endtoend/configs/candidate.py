@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 from .base import BaseLayerConfig
 
@@ -36,5 +36,36 @@ class CandidateLayerConfig(BaseLayerConfig):
             "py_slides_term.augmenters.EnglishAdpositionAugmenter",
         ]
     )
+    morpheme_attrs: List[str] = field(
+        default_factory=lambda: [
+            "pos",
+            "category",
+            "subcategory",
+            "subsubcategory",
+            "universal_tag",
+            "dep_relations",
+            "original_form",
+            "shape",
+            "is_stop",
+        ]
+    )
+    # attributes of morphemes which have to be filled by spaCy
+    # spaCy pipeline components needed for none of them are not loaded
+    tokenizer_batch_size: Optional[int] = None
+    # number of texts passed to spaCy at once
+    # None means the default batch size of the spaCy model
+    tokenizer_n_process: int = 1
+    # number of processes spaCy uses to tokenize texts
+    tokenizer_cache_size: Optional[int] = 10000
+    # number of texts whose morphemes are kept in memory
+    # 0 disables the in-memory cache and None means it is unbounded
+    use_tokenizer_disk_cache: bool = False
+    # whether morphemes of texts are also cached in files under the cache directory
     use_cache: bool = True
+    cache_key: str = "path"
+    # "path" identifies a cache by the PDF path
+    # "content" identifies a cache by the SHA-256 hash of the PDF content
+    cache_format: str = "json"
+    # "json" stores caches as JSON files
+    # "msgpack" stores caches as compact binary files (msgpack is required)
     remove_lower_layer_cache: bool = True
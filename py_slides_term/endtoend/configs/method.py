@@ -10,4 +10,10 @@ class MethodLayerConfig(BaseLayerConfig):
     method: str = "py_slides_term.methods.FLRHMethod"
     hyper_params: Dict[str, Any] = field(default_factory=dict)
     use_cache: bool = True
+    cache_format: str = "json"
+    # "json" stores caches as JSON files
+    # "msgpack" stores caches as compact binary files (msgpack is required)
     remove_lower_layer_cache: bool = True
+    use_incremental_data: bool = False
+    # if True, per-PDF statistics and the domain statistics are cached
+    # and the domain statistics are updated only by the PDFs added or removed
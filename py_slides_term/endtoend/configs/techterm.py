@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from .base import BaseLayerConfig
 
@@ -7,3 +8,6 @@ from .base import BaseLayerConfig
 class TechnicalTermLayerConfig(BaseLayerConfig):
     max_num_pageterms: int = 14
     acceptance_rate: float = 0.75
+    num_workers: Optional[int] = 1
+    # number of worker processes used to select technical terms of multiple PDFs
+    # None means the number of processors on the machine
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from .base import BaseLayerConfig
 
@@ -7,3 +8,12 @@ from .base import BaseLayerConfig
 class XMLLayerConfig(BaseLayerConfig):
     apply_nfc_normalization: bool = True
     use_cache: bool = True
+    cache_key: str = "path"
+    # "path" identifies a cache by the PDF path
+    # "content" identifies a cache by the SHA-256 hash of the PDF content
+    num_workers: Optional[int] = 1
+    # number of worker processes used to convert multiple PDFs
+    # None means the number of processors on the machine
+    pages_per_chunk: Optional[int] = None
+    # if not None, a PDF with more pages than this is split into page ranges
+    # and the ranges are converted by the worker processes in parallel
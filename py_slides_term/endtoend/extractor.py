@@ -17,7 +17,7 @@ from .mappers import (
 from .layers import XMLLayer, CandidateLayer, MethodLayer, TechnicalTermLayer
 from .caches import DEFAULT_CACHE_DIR
 from .data import DomainPDFList
-from py_slides_term.techterms import PDFTechnicalTermList
+from py_slides_term.techterms import DomainTechnicalTermList, PDFTechnicalTermList
 
 
 class PySlidesTermExtractor:
@@ -35,7 +35,11 @@ class PySlidesTermExtractor:
         single_method_mapper: Optional[SingleDomainRankingMethodMapper] = None,
         multi_method_mapper: Optional[MultiDomainRankingMethodMapper] = None,
         cache_dir: str = DEFAULT_CACHE_DIR,
+        memory_cache_size: int = 128,
     ):
+        # memory_cache_size is the max number of candidate lists and rankings
+        # which are memoized in each layer whose use_cache is enabled
+        # 0 disables the memoization
         xml_layer = XMLLayer(xml_config, cache_dir)
         candidate_layer = CandidateLayer(
             xml_layer=xml_layer,
@@ -45,6 +49,7 @@ class PySlidesTermExtractor:
             splitter_mapper=splitter_mapper,
             augmenter_mapper=augmenter_mapper,
             cache_dir=cache_dir,
+            memory_cache_size=memory_cache_size,
         )
         method_layer = MethodLayer(
             candidate_layer=candidate_layer,
@@ -52,6 +57,7 @@ class PySlidesTermExtractor:
             single_method_mapper=single_method_mapper,
             multi_method_mapper=multi_method_mapper,
             cache_dir=cache_dir,
+            memory_cache_size=memory_cache_size,
         )
         self._techterm_layer = TechnicalTermLayer(
             candidate_layer=candidate_layer,
@@ -70,3 +76,14 @@ class PySlidesTermExtractor:
             domain, pdf_path, single_domain_pdfs, multi_domain_pdfs
         )
         return pdf_techterms
+
+    def extract_domain(
+        self,
+        domain: str,
+        single_domain_pdfs: Optional[DomainPDFList] = None,
+        multi_domain_pdfs: Optional[List[DomainPDFList]] = None,
+    ) -> DomainTechnicalTermList:
+        domain_techterms = self._techterm_layer.create_domain_techterms(
+            domain, single_domain_pdfs, multi_domain_pdfs
+        )
+        return domain_techterms
@@ -1,8 +1,14 @@
-from typing import List, Optional
+from contextlib import nullcontext
+from typing import List, Dict, Iterator, Union, Optional, ContextManager
 
 from .xml import XMLLayer
 from ..data import DomainPDFList
-from ..caches import CandidateLayerCache, DEFAULT_CACHE_DIR
+from ..caches import (
+    CandidateLayerCache,
+    LayerMemoryCache,
+    DEFAULT_CACHE_DIR,
+    create_tokenizer_cache_dir,
+)
 from ..configs import CandidateLayerConfig
 from ..mappers import (
     CandidateMorphemeFilterMapper,
@@ -14,7 +20,9 @@ from py_slides_term.candidates import (
     CandidateTermExtractor,
     DomainCandidateTermList,
     PDFCandidateTermList,
+    PageCandidateTermList,
 )
+from py_slides_term.pdftoxml import PDFnXMLElement
 
 
 class CandidateLayer:
@@ -28,6 +36,7 @@ class CandidateLayer:
         splitter_mapper: Optional[SplitterMapper] = None,
         augmenter_mapper: Optional[AugmenterMapper] = None,
         cache_dir: str = DEFAULT_CACHE_DIR,
+        memory_cache_size: int = 0,
     ):
         if config is None:
             config = CandidateLayerConfig()
@@ -47,8 +56,19 @@ class CandidateLayer:
             term_filter_clses=term_filter_mapper.bulk_find(config.term_filters),
             splitter_clses=splitter_mapper.bulk_find(config.splitters),
             augmenter_clses=augmenter_mapper.bulk_find(config.augmenters),
+            morpheme_attrs=config.morpheme_attrs,
+            tokenizer_batch_size=config.tokenizer_batch_size,
+            tokenizer_n_process=config.tokenizer_n_process,
+            tokenizer_cache_size=config.tokenizer_cache_size,
+            tokenizer_cache_dir=(
+                create_tokenizer_cache_dir(cache_dir)
+                if config.use_tokenizer_disk_cache
+                else None
+            ),
         )
         self._cache = CandidateLayerCache(cache_dir=cache_dir)
+        # candidates are also kept in memory to skip loading the cache file again
+        self._memory_cache = LayerMemoryCache[PDFCandidateTermList](memory_cache_size)
         self._config = config
 
         self._xml_layer = xml_layer
@@ -56,27 +76,99 @@ class CandidateLayer:
     def create_domain_candiates(
         self, domain_pdfs: DomainPDFList
     ) -> DomainCandidateTermList:
-        pdf_candidates_list: List[PDFCandidateTermList] = []
-        for pdf_path in domain_pdfs.pdf_paths:
-            pdf_candidates = self.create_pdf_candidates(pdf_path)
-            pdf_candidates_list.append(pdf_candidates)
+        pdf_candidates_dict: Dict[str, PDFCandidateTermList] = dict()
+        uncached_pdf_paths: List[str] = []
+        for pdf_path in dict.fromkeys(domain_pdfs.pdf_paths):
+            candidates = self._load_cache(pdf_path)
+            if candidates is None:
+                uncached_pdf_paths.append(pdf_path)
+            else:
+                pdf_candidates_dict[pdf_path] = candidates
+
+        if uncached_pdf_paths:
+            # only one worker sharing the cache creates candidates of each PDF
+            # and the others wait for it and load its cache
+            with self._lock_cache(uncached_pdf_paths):
+                pdf_paths_to_create: List[str] = []
+                for pdf_path in uncached_pdf_paths:
+                    candidates = self._load_cache(pdf_path)
+                    if candidates is None:
+                        pdf_paths_to_create.append(pdf_path)
+                    else:
+                        pdf_candidates_dict[pdf_path] = candidates
 
+                pdfnxmls = self._xml_layer.create_pdfnxmls(
+                    pdf_paths_to_create, ordered=False
+                )
+                with self._cache.batch():
+                    for pdfnxml in pdfnxmls:
+                        pdf_candidates = self._create_from_pdfnxml(pdfnxml)
+                        pdf_candidates_dict[pdfnxml.pdf_path] = pdf_candidates
+
+        pdf_candidates_list = list(
+            map(lambda pdf_path: pdf_candidates_dict[pdf_path], domain_pdfs.pdf_paths)
+        )
         return DomainCandidateTermList(domain_pdfs.domain, pdf_candidates_list)
 
     def create_pdf_candidates(self, pdf_path: str) -> PDFCandidateTermList:
-        if self._config.use_cache:
-            candidates = self._cache.load(pdf_path, self._config)
+        candidates = self._load_cache(pdf_path)
+        if candidates is not None:
+            return candidates
+
+        with self._lock_cache([pdf_path]):
+            candidates = self._load_cache(pdf_path)
             if candidates is not None:
-                if self._config.remove_lower_layer_cache:
-                    self._xml_layer.remove_cache(pdf_path)
                 return candidates
 
-        pdfnxml = self._xml_layer.create_pdfnxml(pdf_path)
+            pdfnxml = self._xml_layer.create_pdfnxml(pdf_path)
+            return self._create_from_pdfnxml(pdfnxml)
+
+    def iter_page_candidates(self, pdf_path: str) -> Iterator[PageCandidateTermList]:
+        # pages are generated one by one and not stored into the cache
+        candidates = self._load_cache(pdf_path)
+        if candidates is not None:
+            yield from candidates.pages
+            return
+
+        page_elements = self._xml_layer.create_page_elements(pdf_path)
+        yield from self._extractor.extract_from_page_elements(page_elements)
+
+    # private
+    def _load_cache(self, pdf_path: str) -> Union[PDFCandidateTermList, None]:
+        if not self._config.use_cache:
+            return None
+
+        # candidates in memory are keyed in the same way as the cache files
+        memory_key = self._cache.create_key(pdf_path, self._config)
+        candidates = self._memory_cache.load(memory_key, self._config)
+        if candidates is not None:
+            # the candidates may be created from the PDF with the same content
+            # at another path
+            if candidates.pdf_path != pdf_path:
+                candidates = PDFCandidateTermList(pdf_path, candidates.pages)
+            return candidates
+
+        candidates = self._cache.load(pdf_path, self._config)
+        if candidates is not None:
+            self._memory_cache.store(memory_key, candidates, self._config)
+            if self._config.remove_lower_layer_cache:
+                self._xml_layer.remove_cache(pdf_path)
+
+        return candidates
+
+    def _lock_cache(self, pdf_paths: List[str]) -> ContextManager[None]:
+        if not self._config.use_cache:
+            return nullcontext()
+        return self._cache.lock(pdf_paths, self._config)
+
+    def _create_from_pdfnxml(self, pdfnxml: PDFnXMLElement) -> PDFCandidateTermList:
         candidates = self._extractor.extract_from_xml_element(pdfnxml)
 
         if self._config.use_cache:
+            memory_key = self._cache.create_key(pdfnxml.pdf_path, self._config)
+            self._memory_cache.store(memory_key, candidates, self._config)
             self._cache.store(candidates, self._config)
             if self._config.remove_lower_layer_cache:
-                self._xml_layer.remove_cache(pdf_path)
+                self._xml_layer.remove_cache(pdfnxml.pdf_path)
 
         return candidates
@@ -1,11 +1,19 @@
-from typing import Any, List, Optional
+from collections import Counter
+from typing import Any, List, Tuple, Hashable, Union, Optional, ContextManager
 
-from ..caches import MethodLayerRankingCache, MethodLayerDataCache, DEFAULT_CACHE_DIR
+from ..caches import (
+    MethodLayerRankingCache,
+    MethodLayerDataCache,
+    MethodLayerStatisticsCache,
+    LayerMemoryCache,
+    DEFAULT_CACHE_DIR,
+)
 from ..configs import MethodLayerConfig
 from ..mappers import SingleDomainRankingMethodMapper, MultiDomainRankingMethodMapper
 from ..data import DomainPDFList
 from .candidate import CandidateLayer
 from py_slides_term.candidates import DomainCandidateTermList
+from py_slides_term.analysis import DomainTermStatistics
 from py_slides_term.methods import (
     BaseSingleDomainRankingMethod,
     BaseMultiDomainRankingMethod,
@@ -22,6 +30,7 @@ class MethodLayer:
         single_method_mapper: Optional[SingleDomainRankingMethodMapper] = None,
         multi_method_mapper: Optional[MultiDomainRankingMethodMapper] = None,
         cache_dir: str = DEFAULT_CACHE_DIR,
+        memory_cache_size: int = 0,
     ):
         if config is None:
             config = MethodLayerConfig()
@@ -40,6 +49,10 @@ class MethodLayer:
         self._method = method_cls(**config.hyper_params)
         self._ranking_cache = MethodLayerRankingCache(cache_dir=cache_dir)
         self._data_cache = MethodLayerDataCache[Any](cache_dir=cache_dir)
+        self._stats_cache = MethodLayerStatisticsCache(cache_dir=cache_dir)
+        # rankings are also kept in memory
+        # so that PDFs in the same domain share the ranking without loading it again
+        self._memory_cache = LayerMemoryCache[DomainTermRanking](memory_cache_size)
         self._config = config
 
         self._candidate_layer = candidate_layer
@@ -50,6 +63,13 @@ class MethodLayer:
         single_domain_pdfs: Optional[DomainPDFList] = None,
         multi_domain_pdfs: Optional[List[DomainPDFList]] = None,
     ) -> DomainTermRanking:
+        memory_key = self._create_memory_key(
+            domain, single_domain_pdfs, multi_domain_pdfs
+        )
+        term_ranking = self._load_memory_cache(memory_key)
+        if term_ranking is not None:
+            return term_ranking
+
         # pyright:reportUnnecessaryIsInstance=false
         if isinstance(self._method, BaseSingleDomainRankingMethod):
             if single_domain_pdfs is None:
@@ -58,7 +78,6 @@ class MethodLayer:
                     "when using single-domain ranking method"
                 )
             term_ranking = self._run_single_domain_method(domain, single_domain_pdfs)
-            return term_ranking
         elif isinstance(self._method, BaseMultiDomainRankingMethod):
             if multi_domain_pdfs is None:
                 raise ValueError(
@@ -66,7 +85,61 @@ class MethodLayer:
                     " when using multi-domain ranking method"
                 )
             term_ranking = self._run_multi_domain_method(domain, multi_domain_pdfs)
-            return term_ranking
+        else:
+            raise RuntimeError("unreachable statement")
+
+        self._store_memory_cache(memory_key, term_ranking)
+        return term_ranking
+
+    def create_term_rankings(
+        self,
+        single_domain_pdfs_list: Optional[List[DomainPDFList]] = None,
+        multi_domain_pdfs: Optional[List[DomainPDFList]] = None,
+    ) -> List[DomainTermRanking]:
+        # rank all domains in the list
+        # the result is in the same order as the list
+        if isinstance(self._method, BaseSingleDomainRankingMethod):
+            if single_domain_pdfs_list is None:
+                raise ValueError(
+                    "'single_domain_pdfs_list' is required"
+                    " when using single-domain ranking method"
+                )
+            return list(
+                map(
+                    lambda domain_pdfs: self.create_term_ranking(
+                        domain_pdfs.domain, single_domain_pdfs=domain_pdfs
+                    ),
+                    single_domain_pdfs_list,
+                )
+            )
+        elif isinstance(self._method, BaseMultiDomainRankingMethod):
+            if multi_domain_pdfs is None:
+                raise ValueError(
+                    "'multi_domain_pdfs' is required"
+                    " when using multi-domain ranking method"
+                )
+
+            memory_keys = list(
+                map(
+                    lambda domain_pdfs: self._create_memory_key(
+                        domain_pdfs.domain, None, multi_domain_pdfs
+                    ),
+                    multi_domain_pdfs,
+                )
+            )
+            memoized_term_rankings = list(map(self._load_memory_cache, memory_keys))
+            term_rankings = [
+                term_ranking
+                for term_ranking in memoized_term_rankings
+                if term_ranking is not None
+            ]
+            if len(term_rankings) == len(multi_domain_pdfs):
+                return term_rankings
+
+            term_rankings = self._run_multi_domain_method_all(multi_domain_pdfs)
+            for memory_key, term_ranking in zip(memory_keys, term_rankings):
+                self._store_memory_cache(memory_key, term_ranking)
+            return term_rankings
         else:
             raise RuntimeError("unreachable statement")
 
@@ -85,18 +158,45 @@ class MethodLayer:
                 f" but got '{domain_pdfs.domain}'"
             )
 
-        if self._config.use_cache:
-            term_ranking = self._ranking_cache.load(domain_pdfs.pdf_paths, self._config)
+        if not self._config.use_cache:
+            return self._rank_single_domain(domain, domain_pdfs)
+
+        term_ranking = self._load_ranking_cache(domain_pdfs)
+        if term_ranking is not None:
+            return term_ranking
+
+        # only one worker sharing the cache ranks the domain
+        # and the others wait for it and load its cache
+        with self._ranking_cache.lock([domain_pdfs.pdf_paths], self._config):
+            term_ranking = self._load_ranking_cache(domain_pdfs)
             if term_ranking is not None:
-                if self._config.remove_lower_layer_cache:
-                    self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
                 return term_ranking
 
+            return self._rank_single_domain(domain, domain_pdfs)
+
+    def _rank_single_domain(
+        self,
+        domain: str,
+        domain_pdfs: DomainPDFList,
+    ) -> DomainTermRanking:
+        if not isinstance(self._method, BaseSingleDomainRankingMethod):
+            raise RuntimeError("unreachable statement")
+
         domain_candidates = self._candidate_layer.create_domain_candiates(domain_pdfs)
         ranking_data = self._create_ranking_data(domain_pdfs, domain_candidates)
+
+        if self._config.use_cache:
+            warm_start_data = self._data_cache.load_warm_start(domain, self._config)
+            if warm_start_data is not None:
+                self._method.set_warm_start_data(domain, warm_start_data)
+
         term_ranking = self._method.rank_terms(domain_candidates, ranking_data)
 
         if self._config.use_cache:
+            warm_start_data = self._method.get_warm_start_data(domain)
+            if warm_start_data is not None:
+                self._data_cache.store_warm_start(domain, warm_start_data, self._config)
+
             self._ranking_cache.store(domain_pdfs.pdf_paths, term_ranking, self._config)
             if self._config.remove_lower_layer_cache:
                 self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
@@ -118,30 +218,165 @@ class MethodLayer:
             raise ValueError(f"'multi_domain_pdfs' does not contain domain '{domain}'")
 
         if self._config.use_cache:
-            term_ranking = self._ranking_cache.load(domain_pdfs.pdf_paths, self._config)
+            term_ranking = self._load_ranking_cache(domain_pdfs)
             if term_ranking is not None:
-                if self._config.remove_lower_layer_cache:
-                    self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
                 return term_ranking
 
+            with self._lock_ranking_caches(domain_pdfs_list):
+                term_ranking = self._load_ranking_cache(domain_pdfs)
+                if term_ranking is not None:
+                    return term_ranking
+
+                # candidates and ranking data of all domains are required anyway,
+                # so all domains are ranked and cached at once
+                term_rankings = self._rank_all_domains(domain_pdfs_list)
+                return next(filter(lambda item: item.domain == domain, term_rankings))
+
+        domain_candidates_list, ranking_data_list = self._create_multi_domain_data(
+            domain_pdfs_list
+        )
+        term_ranking = self._method.rank_domain_terms(
+            domain, domain_candidates_list, ranking_data_list
+        )
+        return term_ranking
+
+    def _run_multi_domain_method_all(
+        self, domain_pdfs_list: List[DomainPDFList]
+    ) -> List[DomainTermRanking]:
+        if not self._config.use_cache:
+            return self._rank_all_domains(domain_pdfs_list)
+
+        term_rankings = self._load_ranking_caches(domain_pdfs_list)
+        if term_rankings is not None:
+            return term_rankings
+
+        with self._lock_ranking_caches(domain_pdfs_list):
+            term_rankings = self._load_ranking_caches(domain_pdfs_list)
+            if term_rankings is not None:
+                return term_rankings
+
+            return self._rank_all_domains(domain_pdfs_list)
+
+    def _load_ranking_cache(
+        self, domain_pdfs: DomainPDFList
+    ) -> Optional[DomainTermRanking]:
+        term_ranking = self._ranking_cache.load(domain_pdfs.pdf_paths, self._config)
+        if term_ranking is not None and self._config.remove_lower_layer_cache:
+            self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
+        return term_ranking
+
+    def _load_ranking_caches(
+        self, domain_pdfs_list: List[DomainPDFList]
+    ) -> Optional[List[DomainTermRanking]]:
+        # None means the ranking of some domain is not cached
+        cached_term_rankings = list(
+            map(
+                lambda domain_pdfs: self._ranking_cache.load(
+                    domain_pdfs.pdf_paths, self._config
+                ),
+                domain_pdfs_list,
+            )
+        )
+        term_rankings = [
+            term_ranking
+            for term_ranking in cached_term_rankings
+            if term_ranking is not None
+        ]
+        if len(term_rankings) != len(domain_pdfs_list):
+            return None
+
+        if self._config.remove_lower_layer_cache:
+            for domain_pdfs in domain_pdfs_list:
+                self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
+        return term_rankings
+
+    def _lock_ranking_caches(
+        self, domain_pdfs_list: List[DomainPDFList]
+    ) -> ContextManager[None]:
+        return self._ranking_cache.lock(
+            list(map(lambda domain_pdfs: domain_pdfs.pdf_paths, domain_pdfs_list)),
+            self._config,
+        )
+
+    def _rank_all_domains(
+        self, domain_pdfs_list: List[DomainPDFList]
+    ) -> List[DomainTermRanking]:
+        if not isinstance(self._method, BaseMultiDomainRankingMethod):
+            raise RuntimeError("unreachable statement")
+
+        domain_candidates_list, ranking_data_list = self._create_multi_domain_data(
+            domain_pdfs_list
+        )
+        term_rankings = list(
+            self._method.rank_terms(domain_candidates_list, ranking_data_list)
+        )
+
+        if self._config.use_cache:
+            with self._ranking_cache.batch():
+                for domain_pdfs, term_ranking in zip(domain_pdfs_list, term_rankings):
+                    self._ranking_cache.store(
+                        domain_pdfs.pdf_paths, term_ranking, self._config
+                    )
+                    if self._config.remove_lower_layer_cache:
+                        self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
+
+        return term_rankings
+
+    def _create_multi_domain_data(
+        self, domain_pdfs_list: List[DomainPDFList]
+    ) -> Tuple[List[DomainCandidateTermList], List[Any]]:
         domain_candidates_list: List[DomainCandidateTermList] = []
         ranking_data_list: List[Any] = []
-        for _domain_pdfs in domain_pdfs_list:
-            candidates = self._candidate_layer.create_domain_candiates(_domain_pdfs)
-            ranking_data = self._create_ranking_data(_domain_pdfs, candidates)
+        for domain_pdfs in domain_pdfs_list:
+            candidates = self._candidate_layer.create_domain_candiates(domain_pdfs)
+            ranking_data = self._create_ranking_data(domain_pdfs, candidates)
             domain_candidates_list.append(candidates)
             ranking_data_list.append(ranking_data)
 
-        term_ranking = self._method.rank_domain_terms(
-            domain, domain_candidates_list, ranking_data_list
-        )
+        return domain_candidates_list, ranking_data_list
 
+    def _load_memory_cache(
+        self, memory_key: Hashable
+    ) -> Union[DomainTermRanking, None]:
+        # rankings are memoized only when the cache is enabled
+        if not self._config.use_cache:
+            return None
+        return self._memory_cache.load(memory_key, self._config)
+
+    def _store_memory_cache(
+        self, memory_key: Hashable, term_ranking: DomainTermRanking
+    ):
         if self._config.use_cache:
-            self._ranking_cache.store(domain_pdfs.pdf_paths, term_ranking, self._config)
-            if self._config.remove_lower_layer_cache:
-                self._data_cache.remove(domain_pdfs.pdf_paths, self._config)
+            self._memory_cache.store(memory_key, term_ranking, self._config)
 
-        return term_ranking
+    def _create_memory_key(
+        self,
+        domain: str,
+        single_domain_pdfs: Optional[DomainPDFList],
+        multi_domain_pdfs: Optional[List[DomainPDFList]],
+    ) -> Hashable:
+        # a ranking depends on the domain and the set of PDFs used to rank it
+        single_domain_key = (
+            tuple(sorted(single_domain_pdfs.pdf_paths))
+            if single_domain_pdfs is not None
+            else None
+        )
+        multi_domain_key = (
+            tuple(
+                sorted(
+                    map(
+                        lambda domain_pdfs: (
+                            domain_pdfs.domain,
+                            tuple(sorted(domain_pdfs.pdf_paths)),
+                        ),
+                        multi_domain_pdfs,
+                    )
+                )
+            )
+            if multi_domain_pdfs is not None
+            else None
+        )
+        return (domain, single_domain_key, multi_domain_key)
 
     def _create_ranking_data(
         self, domain_pdfs: DomainPDFList, domain_candidates: DomainCandidateTermList
@@ -155,7 +390,18 @@ class MethodLayer:
             if ranking_data is not None:
                 return ranking_data
 
-        ranking_data = self._method.collect_data(domain_candidates)
+        # collectors which do not support statistics fall back to collect()
+        if (
+            self._config.use_cache
+            and self._config.use_incremental_data
+            and self._method.can_collect_data_from_statistics()
+        ):
+            domain_stats = self._create_domain_statistics(
+                domain_pdfs, domain_candidates
+            )
+            ranking_data = self._method.collect_data_from_statistics(domain_stats)
+        else:
+            ranking_data = self._method.collect_data(domain_candidates)
 
         if self._config.use_cache:
             self._data_cache.store(
@@ -165,3 +411,39 @@ class MethodLayer:
             )
 
         return ranking_data
+
+    def _create_domain_statistics(
+        self, domain_pdfs: DomainPDFList, domain_candidates: DomainCandidateTermList
+    ) -> DomainTermStatistics:
+        domain_stats = self._stats_cache.load_domain(domain_pdfs.domain, self._config)
+        if domain_stats is None:
+            domain_stats = DomainTermStatistics(domain_pdfs.domain)
+
+        pdf_freq = Counter(domain_pdfs.pdf_paths)
+        cached_pdf_freq = Counter(domain_stats.pdf_freq)
+
+        # subtract statistics of PDFs removed from the domain
+        for pdf_path, freq in (cached_pdf_freq - pdf_freq).items():
+            pdf_stats = self._stats_cache.load_pdf(pdf_path, self._config)
+            if pdf_stats is None:
+                # the domain statistics cannot be updated, so it is created again
+                domain_stats = DomainTermStatistics(domain_pdfs.domain)
+                cached_pdf_freq = Counter()
+                break
+            for _ in range(freq):
+                domain_stats.subtract(pdf_stats)
+
+        # add statistics of PDFs added to the domain
+        # the statistics are stored so that the PDFs can be subtracted later
+        pdf_candidates_dict = {pdf.pdf_path: pdf for pdf in domain_candidates.pdfs}
+        with self._stats_cache.batch():
+            for pdf_path, freq in (pdf_freq - cached_pdf_freq).items():
+                pdf_stats = self._method.collect_pdf_statistics(
+                    pdf_candidates_dict[pdf_path]
+                )
+                self._stats_cache.store_pdf(pdf_stats, self._config)
+                for _ in range(freq):
+                    domain_stats.add(pdf_stats)
+
+            self._stats_cache.store_domain(domain_stats, self._config)
+        return domain_stats
@@ -4,7 +4,11 @@ from ..configs import TechnicalTermLayerConfig
 from ..data import DomainPDFList
 from .candidate import CandidateLayer
 from .method import MethodLayer
-from py_slides_term.techterms import TechnicalTermExtractor, PDFTechnicalTermList
+from py_slides_term.techterms import (
+    TechnicalTermExtractor,
+    DomainTechnicalTermList,
+    PDFTechnicalTermList,
+)
 
 
 class TechnicalTermLayer:
@@ -40,3 +44,33 @@ class TechnicalTermLayer:
         )
         techterms = self._techterm.extract_from_pdf(pdf_candidate, term_ranking)
         return techterms
+
+    def create_domain_techterms(
+        self,
+        domain: str,
+        single_domain_pdfs: Optional[DomainPDFList] = None,
+        multi_domain_pdfs: Optional[List[DomainPDFList]] = None,
+    ) -> DomainTechnicalTermList:
+        if single_domain_pdfs is not None:
+            domain_pdfs = single_domain_pdfs
+        elif multi_domain_pdfs is not None:
+            domain_pdfs = next(
+                filter(lambda item: item.domain == domain, multi_domain_pdfs), None
+            )
+            if domain_pdfs is None:
+                raise ValueError(
+                    f"'multi_domain_pdfs' does not contain domain '{domain}'"
+                )
+        else:
+            raise ValueError(
+                "either 'single_domain_pdfs' or 'multi_domain_pdfs' is required"
+            )
+
+        domain_candidates = self._candidate_layer.create_domain_candiates(domain_pdfs)
+        term_ranking = self._method_layer.create_term_ranking(
+            domain, single_domain_pdfs, multi_domain_pdfs
+        )
+        techterms = self._techterm.extract_from_domain(
+            domain_candidates, term_ranking, max_workers=self._config.num_workers
+        )
+        return techterms
@@ -1,4 +1,6 @@
-from typing import Optional
+from itertools import chain
+from xml.etree.ElementTree import Element
+from typing import List, Dict, Iterator, Optional
 
 from ..caches import XMLLayerCache, DEFAULT_CACHE_DIR
 from ..configs import XMLLayerConfig
@@ -20,19 +22,93 @@ class XMLLayer:
         self._config = config
 
     def create_pdfnxml(self, pdf_path: str) -> PDFnXMLElement:
+        if not self._config.use_cache:
+            return self._convert(pdf_path)
+
+        pdfnxml = self._cache.load(pdf_path, self._config)
+        if pdfnxml is not None:
+            return pdfnxml
+
+        # only one worker sharing the cache converts the PDF
+        # and the others wait for it and load its cache
+        with self._cache.lock([pdf_path], self._config):
+            pdfnxml = self._cache.load(pdf_path, self._config)
+            if pdfnxml is None:
+                pdfnxml = self._convert(pdf_path)
+                self._cache.store(pdfnxml, self._config)
+
+        return pdfnxml
+
+    def create_page_elements(self, pdf_path: str) -> Iterator[Element]:
+        # pages are generated one by one and not stored into the cache
         if self._config.use_cache:
             pdfnxml = self._cache.load(pdf_path, self._config)
             if pdfnxml is not None:
-                return pdfnxml
+                yield from pdfnxml.xml_root.iter("page")
+                return
 
-        pdfnxml = self._converter.convert_as_element(
+        yield from self._converter.convert_as_page_elements(
             pdf_path, apply_nfc_normalization=self._config.apply_nfc_normalization
         )
 
-        if self._config.use_cache:
-            self._cache.store(pdfnxml, self._config)
+    def create_pdfnxmls(
+        self, pdf_paths: List[str], ordered: bool = True
+    ) -> Iterator[PDFnXMLElement]:
+        pdfnxml_dict: Dict[str, PDFnXMLElement] = dict()
+        uncached_pdf_paths: List[str] = []
+        for pdf_path in dict.fromkeys(pdf_paths):
+            pdfnxml = (
+                self._cache.load(pdf_path, self._config)
+                if self._config.use_cache
+                else None
+            )
+            if pdfnxml is None:
+                uncached_pdf_paths.append(pdf_path)
+            elif ordered:
+                pdfnxml_dict[pdf_path] = pdfnxml
+            else:
+                yield pdfnxml
 
-        return pdfnxml
+        pdfnxmls = self._converter.convert_many(
+            uncached_pdf_paths,
+            apply_nfc_normalization=self._config.apply_nfc_normalization,
+            max_workers=self._config.num_workers,
+            ordered=False,
+            pages_per_chunk=self._config.pages_per_chunk,
+        )
+
+        if not ordered:
+            for pdfnxml in pdfnxmls:
+                if self._config.use_cache:
+                    self._cache.store(pdfnxml, self._config)
+                yield pdfnxml
+            return
+
+        # buffer finished results until all of the preceding PDFs are finished
+        last_idx = {pdf_path: idx for idx, pdf_path in enumerate(pdf_paths)}
+        next_idx = 0
+        for pdfnxml in chain(pdfnxmls, [None]):
+            if pdfnxml is not None:
+                if self._config.use_cache:
+                    self._cache.store(pdfnxml, self._config)
+                pdfnxml_dict[pdfnxml.pdf_path] = pdfnxml
+
+            while next_idx < len(pdf_paths) and pdf_paths[next_idx] in pdfnxml_dict:
+                pdf_path = pdf_paths[next_idx]
+                if next_idx == last_idx[pdf_path]:
+                    yield pdfnxml_dict.pop(pdf_path)
+                else:
+                    yield pdfnxml_dict[pdf_path]
+                next_idx += 1
 
     def remove_cache(self, pdf_path: str):
         self._cache.remove(pdf_path, self._config)
+
+    # private
+    def _convert(self, pdf_path: str) -> PDFnXMLElement:
+        return self._converter.convert_as_element(
+            pdf_path,
+            apply_nfc_normalization=self._config.apply_nfc_normalization,
+            max_workers=self._config.num_workers,
+            pages_per_chunk=self._config.pages_per_chunk,
+        )
@@ -5,7 +5,8 @@ from .collectors import BaseRankingDataCollector
 from .rankers import BaseSingleDomainRanker, BaseMultiDomainRanker
 from .data import DomainTermRanking
 from .rankingdata.base import RankingData
-from py_slides_term.candidates import DomainCandidateTermList
+from py_slides_term.candidates import DomainCandidateTermList, PDFCandidateTermList
+from py_slides_term.analysis import PDFTermStatistics, DomainTermStatistics
 
 
 class BaseSingleDomainRankingMethod(Generic[RankingData], metaclass=ABCMeta):
@@ -32,6 +33,27 @@ class BaseSingleDomainRankingMethod(Generic[RankingData], metaclass=ABCMeta):
         ranking_data = self._data_collector.collect(domain_candidates)
         return ranking_data
 
+    def get_warm_start_data(self, domain: str) -> Optional[Dict[str, Any]]:
+        return self._ranker.get_warm_start_data(domain)
+
+    def set_warm_start_data(self, domain: str, obj: Dict[str, Any]):
+        self._ranker.set_warm_start_data(domain, obj)
+
+    def collect_pdf_statistics(
+        self, pdf_candidates: PDFCandidateTermList
+    ) -> PDFTermStatistics:
+        pdf_stats = self._data_collector.collect_pdf_statistics(pdf_candidates)
+        return pdf_stats
+
+    def collect_data_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> RankingData:
+        ranking_data = self._data_collector.collect_from_statistics(domain_stats)
+        return ranking_data
+
+    def can_collect_data_from_statistics(self) -> bool:
+        return self._data_collector.can_collect_from_statistics()
+
     @classmethod
     @abstractmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> RankingData:
@@ -92,6 +114,21 @@ class BaseMultiDomainRankingMethod(Generic[RankingData], metaclass=ABCMeta):
         ranking_data = self._data_collector.collect(domain_candidates)
         return ranking_data
 
+    def collect_pdf_statistics(
+        self, pdf_candidates: PDFCandidateTermList
+    ) -> PDFTermStatistics:
+        pdf_stats = self._data_collector.collect_pdf_statistics(pdf_candidates)
+        return pdf_stats
+
+    def collect_data_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> RankingData:
+        ranking_data = self._data_collector.collect_from_statistics(domain_stats)
+        return ranking_data
+
+    def can_collect_data_from_statistics(self) -> bool:
+        return self._data_collector.can_collect_from_statistics()
+
     @classmethod
     @abstractmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> RankingData:
@@ -1,15 +1,38 @@
-from abc import ABCMeta, abstractmethod
-from typing import Generic
+from abc import ABCMeta
+from typing import List, Generic, Optional
 
 from ..rankingdata.base import RankingData
-from py_slides_term.candidates import DomainCandidateTermList
+from py_slides_term.candidates import DomainCandidateTermList, PDFCandidateTermList
+from py_slides_term.analysis import (
+    TermStatisticsAnalyzer,
+    PDFTermStatistics,
+    DomainTermStatistics,
+)
 
 
 class BaseRankingDataCollector(Generic[RankingData], metaclass=ABCMeta):
     # public
-    def __init__(self):
-        pass
+    def __init__(self, statistics: Optional[List[str]] = None):
+        # statistics needed by the collector are collected in a single pass
+        self._stats_analyzer = TermStatisticsAnalyzer(statistics=statistics)
 
-    @abstractmethod
     def collect(self, domain_candidates: DomainCandidateTermList) -> RankingData:
-        raise NotImplementedError(f"{self.__class__.__name__}.collect()")
+        domain_stats = self._stats_analyzer.analyze(domain_candidates)
+        return self.collect_from_statistics(domain_stats)
+
+    def collect_pdf_statistics(
+        self, pdf_candidates: PDFCandidateTermList
+    ) -> PDFTermStatistics:
+        return self._stats_analyzer.analyze_pdf(pdf_candidates)
+
+    def collect_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> RankingData:
+        # collectors which only override collect() do not implement this
+        raise NotImplementedError(
+            f"{self.__class__.__name__}.collect_from_statistics()"
+        )
+
+    def can_collect_from_statistics(self) -> bool:
+        cls_method = self.__class__.collect_from_statistics
+        return cls_method is not BaseRankingDataCollector.collect_from_statistics
@@ -1,36 +1,28 @@
 from .base import BaseRankingDataCollector
 from ..rankingdata import FLRHRankingData
-from py_slides_term.candidates import DomainCandidateTermList
-from py_slides_term.analysis import (
-    TermOccurrenceAnalyzer,
-    TermLeftRightFrequencyAnalyzer,
-    TermMaxsizeAnalyzer,
-)
+from py_slides_term.analysis import DomainTermStatistics
 
 
 class FLRHRankingDataCollector(BaseRankingDataCollector[FLRHRankingData]):
     # public
     def __init__(self, collect_charfont: bool = True):
-        super().__init__()
+        statistics = ["term_occurrence", "left_right_frequency"]
+        if collect_charfont:
+            statistics.append("term_maxsize")
+        super().__init__(statistics=statistics)
 
         self._collect_charfont = collect_charfont
 
-        self._termocc_analyzer = TermOccurrenceAnalyzer()
-        self._lrfreq_analyzer = TermLeftRightFrequencyAnalyzer()
-        self._maxsize_analyzer = TermMaxsizeAnalyzer()
-
-    def collect(self, domain_candidates: DomainCandidateTermList) -> FLRHRankingData:
-        termocc = self._termocc_analyzer.analyze(domain_candidates)
-        lrfreq = self._lrfreq_analyzer.analyze(domain_candidates)
-        maxsize = (
-            self._maxsize_analyzer.analyze(domain_candidates)
-            if self._collect_charfont
-            else None
-        )
+    def collect_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> FLRHRankingData:
+        lrfreq = domain_stats.to_left_right_frequency()
+        maxsize = domain_stats.to_term_maxsize() if self._collect_charfont else None
         return FLRHRankingData(
-            domain_candidates.domain,
-            termocc.term_freq,
+            domain_stats.domain,
+            domain_stats.to_candidate_vocabulary(),
+            domain_stats.to_term_freq(),
             lrfreq.left_freq,
             lrfreq.right_freq,
-            maxsize.term_maxsize if maxsize is not None else None,
+            maxsize,
         )
@@ -1,31 +1,29 @@
 from .base import BaseRankingDataCollector
 from ..rankingdata import LFIDFRankingData
-from py_slides_term.candidates import DomainCandidateTermList
-from py_slides_term.analysis import LinguOccurrenceAnalyzer, TermMaxsizeAnalyzer
+from py_slides_term.analysis import DomainTermStatistics
 
 
 class LFIDFRankingDataCollector(BaseRankingDataCollector[LFIDFRankingData]):
     # public
     def __init__(self, collect_charfont: bool = True):
-        super().__init__()
+        statistics = ["lingu_occurrence"]
+        if collect_charfont:
+            statistics.append("term_maxsize")
+        super().__init__(statistics=statistics)
 
         self._collect_charfont = collect_charfont
 
-        self._linguocc_analyzer = LinguOccurrenceAnalyzer()
-        self._maxsize_analyzer = TermMaxsizeAnalyzer()
-
-    def collect(self, domain_candidates: DomainCandidateTermList) -> LFIDFRankingData:
-        linguocc = self._linguocc_analyzer.analyze(domain_candidates)
-        num_docs = len(domain_candidates.pdfs)
-        maxsize = (
-            self._maxsize_analyzer.analyze(domain_candidates)
-            if self._collect_charfont
-            else None
-        )
+    def collect_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> LFIDFRankingData:
+        linguocc = domain_stats.to_lingu_occurrence()
+        num_docs = domain_stats.num_docs()
+        maxsize = domain_stats.to_term_maxsize() if self._collect_charfont else None
         return LFIDFRankingData(
-            domain_candidates.domain,
+            domain_stats.domain,
+            domain_stats.to_candidate_vocabulary(),
             linguocc.lingu_freq,
             linguocc.doc_lingu_freq,
             num_docs,
-            maxsize.term_maxsize if maxsize is not None else None,
+            maxsize,
         )
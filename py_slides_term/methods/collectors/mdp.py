@@ -1,28 +1,25 @@
 from .base import BaseRankingDataCollector
 from ..rankingdata import MDPRankingData
-from py_slides_term.candidates import DomainCandidateTermList
-from py_slides_term.analysis import TermOccurrenceAnalyzer, TermMaxsizeAnalyzer
+from py_slides_term.analysis import DomainTermStatistics
 
 
 class MDPRankingDataCollector(BaseRankingDataCollector[MDPRankingData]):
     # public
     def __init__(self, collect_charfont: bool = True):
-        super().__init__()
+        statistics = ["term_occurrence"]
+        if collect_charfont:
+            statistics.append("term_maxsize")
+        super().__init__(statistics=statistics)
 
         self._collect_charfont = collect_charfont
 
-        self._termocc_analyzer = TermOccurrenceAnalyzer()
-        self._maxsize_analyzer = TermMaxsizeAnalyzer()
-
-    def collect(self, domain_candidates: DomainCandidateTermList) -> MDPRankingData:
-        termocc = self._termocc_analyzer.analyze(domain_candidates)
-        maxsize = (
-            self._maxsize_analyzer.analyze(domain_candidates)
-            if self._collect_charfont
-            else None
-        )
+    def collect_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> MDPRankingData:
+        maxsize = domain_stats.to_term_maxsize() if self._collect_charfont else None
         return MDPRankingData(
-            domain_candidates.domain,
-            termocc.term_freq,
-            maxsize.term_maxsize if maxsize is not None else None,
+            domain_stats.domain,
+            domain_stats.to_candidate_vocabulary(),
+            domain_stats.to_term_freq(),
+            maxsize,
         )
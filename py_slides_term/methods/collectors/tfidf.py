@@ -1,31 +1,28 @@
 from .base import BaseRankingDataCollector
 from ..rankingdata import TFIDFRankingData
-from py_slides_term.candidates import DomainCandidateTermList
-from py_slides_term.analysis import TermOccurrenceAnalyzer, TermMaxsizeAnalyzer
+from py_slides_term.analysis import DomainTermStatistics
 
 
 class TFIDFRankingDataCollector(BaseRankingDataCollector[TFIDFRankingData]):
     # public
     def __init__(self, collect_charfont: bool = True):
-        super().__init__()
+        statistics = ["term_occurrence"]
+        if collect_charfont:
+            statistics.append("term_maxsize")
+        super().__init__(statistics=statistics)
 
         self._collect_charfont = collect_charfont
 
-        self._termocc_analyzer = TermOccurrenceAnalyzer()
-        self._maxsize_analyzer = TermMaxsizeAnalyzer()
-
-    def collect(self, domain_candidates: DomainCandidateTermList) -> TFIDFRankingData:
-        termocc = self._termocc_analyzer.analyze(domain_candidates)
-        num_docs = len(domain_candidates.pdfs)
-        maxsize = (
-            self._maxsize_analyzer.analyze(domain_candidates)
-            if self._collect_charfont
-            else None
-        )
+    def collect_from_statistics(
+        self, domain_stats: DomainTermStatistics
+    ) -> TFIDFRankingData:
+        num_docs = domain_stats.num_docs()
+        maxsize = domain_stats.to_term_maxsize() if self._collect_charfont else None
         return TFIDFRankingData(
-            domain_candidates.domain,
-            termocc.term_freq,
-            termocc.doc_term_freq,
+            domain_stats.domain,
+            domain_stats.to_candidate_vocabulary(),
+            domain_stats.to_term_freq(),
+            domain_stats.to_doc_term_freq(),
             num_docs,
-            maxsize.term_maxsize if maxsize is not None else None,
+            maxsize,
         )
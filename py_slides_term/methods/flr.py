@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Literal
 
 from .base import BaseSingleDomainRankingMethod
 from .rankingdata import FLRRankingData
@@ -8,11 +8,15 @@ from .rankers import FLRRanker
 
 class FLRMethod(BaseSingleDomainRankingMethod[FLRRankingData]):
     # public
-    def __init__(self, consider_charfont: bool = True):
+    def __init__(
+        self,
+        consider_charfont: bool = True,
+        engine: Literal["python", "numpy"] = "python",
+    ):
         collector = FLRRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = FLRRanker()
+        ranker = FLRRanker(engine=engine)
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> FLRRankingData:
-        return FLRRankingData(**obj)
+        return FLRRankingData.from_json(obj)
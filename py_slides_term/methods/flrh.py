@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Literal
 
 from .base import BaseSingleDomainRankingMethod
 from .rankingdata import FLRHRankingData
@@ -8,11 +8,23 @@ from .rankers import FLRHRanker
 
 class FLRHMethod(BaseSingleDomainRankingMethod[FLRHRankingData]):
     # public
-    def __init__(self, threshold: float = 1e-8, consider_charfont: bool = True):
+    def __init__(
+        self,
+        threshold: float = 1e-8,
+        consider_charfont: bool = True,
+        max_iterations: Optional[int] = None,
+        hits_engine: Literal["python", "sparse"] = "python",
+        warm_start: bool = False,
+    ):
         collector = FLRHRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = FLRHRanker(threshold=threshold)
+        ranker = FLRHRanker(
+            threshold=threshold,
+            max_iterations=max_iterations,
+            hits_engine=hits_engine,
+            warm_start=warm_start,
+        )
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> FLRHRankingData:
-        return FLRHRankingData(**obj)
+        return FLRHRankingData.from_json(obj)
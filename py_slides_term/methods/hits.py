@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Literal
 
 from .base import BaseSingleDomainRankingMethod
 from .rankingdata import HITSRankingData
@@ -8,11 +8,23 @@ from .rankers import HITSRanker
 
 class HITSMethod(BaseSingleDomainRankingMethod[HITSRankingData]):
     # public
-    def __init__(self, threshold: float = 1e-8, consider_charfont: bool = True):
+    def __init__(
+        self,
+        threshold: float = 1e-8,
+        consider_charfont: bool = True,
+        max_iterations: Optional[int] = None,
+        engine: Literal["python", "sparse"] = "python",
+        warm_start: bool = False,
+    ):
         collector = HITSRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = HITSRanker(threshold=threshold)
+        ranker = HITSRanker(
+            threshold=threshold,
+            max_iterations=max_iterations,
+            engine=engine,
+            warm_start=warm_start,
+        )
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> HITSRankingData:
-        return HITSRankingData(**obj)
+        return HITSRankingData.from_json(obj)
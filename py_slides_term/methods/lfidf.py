@@ -13,11 +13,12 @@ class LFIDFMethod(BaseMultiDomainRankingMethod[LFIDFRankingData]):
         tfmode: Literal["natural", "log", "augmented", "logave", "binary"] = "log",
         idfmode: Literal["natural", "smooth", "prob", "unary"] = "natural",
         consider_charfont: bool = True,
+        engine: Literal["python", "numpy"] = "python",
     ):
         collector = LFIDFRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = LFIDFRanker(tfmode=tfmode, idfmode=idfmode)
+        ranker = LFIDFRanker(tfmode=tfmode, idfmode=idfmode, engine=engine)
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> LFIDFRankingData:
-        return LFIDFRankingData(**obj)
+        return LFIDFRankingData.from_json(obj)
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Literal
 
 from .base import BaseSingleDomainRankingMethod
 from .rankingdata import MCValueRankingData
@@ -8,11 +8,15 @@ from .rankers import MCValueRanker
 
 class MCValueMethod(BaseSingleDomainRankingMethod[MCValueRankingData]):
     # public
-    def __init__(self, consider_charfont: bool = True):
+    def __init__(
+        self,
+        consider_charfont: bool = True,
+        engine: Literal["python", "numpy"] = "python",
+    ):
         collector = MCValueRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = MCValueRanker()
+        ranker = MCValueRanker(engine=engine)
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> MCValueRankingData:
-        return MCValueRankingData(**obj)
+        return MCValueRankingData.from_json(obj)
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Callable, Iterable
+from typing import Dict, Any, Callable, Iterable, Literal
 
 from .base import BaseMultiDomainRankingMethod
 from .rankingdata import MDPRankingData
@@ -12,11 +12,12 @@ class MDPMethod(BaseMultiDomainRankingMethod[MDPRankingData]):
         self,
         compile_scores: Callable[[Iterable[float]], float] = min,
         consider_charfont: bool = True,
+        engine: Literal["python", "numpy"] = "python",
     ):
         collector = MDPRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = MDPRanker(compile_scores=compile_scores)
+        ranker = MDPRanker(compile_scores=compile_scores, engine=engine)
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> MDPRankingData:
-        return MDPRankingData(**obj)
+        return MDPRankingData.from_json(obj)
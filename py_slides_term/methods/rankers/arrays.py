@@ -0,0 +1,27 @@
+# helpers of the "numpy" engine of rankers
+# numpy is an optional dependency, so this module is imported only by the engine
+from typing import List, Any
+
+import numpy as np
+
+from ..data import DomainTermRanking
+from py_slides_term.share.data import ScoredTerm
+
+
+def extended_log10_array(x: Any) -> Any:
+    # element-wise version of py_slides_term.share.utils.extended_log10
+    x = np.asarray(x, dtype=float)
+    return np.sign(x) * np.log10(np.abs(x) + 1.0)
+
+
+def create_ranking_from_scores(
+    domain: str, candidate_strs: List[str], scores: Any
+) -> DomainTermRanking:
+    # stable sort keeps candidates with exactly the same score in candidate order
+    # scores are equal to those of the "python" engine only up to rounding errors
+    # (about 1e-15), so candidates with nearly equal scores may be ranked
+    # in a different order from the "python" engine
+    order = np.argsort(-np.asarray(scores, dtype=float), kind="stable")
+    score_list: List[float] = np.asarray(scores, dtype=float).tolist()
+    ranking = [ScoredTerm(candidate_strs[i], score_list[i]) for i in order.tolist()]
+    return DomainTermRanking(domain, ranking)
@@ -1,10 +1,14 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Generic
+from typing import List, Dict, Any, Generic, Optional
 
 from ..rankingdata.base import RankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
 
+# "numpy" engine scores all candidates at once with array operations
+# its scores match the "python" engine up to floating-point rounding errors
+RANKER_ENGINES = ["python", "numpy"]
+
 
 class BaseSingleDomainRanker(Generic[RankingData], metaclass=ABCMeta):
     # public
@@ -19,6 +23,15 @@ class BaseSingleDomainRanker(Generic[RankingData], metaclass=ABCMeta):
     ) -> DomainTermRanking:
         raise NotImplementedError(f"{self.__class__.__name__}.rank_terms()")
 
+    def get_warm_start_data(self, domain: str) -> Optional[Dict[str, Any]]:
+        # warm start data is a result of the last ranking of the domain,
+        # which is used as a starting point of the next ranking of the domain
+        # rankers without iterative computation have no warm start data
+        return None
+
+    def set_warm_start_data(self, domain: str, obj: Dict[str, Any]):
+        pass
+
 
 class BaseMultiDomainRanker(Generic[RankingData], metaclass=ABCMeta):
     # public
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from typing import List, Dict, Generic, Hashable, TypeVar
+
+from py_slides_term.analysis import TermVocabulary
+
+CorpusKey = TypeVar("CorpusKey", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class CorpusFrequency(Generic[CorpusKey]):
+    max_freq: Dict[CorpusKey, int]
+    # max of frequencies of the key over all domains
+    freq_sum: Dict[CorpusKey, int]
+    # sum of frequencies of the key over all domains
+    doc_freq: Dict[CorpusKey, int]
+    # number of documents in all domains that contain the key
+    num_domains: int
+    # number of domains
+    num_docs: int
+    # number of documents in all domains
+
+
+@dataclass(frozen=True)
+class TermCorpusFrequency:
+    domain_term_ids: Dict[str, List[int]]
+    # ids of terms of the domain in the vocabulary of all domains
+    # this is indexed by ids of the vocabulary of the domain
+    max_freq: List[int]
+    # max of frequencies of the term over all domains
+    freq_sum: List[int]
+    # sum of frequencies of the term over all domains
+    doc_freq: List[int]
+    # number of documents in all domains that contain the term
+    num_domains: int
+    # number of domains
+    num_docs: int
+    # number of documents in all domains
+
+
+def create_corpus_frequency(
+    freq_list: List[Dict[CorpusKey, int]],
+    doc_freq_list: List[Dict[CorpusKey, int]],
+    num_docs_list: List[int],
+) -> CorpusFrequency[CorpusKey]:
+    max_freq: Dict[CorpusKey, int] = dict()
+    freq_sum: Dict[CorpusKey, int] = dict()
+    for freq in freq_list:
+        for key, value in freq.items():
+            max_freq[key] = max(max_freq.get(key, 0), value)
+            freq_sum[key] = freq_sum.get(key, 0) + value
+
+    doc_freq: Dict[CorpusKey, int] = dict()
+    for domain_doc_freq in doc_freq_list:
+        for key, value in domain_doc_freq.items():
+            doc_freq[key] = doc_freq.get(key, 0) + value
+
+    return CorpusFrequency(
+        max_freq, freq_sum, doc_freq, len(freq_list), sum(num_docs_list)
+    )
+
+
+def create_term_corpus_frequency(
+    domain_list: List[str],
+    vocab_list: List[TermVocabulary],
+    freq_list: List[List[int]],
+    doc_freq_list: List[List[int]],
+    num_docs_list: List[int],
+) -> TermCorpusFrequency:
+    # terms of all domains are interned into a vocabulary of the corpus once
+    # and then counted by ids instead of strings
+    corpus_vocab = TermVocabulary()
+    domain_term_ids = {
+        domain: list(map(corpus_vocab.intern, vocab.terms()))
+        for domain, vocab in zip(domain_list, vocab_list)
+    }
+
+    max_freq = [0] * len(corpus_vocab)
+    freq_sum = [0] * len(corpus_vocab)
+    doc_freq = [0] * len(corpus_vocab)
+    for domain, freq, domain_doc_freq in zip(domain_list, freq_list, doc_freq_list):
+        term_ids = domain_term_ids[domain]
+        for term_id, value in zip(term_ids, freq):
+            max_freq[term_id] = max(max_freq[term_id], value)
+            freq_sum[term_id] += value
+        for term_id, value in zip(term_ids, domain_doc_freq):
+            doc_freq[term_id] += value
+
+    return TermCorpusFrequency(
+        domain_term_ids,
+        max_freq,
+        freq_sum,
+        doc_freq,
+        len(freq_list),
+        sum(num_docs_list),
+    )
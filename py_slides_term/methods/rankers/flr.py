@@ -1,6 +1,7 @@
 from math import log10
+from typing import List, Dict, Literal
 
-from .base import BaseSingleDomainRanker
+from .base import BaseSingleDomainRanker, RANKER_ENGINES
 from ..rankingdata import FLRRankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
@@ -14,13 +15,20 @@ from py_slides_term.share.data import Term, ScoredTerm
 
 class FLRRanker(BaseSingleDomainRanker[FLRRankingData]):
     # public
-    def __init__(self):
+    def __init__(self, engine: Literal["python", "numpy"] = "python"):
+        if engine not in RANKER_ENGINES:
+            raise ValueError(f"unknown ranker engine '{engine}'")
+
+        self._engine = engine
         self._ja_classifier = JapaneseMorphemeClassifier()
         self._en_classifier = EnglishMorphemeClassifier()
 
     def rank_terms(
         self, domain_candidates: DomainCandidateTermList, ranking_data: FLRRankingData
     ) -> DomainTermRanking:
+        if self._engine == "numpy":
+            return self._rank_terms_numpy(domain_candidates, ranking_data)
+
         domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
         ranking = list(
             map(
@@ -32,10 +40,71 @@ class FLRRanker(BaseSingleDomainRanker[FLRRankingData]):
         return DomainTermRanking(domain_candidates.domain, ranking)
 
     # private
+    def _rank_terms_numpy(
+        self, domain_candidates: DomainCandidateTermList, ranking_data: FLRRankingData
+    ) -> DomainTermRanking:
+        import numpy as np
+        from .arrays import create_ranking_from_scores
+
+        domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
+        candidate_strs = list(domain_candidates_dict.candidates.keys())
+
+        # meaningful morphemes of candidates are laid out in a flat array
+        morpheme_ids: Dict[str, int] = dict()
+        morpheme_owners: List[int] = []
+        morpheme_indices: List[int] = []
+        num_meaningful_morphemes: List[int] = []
+        for candidate_id, candidate in enumerate(
+            domain_candidates_dict.candidates.values()
+        ):
+            num_meaningful = 0
+            for morpheme in candidate.morphemes:
+                if self._is_meaningless_morpheme(morpheme):
+                    continue
+                morpheme_str = str(morpheme)
+                morpheme_id = morpheme_ids.setdefault(morpheme_str, len(morpheme_ids))
+                morpheme_owners.append(candidate_id)
+                morpheme_indices.append(morpheme_id)
+                num_meaningful += 1
+            num_meaningful_morphemes.append(num_meaningful)
+
+        left_scores = np.array(
+            [sum(ranking_data.left_freq[m].values()) for m in morpheme_ids], dtype=float
+        )
+        right_scores = np.array(
+            [sum(ranking_data.right_freq[m].values()) for m in morpheme_ids],
+            dtype=float,
+        )
+        morpheme_scores = 0.5 * (np.log10(left_scores + 1) + np.log10(right_scores + 1))
+
+        concat_scores = np.bincount(
+            np.array(morpheme_owners, dtype=np.int64),
+            weights=morpheme_scores[np.array(morpheme_indices, dtype=np.int64)],
+            minlength=len(candidate_strs),
+        ) / np.array(num_meaningful_morphemes, dtype=float)
+
+        term_ids = np.array(
+            [ranking_data.vocab[c] for c in candidate_strs], dtype=np.int64
+        )
+        term_maxsize_scores = (
+            np.log10(np.array(ranking_data.term_maxsize, dtype=float)[term_ids])
+            if ranking_data.term_maxsize is not None
+            else np.zeros(len(candidate_strs))
+        )
+        term_freq_scores = np.log10(
+            np.array(ranking_data.term_freq, dtype=float)[term_ids]
+        )
+
+        scores = term_maxsize_scores + term_freq_scores + concat_scores
+        return create_ranking_from_scores(
+            domain_candidates.domain, candidate_strs, scores
+        )
+
     def _calculate_score(
         self, candidate: Term, ranking_data: FLRRankingData
     ) -> ScoredTerm:
         candidate_str = str(candidate)
+        term_id = ranking_data.vocab[candidate_str]
         num_morphemes = len(candidate.morphemes)
         num_meaningless_morphemes = sum(
             map(
@@ -45,11 +114,11 @@ class FLRRanker(BaseSingleDomainRanker[FLRRankingData]):
         )
 
         term_maxsize_score = (
-            log10(ranking_data.term_maxsize[candidate_str])
+            log10(ranking_data.term_maxsize[term_id])
             if ranking_data.term_maxsize is not None
             else 0.0
         )
-        term_freq_score = log10(ranking_data.term_freq[candidate_str])
+        term_freq_score = log10(ranking_data.term_freq[term_id])
 
         concat_score = 0.0
         for morpheme in candidate.morphemes:
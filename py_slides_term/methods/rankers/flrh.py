@@ -1,3 +1,5 @@
+from typing import Dict, Any, Optional, Literal
+
 from .base import BaseSingleDomainRanker
 from .flr import FLRRanker
 from .hits import HITSRanker, HITSAuthHubData
@@ -11,15 +13,27 @@ from py_slides_term.share.data import Term, ScoredTerm
 # FLRHRanker is a friend of FLRRanker and HITSRanker
 class FLRHRanker(BaseSingleDomainRanker[FLRHRankingData]):
     # public
-    def __init__(self, threshold: float = 1e-8):
+    def __init__(
+        self,
+        threshold: float = 1e-8,
+        max_iterations: Optional[int] = None,
+        hits_engine: Literal["python", "sparse"] = "python",
+        warm_start: bool = False,
+    ):
         self._flr_ranker = FLRRanker()
-        self._hits_ranker = HITSRanker(threshold=threshold)
+        self._hits_ranker = HITSRanker(
+            threshold=threshold,
+            max_iterations=max_iterations,
+            engine=hits_engine,
+            warm_start=warm_start,
+        )
 
     def rank_terms(
         self, domain_candidates: DomainCandidateTermList, ranking_data: FLRHRankingData
     ) -> DomainTermRanking:
         flr_ranking_data = FLRRankingData(
             ranking_data.domain,
+            ranking_data.vocab,
             ranking_data.term_freq,
             ranking_data.left_freq,
             ranking_data.right_freq,
@@ -27,6 +41,7 @@ class FLRHRanker(BaseSingleDomainRanker[FLRHRankingData]):
         )
         hits_ranking_data = HITSRankingData(
             ranking_data.domain,
+            ranking_data.vocab,
             ranking_data.term_freq,
             ranking_data.left_freq,
             ranking_data.right_freq,
@@ -46,6 +61,12 @@ class FLRHRanker(BaseSingleDomainRanker[FLRHRankingData]):
         ranking.sort(key=lambda term: -term.score)
         return DomainTermRanking(domain_candidates.domain, ranking)
 
+    def get_warm_start_data(self, domain: str) -> Optional[Dict[str, Any]]:
+        return self._hits_ranker.get_warm_start_data(domain)
+
+    def set_warm_start_data(self, domain: str, obj: Dict[str, Any]):
+        self._hits_ranker.set_warm_start_data(domain, obj)
+
     # public
     def _calculate_score(
         self,
@@ -1,6 +1,7 @@
 from math import sqrt, log10
+from itertools import chain
 from dataclasses import dataclass
-from typing import Dict
+from typing import List, Tuple, Dict, Optional, Any, Literal
 
 from .base import BaseSingleDomainRanker
 from ..rankingdata import HITSRankingData
@@ -24,12 +25,52 @@ class HITSAuthHubData:
     # hub value of the term
     # the more morphemes is linked from, the larger the hub value becomes
     # initial hub value is 1.0
+    num_iterations: int = 0
+    # number of power iterations performed
+    residual: float = 0.0
+    # max absolute change of auth and hub values in the last iteration
+    # if this is not less than the threshold, the iteration was stopped by the cap
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "morpheme_auth": self.morpheme_auth,
+            "morpheme_hub": self.morpheme_hub,
+            "num_iterations": self.num_iterations,
+            "residual": self.residual,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        return cls(
+            obj["morpheme_auth"],
+            obj["morpheme_hub"],
+            obj.get("num_iterations", 0),
+            obj.get("residual", 0.0),
+        )
+
+
+HITS_ENGINES = ["python", "sparse"]
 
 
 class HITSRanker(BaseSingleDomainRanker[HITSRankingData]):
     # public
-    def __init__(self, threshold: float = 1e-8):
+    def __init__(
+        self,
+        threshold: float = 1e-8,
+        max_iterations: Optional[int] = None,
+        engine: Literal["python", "sparse"] = "python",
+        warm_start: bool = False,
+    ):
+        if max_iterations is not None and max_iterations < 0:
+            raise ValueError("max_iterations must be a non-negative integer or None")
+        if engine not in HITS_ENGINES:
+            raise ValueError(f"unknown HITS engine '{engine}'")
+
         self._threshold = threshold
+        self._max_iterations = max_iterations
+        self._engine = engine
+        self._warm_start = warm_start
+        self._last_auth_hub_data: Dict[str, HITSAuthHubData] = dict()
         self._ja_classifier = JapaneseMorphemeClassifier()
         self._en_classifier = EnglishMorphemeClassifier()
 
@@ -49,17 +90,47 @@ class HITSRanker(BaseSingleDomainRanker[HITSRankingData]):
         ranking.sort(key=lambda term: -term.score)
         return DomainTermRanking(domain_candidates.domain, ranking)
 
+    def get_warm_start_data(self, domain: str) -> Optional[Dict[str, Any]]:
+        auth_hub_data = self._last_auth_hub_data.get(domain)
+        return auth_hub_data.to_json() if auth_hub_data is not None else None
+
+    def set_warm_start_data(self, domain: str, obj: Dict[str, Any]):
+        if self._warm_start:
+            self._last_auth_hub_data[domain] = HITSAuthHubData.from_json(obj)
+
     # private
     def _create_auth_hub_data(self, ranking_data: HITSRankingData) -> HITSAuthHubData:
-        morpheme_auth: Dict[str, float] = {
-            morpheme: 1.0 for morpheme in ranking_data.left_freq
-        }
-        morpheme_hub: Dict[str, float] = {
-            morpheme: 1.0 for morpheme in ranking_data.right_freq
-        }
+        initial_auth_hub_data = (
+            self._last_auth_hub_data.get(ranking_data.domain)
+            if self._warm_start
+            else None
+        )
 
-        converged = False
-        while not converged:
+        if self._engine == "sparse":
+            auth_hub_data = self._create_auth_hub_data_sparse(
+                ranking_data, initial_auth_hub_data
+            )
+        else:
+            auth_hub_data = self._create_auth_hub_data_python(
+                ranking_data, initial_auth_hub_data
+            )
+
+        if self._warm_start:
+            self._last_auth_hub_data[ranking_data.domain] = auth_hub_data
+        return auth_hub_data
+
+    def _create_auth_hub_data_python(
+        self,
+        ranking_data: HITSRankingData,
+        initial_auth_hub_data: Optional[HITSAuthHubData],
+    ) -> HITSAuthHubData:
+        morpheme_auth, morpheme_hub = self._create_initial_auth_hub(
+            ranking_data, initial_auth_hub_data
+        )
+
+        num_iterations = 0
+        residual = float("inf")
+        while not self._is_finished(num_iterations, residual):
             new_morpheme_auth = {
                 morpheme: sum(map(lambda hub: morpheme_hub[hub], left.keys()), 0.0)
                 for morpheme, left in ranking_data.left_freq.items()
@@ -80,23 +151,130 @@ class HITSRanker(BaseSingleDomainRanker[HITSRankingData]):
                 for morpheme, hub_score in new_morpheme_hub.items()
             }
 
-            converged = all(
-                [
-                    abs(new_morpheme_auth[morpheme] - morpheme_auth[morpheme])
-                    < self._threshold
-                    for morpheme in ranking_data.left_freq
-                ]
-                + [
-                    abs(new_morpheme_hub[morpheme] - morpheme_hub[morpheme])
-                    < self._threshold
-                    for morpheme in ranking_data.right_freq
-                ]
+            residual = max(
+                chain(
+                    (
+                        abs(new_morpheme_auth[morpheme] - morpheme_auth[morpheme])
+                        for morpheme in ranking_data.left_freq
+                    ),
+                    (
+                        abs(new_morpheme_hub[morpheme] - morpheme_hub[morpheme])
+                        for morpheme in ranking_data.right_freq
+                    ),
+                ),
+                default=0.0,
             )
+            num_iterations += 1
 
             morpheme_auth = new_morpheme_auth
             morpheme_hub = new_morpheme_hub
 
-        return HITSAuthHubData(morpheme_auth, morpheme_hub)
+        return HITSAuthHubData(morpheme_auth, morpheme_hub, num_iterations, residual)
+
+    def _create_auth_hub_data_sparse(
+        self,
+        ranking_data: HITSRankingData,
+        initial_auth_hub_data: Optional[HITSAuthHubData],
+    ) -> HITSAuthHubData:
+        # numpy and scipy are optional dependencies required only by this engine
+        import numpy as np
+
+        auth_morphemes = list(ranking_data.left_freq)
+        hub_morphemes = list(ranking_data.right_freq)
+        # (auth, hub) is nonzero iff hub is in left_freq[auth]
+        left_matrix = self._create_adjacency_matrix(
+            ranking_data.left_freq, hub_morphemes
+        )
+        # (hub, auth) is nonzero iff auth is in right_freq[hub]
+        right_matrix = self._create_adjacency_matrix(
+            ranking_data.right_freq, auth_morphemes
+        )
+
+        initial_auth, initial_hub = self._create_initial_auth_hub(
+            ranking_data, initial_auth_hub_data
+        )
+        morpheme_auth = np.array(list(initial_auth.values()), dtype=float)
+        morpheme_hub = np.array(list(initial_hub.values()), dtype=float)
+
+        num_iterations = 0
+        residual = float("inf")
+        while not self._is_finished(num_iterations, residual):
+            new_morpheme_auth = left_matrix @ morpheme_hub
+            auth_norm = np.linalg.norm(new_morpheme_auth)
+            if auth_norm > 0.0:
+                new_morpheme_auth /= auth_norm
+
+            new_morpheme_hub = right_matrix @ morpheme_auth
+            hub_norm = np.linalg.norm(new_morpheme_hub)
+            if hub_norm > 0.0:
+                new_morpheme_hub /= hub_norm
+
+            residual = max(
+                float(np.abs(new_morpheme_auth - morpheme_auth).max(initial=0.0)),
+                float(np.abs(new_morpheme_hub - morpheme_hub).max(initial=0.0)),
+            )
+            num_iterations += 1
+
+            morpheme_auth = new_morpheme_auth
+            morpheme_hub = new_morpheme_hub
+
+        return HITSAuthHubData(
+            dict(zip(auth_morphemes, morpheme_auth.tolist())),
+            dict(zip(hub_morphemes, morpheme_hub.tolist())),
+            num_iterations,
+            residual,
+        )
+
+    def _create_initial_auth_hub(
+        self,
+        ranking_data: HITSRankingData,
+        initial_auth_hub_data: Optional[HITSAuthHubData],
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        if initial_auth_hub_data is None:
+            morpheme_auth = {morpheme: 1.0 for morpheme in ranking_data.left_freq}
+            morpheme_hub = {morpheme: 1.0 for morpheme in ranking_data.right_freq}
+            return morpheme_auth, morpheme_hub
+
+        # values of the last ranking are reused
+        # and morphemes new to the domain start from the normalized initial value
+        last_auth = initial_auth_hub_data.morpheme_auth
+        default_auth = 1.0 / sqrt(max(len(ranking_data.left_freq), 1))
+        morpheme_auth = {
+            morpheme: last_auth.get(morpheme, default_auth)
+            for morpheme in ranking_data.left_freq
+        }
+        last_hub = initial_auth_hub_data.morpheme_hub
+        default_hub = 1.0 / sqrt(max(len(ranking_data.right_freq), 1))
+        morpheme_hub = {
+            morpheme: last_hub.get(morpheme, default_hub)
+            for morpheme in ranking_data.right_freq
+        }
+        return morpheme_auth, morpheme_hub
+
+    def _create_adjacency_matrix(
+        self, morpheme_freq: Dict[str, Dict[str, int]], column_morphemes: List[str]
+    ) -> Any:
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        column_index = {morpheme: i for i, morpheme in enumerate(column_morphemes)}
+        indptr = [0]
+        indices: List[int] = []
+        for neighbors in morpheme_freq.values():
+            indices.extend(map(lambda neighbor: column_index[neighbor], neighbors))
+            indptr.append(len(indices))
+
+        return csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(len(morpheme_freq), len(column_morphemes)),
+        )
+
+    def _is_finished(self, num_iterations: int, residual: float) -> bool:
+        if residual < self._threshold:
+            return True
+        return (
+            self._max_iterations is not None and num_iterations >= self._max_iterations
+        )
 
     def _calculate_score(
         self,
@@ -116,12 +294,13 @@ class HITSRanker(BaseSingleDomainRanker[HITSRankingData]):
         if num_morphemes == 0:
             return ScoredTerm(candidate_str, 0.0)
 
+        term_id = ranking_data.vocab[candidate_str]
         term_maxsize_score = (
-            log10(ranking_data.term_maxsize[candidate_str])
+            log10(ranking_data.term_maxsize[term_id])
             if ranking_data.term_maxsize is not None
             else 0.0
         )
-        term_freq_score = log10(ranking_data.term_freq[candidate_str])
+        term_freq_score = log10(ranking_data.term_freq[term_id])
 
         if num_morphemes == 1:
             morpheme_str = str(candidate.morphemes[0])
@@ -1,7 +1,8 @@
 from math import log10
-from typing import List, Literal
+from typing import List, Tuple, Any, Optional, Literal
 
-from .base import BaseMultiDomainRanker
+from .base import BaseMultiDomainRanker, RANKER_ENGINES
+from .corpus import CorpusFrequency, create_corpus_frequency
 from ..rankingdata import LFIDFRankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
@@ -15,15 +16,26 @@ class LFIDFRanker(BaseMultiDomainRanker[LFIDFRankingData]):
         self,
         tfmode: Literal["natural", "log", "augmented", "logave", "binary"] = "log",
         idfmode: Literal["natural", "smooth", "prob", "unary"] = "natural",
+        engine: Literal["python", "numpy"] = "python",
     ):
+        if engine not in RANKER_ENGINES:
+            raise ValueError(f"unknown ranker engine '{engine}'")
+
+        self._engine = engine
         self._tfmode = tfmode
         self._idfmode = idfmode
+        self._corpus_cache: Optional[
+            Tuple[List[LFIDFRankingData], CorpusFrequency[LinguSeq]]
+        ] = None
 
     def rank_terms(
         self,
         domain_candidates: DomainCandidateTermList,
         ranking_data_list: List[LFIDFRankingData],
     ) -> DomainTermRanking:
+        if self._engine == "numpy":
+            return self._rank_terms_numpy(domain_candidates, ranking_data_list)
+
         domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
         ranking_data = next(
             filter(
@@ -31,10 +43,11 @@ class LFIDFRanker(BaseMultiDomainRanker[LFIDFRankingData]):
                 ranking_data_list,
             )
         )
+        corpus_freq = self._get_corpus_frequency(ranking_data_list)
         ranking = list(
             map(
                 lambda candidate: self._calculate_score(
-                    candidate, ranking_data, ranking_data_list
+                    candidate, ranking_data, corpus_freq
                 ),
                 domain_candidates_dict.candidates.values(),
             )
@@ -42,19 +55,121 @@ class LFIDFRanker(BaseMultiDomainRanker[LFIDFRankingData]):
         ranking.sort(key=lambda term: -term.score)
         return DomainTermRanking(domain_candidates.domain, ranking)
 
+    # private
+    def _rank_terms_numpy(
+        self,
+        domain_candidates: DomainCandidateTermList,
+        ranking_data_list: List[LFIDFRankingData],
+    ) -> DomainTermRanking:
+        import numpy as np
+        from .arrays import extended_log10_array, create_ranking_from_scores
+
+        domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
+        candidate_strs = list(domain_candidates_dict.candidates.keys())
+        ranking_data = next(
+            filter(
+                lambda item: item.domain == domain_candidates.domain,
+                ranking_data_list,
+            )
+        )
+        keys = [
+            candidate.linguistic_sequence()
+            for candidate in domain_candidates_dict.candidates.values()
+        ]
+
+        corpus_freq = self._get_corpus_frequency(ranking_data_list)
+        lfs = np.array([ranking_data.lingu_freq[key] for key in keys], dtype=float)
+        max_lfs = np.array([corpus_freq.max_freq[key] for key in keys], dtype=float)
+        lf_sums = np.array([corpus_freq.freq_sum[key] for key in keys], dtype=float)
+        dfs = np.array([corpus_freq.doc_freq.get(key, 0) for key in keys], dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lf_scores = self._calculate_lf_array(
+                lfs, max_lfs, lf_sums / corpus_freq.num_domains
+            )
+            idf_scores = self._calculate_idf_array(corpus_freq.num_docs, dfs)
+
+        term_ids = np.array(
+            [ranking_data.vocab[c] for c in candidate_strs], dtype=np.int64
+        )
+        term_maxsizes = (
+            np.array(ranking_data.term_maxsize, dtype=float)[term_ids]
+            if ranking_data.term_maxsize is not None
+            else np.ones(len(candidate_strs))
+        )
+        scores = extended_log10_array(term_maxsizes * lf_scores * idf_scores)
+        return create_ranking_from_scores(
+            domain_candidates.domain, candidate_strs, scores
+        )
+
+    def _calculate_lf_array(self, lfs: Any, max_lfs: Any, ave_lfs: Any) -> Any:
+        import numpy as np
+
+        # the same quirk as _calculate_lf() is kept for parity with the "python" engine
+        if self._idfmode == "natural":
+            return lfs
+        elif self._tfmode == "log":
+            return np.where(lfs > 0.0, 1.0 * np.log10(lfs), 0.0)
+        elif self._tfmode == "augmented":
+            return 0.5 + 0.5 * lfs / max_lfs
+        elif self._tfmode == "logave":
+            return np.where(
+                lfs > 0.0, (1.0 + np.log10(lfs)) / (1.0 + np.log10(ave_lfs)), 0.0
+            )
+        else:
+            return np.where(lfs > 0.0, 1.0, 0.0)
+
+    def _calculate_idf_array(self, num_docs: int, dfs: Any) -> Any:
+        import numpy as np
+
+        if self._idfmode == "natural":
+            return np.log10(num_docs / dfs)
+        if self._idfmode == "smooth":
+            return np.log10(num_docs / (dfs + 1)) + 1.0
+        elif self._idfmode == "prob":
+            # the same as the "python" engine, see _calculate_idf()
+            return np.where(
+                dfs < num_docs, np.maximum(np.log10((num_docs - dfs) / dfs), 0.0), 0.0
+            )
+        else:
+            return np.ones(len(dfs))
+
+    def _get_corpus_frequency(
+        self, ranking_data_list: List[LFIDFRankingData]
+    ) -> CorpusFrequency[LinguSeq]:
+        # the corpus frequency is computed once and reused
+        # while the same ranking data are given, e.g. when all domains are ranked
+        if self._corpus_cache is not None:
+            cached_ranking_data_list, corpus_freq = self._corpus_cache
+            if len(cached_ranking_data_list) == len(ranking_data_list) and all(
+                map(
+                    lambda pair: pair[0] is pair[1],
+                    zip(cached_ranking_data_list, ranking_data_list),
+                )
+            ):
+                return corpus_freq
+
+        corpus_freq = create_corpus_frequency(
+            list(map(lambda data: data.lingu_freq, ranking_data_list)),
+            list(map(lambda data: data.doc_freq, ranking_data_list)),
+            list(map(lambda data: data.num_docs, ranking_data_list)),
+        )
+        self._corpus_cache = (list(ranking_data_list), corpus_freq)
+        return corpus_freq
+
     def _calculate_score(
         self,
         candidate: Term,
         ranking_data: LFIDFRankingData,
-        ranking_data_list: List[LFIDFRankingData],
+        corpus_freq: CorpusFrequency[LinguSeq],
     ) -> ScoredTerm:
         candidate_str = str(candidate)
         lingu_seq = candidate.linguistic_sequence()
 
-        lf = self._calculate_lf(lingu_seq, ranking_data, ranking_data_list)
-        idf = self._calculate_idf(lingu_seq, ranking_data, ranking_data_list)
+        lf = self._calculate_lf(lingu_seq, ranking_data, corpus_freq)
+        idf = self._calculate_idf(lingu_seq, ranking_data, corpus_freq)
         term_maxsize = (
-            ranking_data.term_maxsize[candidate_str]
+            ranking_data.term_maxsize[ranking_data.vocab[candidate_str]]
             if ranking_data.term_maxsize is not None
             else 1.0
         )
@@ -65,17 +180,15 @@ class LFIDFRanker(BaseMultiDomainRanker[LFIDFRankingData]):
         self,
         lingu_seq: LinguSeq,
         ranking_data: LFIDFRankingData,
-        ranking_data_list: List[LFIDFRankingData],
+        corpus_freq: CorpusFrequency[LinguSeq],
     ) -> float:
         lf = ranking_data.lingu_freq[lingu_seq]
-        max_lf = max(
-            map(lambda data: data.lingu_freq.get(lingu_seq, 0), ranking_data_list)
-        )
-        lf_sum = sum(
-            map(lambda data: data.lingu_freq.get(lingu_seq, 0), ranking_data_list)
-        )
-        ave_lf = lf_sum / len(ranking_data_list)
+        max_lf = corpus_freq.max_freq[lingu_seq]
+        ave_lf = corpus_freq.freq_sum[lingu_seq] / corpus_freq.num_domains
 
+        # the lf is not scaled by tfmode when idfmode is "natural"
+        # this checks idfmode rather than tfmode on purpose
+        # since the default rankings (tfmode "log", idfmode "natural") depend on it
         if self._idfmode == "natural":
             return lf
         elif self._tfmode == "log":
@@ -91,16 +204,18 @@ class LFIDFRanker(BaseMultiDomainRanker[LFIDFRankingData]):
         self,
         lingu_seq: LinguSeq,
         ranking_data: LFIDFRankingData,
-        ranking_data_list: List[LFIDFRankingData],
+        corpus_freq: CorpusFrequency[LinguSeq],
     ) -> float:
-        num_docs = sum(map(lambda data: data.num_docs, ranking_data_list))
-        df = sum(map(lambda data: data.doc_freq.get(lingu_seq, 0), ranking_data_list))
+        num_docs = corpus_freq.num_docs
+        df = corpus_freq.doc_freq.get(lingu_seq, 0)
 
         if self._idfmode == "natural":
             return log10(num_docs / df)
         if self._idfmode == "smooth":
             return log10(num_docs / (df + 1)) + 1.0
         elif self._idfmode == "prob":
-            return max(log10((num_docs - df) / df), 0.0)
+            # a term in all documents gets the clamped idf of zero
+            # instead of failing on log10(0)
+            return max(log10((num_docs - df) / df), 0.0) if df < num_docs else 0.0
         else:
             return 1.0
@@ -1,5 +1,7 @@
 from math import log10
-from .base import BaseSingleDomainRanker
+from typing import List, Literal
+
+from .base import BaseSingleDomainRanker, RANKER_ENGINES
 from ..rankingdata import MCValueRankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
@@ -9,14 +11,20 @@ from py_slides_term.share.utils import extended_log10
 
 class MCValueRanker(BaseSingleDomainRanker[MCValueRankingData]):
     # public
-    def __init__(self):
-        pass
+    def __init__(self, engine: Literal["python", "numpy"] = "python"):
+        if engine not in RANKER_ENGINES:
+            raise ValueError(f"unknown ranker engine '{engine}'")
+
+        self._engine = engine
 
     def rank_terms(
         self,
         domain_candidates: DomainCandidateTermList,
         ranking_data: MCValueRankingData,
     ) -> DomainTermRanking:
+        if self._engine == "numpy":
+            return self._rank_terms_numpy(domain_candidates, ranking_data)
+
         domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
         ranking = list(
             map(
@@ -28,13 +36,69 @@ class MCValueRanker(BaseSingleDomainRanker[MCValueRankingData]):
         return DomainTermRanking(domain_candidates.domain, ranking)
 
     # private
+    def _rank_terms_numpy(
+        self,
+        domain_candidates: DomainCandidateTermList,
+        ranking_data: MCValueRankingData,
+    ) -> DomainTermRanking:
+        import numpy as np
+        from .arrays import extended_log10_array, create_ranking_from_scores
+
+        domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
+        candidate_strs = list(domain_candidates_dict.candidates.keys())
+        candidates = list(domain_candidates_dict.candidates.values())
+        term_ids = np.array(
+            [ranking_data.vocab[c] for c in candidate_strs], dtype=np.int64
+        )
+
+        # containers of candidates are laid out in a flat array
+        container_owners: List[int] = []
+        container_ids: List[int] = []
+        for candidate_id, term_id in enumerate(term_ids.tolist()):
+            containers = ranking_data.container_terms[term_id]
+            container_owners.extend([candidate_id] * len(containers))
+            container_ids.extend(containers)
+
+        term_freq_array = np.array(ranking_data.term_freq, dtype=float)
+        owners = np.array(container_owners, dtype=np.int64)
+        term_freqs = term_freq_array[term_ids]
+        num_containers = np.bincount(owners, minlength=len(candidates)).astype(float)
+        container_freqs = np.bincount(
+            owners,
+            weights=term_freq_array[np.array(container_ids, dtype=np.int64)],
+            minlength=len(candidates),
+        )
+
+        term_len_scores = np.log10(
+            np.array([len(c.morphemes) for c in candidates], dtype=float)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            freq_scores = extended_log10_array(
+                np.where(
+                    num_containers > 0,
+                    term_freqs - container_freqs / num_containers,
+                    term_freqs,
+                )
+            )
+        term_maxsize_scores = (
+            np.log10(np.array(ranking_data.term_maxsize, dtype=float)[term_ids])
+            if ranking_data.term_maxsize is not None
+            else np.zeros(len(candidates))
+        )
+
+        scores = term_len_scores + freq_scores + term_maxsize_scores
+        return create_ranking_from_scores(
+            domain_candidates.domain, candidate_strs, scores
+        )
+
     def _calculate_score(
         self, candidate: Term, ranking_data: MCValueRankingData
     ) -> ScoredTerm:
         candidate_str = str(candidate)
+        term_id = ranking_data.vocab[candidate_str]
 
-        term_freq = ranking_data.term_freq[candidate_str]
-        container_terms = ranking_data.container_terms[candidate_str]
+        term_freq = ranking_data.term_freq[term_id]
+        container_terms = ranking_data.container_terms[term_id]
         num_containers = len(container_terms)
         container_freq = sum(
             map(
@@ -50,7 +114,7 @@ class MCValueRanker(BaseSingleDomainRanker[MCValueRankingData]):
             else term_freq
         )
         term_maxsize_score = (
-            log10(ranking_data.term_maxsize[candidate_str])
+            log10(ranking_data.term_maxsize[term_id])
             if ranking_data.term_maxsize is not None
             else 0.0
         )
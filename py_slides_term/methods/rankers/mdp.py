@@ -1,6 +1,6 @@
-from typing import List, Callable, Iterable
+from typing import List, Any, Callable, Iterable, Literal
 
-from .base import BaseMultiDomainRanker
+from .base import BaseMultiDomainRanker, RANKER_ENGINES
 from ..rankingdata import MDPRankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
@@ -10,14 +10,25 @@ from py_slides_term.share.utils import extended_log10
 
 class MDPRanker(BaseMultiDomainRanker[MDPRankingData]):
     # public
-    def __init__(self, compile_scores: Callable[[Iterable[float]], float] = min):
+    def __init__(
+        self,
+        compile_scores: Callable[[Iterable[float]], float] = min,
+        engine: Literal["python", "numpy"] = "python",
+    ):
+        if engine not in RANKER_ENGINES:
+            raise ValueError(f"unknown ranker engine '{engine}'")
+
         self._compile_scores = compile_scores
+        self._engine = engine
 
     def rank_terms(
         self,
         domain_candidates: DomainCandidateTermList,
         ranking_data_list: List[MDPRankingData],
     ) -> DomainTermRanking:
+        if self._engine == "numpy":
+            return self._rank_terms_numpy(domain_candidates, ranking_data_list)
+
         domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
         ranking_data = next(
             filter(
@@ -43,6 +54,97 @@ class MDPRanker(BaseMultiDomainRanker[MDPRankingData]):
         return DomainTermRanking(domain_candidates.domain, ranking)
 
     # private
+    def _rank_terms_numpy(
+        self,
+        domain_candidates: DomainCandidateTermList,
+        ranking_data_list: List[MDPRankingData],
+    ) -> DomainTermRanking:
+        import numpy as np
+        from .arrays import extended_log10_array, create_ranking_from_scores
+
+        domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
+        candidate_strs = list(domain_candidates_dict.candidates.keys())
+        ranking_data = next(
+            filter(
+                lambda item: item.domain == domain_candidates.domain,
+                ranking_data_list,
+            )
+        )
+        other_ranking_data_list = list(
+            filter(
+                lambda item: item.domain != domain_candidates.domain,
+                ranking_data_list,
+            )
+        )
+
+        our_term_ids = np.array(
+            [ranking_data.vocab[c] for c in candidate_strs], dtype=np.int64
+        )
+        our_term_maxsizes = (
+            np.array(ranking_data.term_maxsize, dtype=float)[our_term_ids]
+            if ranking_data.term_maxsize is not None
+            else np.ones(len(candidate_strs))
+        )
+        our_term_freqs = np.array(ranking_data.term_freq, dtype=float)[our_term_ids]
+        our_num_terms = ranking_data.num_terms
+
+        # (other domain, candidate) matrix of z-values
+        zvalues_list: List[Any] = []
+        for other_ranking_data in other_ranking_data_list:
+            # candidates which are not terms of the other domain have id -1,
+            # which points to zero appended to the end of the arrays
+            their_vocab = other_ranking_data.vocab
+            their_term_ids = np.array(
+                [their_vocab[c] if c in their_vocab else -1 for c in candidate_strs],
+                dtype=np.int64,
+            )
+            their_term_maxsizes = (
+                np.append(other_ranking_data.term_maxsize, 0.0)[their_term_ids]
+                if other_ranking_data.term_maxsize is not None
+                else np.ones(len(candidate_strs))
+            )
+            their_term_freqs = np.append(other_ranking_data.term_freq, 0.0)[
+                their_term_ids
+            ]
+            their_num_terms = other_ranking_data.num_terms
+
+            our_term_probs = our_term_freqs / our_num_terms
+            their_term_probs = their_term_freqs / their_num_terms
+            term_probs = (our_term_freqs + their_term_freqs) / (
+                our_num_terms + their_num_terms
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                zvalues_list.append(
+                    extended_log10_array(
+                        (
+                            our_term_maxsizes * our_term_probs
+                            - their_term_maxsizes * their_term_probs
+                        )
+                        / (
+                            term_probs
+                            * (1.0 - term_probs)
+                            * (1 / our_num_terms + 1 / their_num_terms)
+                        )
+                    )
+                )
+
+        zvalue_matrix = np.array(zvalues_list, dtype=float).reshape(
+            len(other_ranking_data_list), len(candidate_strs)
+        )
+        if self._compile_scores is min:
+            scores = zvalue_matrix.min(axis=0)
+        elif self._compile_scores is max:
+            scores = zvalue_matrix.max(axis=0)
+        else:
+            scores = np.array(
+                [self._compile_scores(column) for column in zvalue_matrix.T.tolist()],
+                dtype=float,
+            )
+
+        return create_ranking_from_scores(
+            domain_candidates.domain, candidate_strs, scores
+        )
+
     def _calculate_score(
         self,
         candidate: Term,
@@ -67,20 +169,28 @@ class MDPRanker(BaseMultiDomainRanker[MDPRankingData]):
         their_ranking_data: MDPRankingData,
     ) -> float:
         candidate_str = str(candidate)
+        our_term_id = our_ranking_data.vocab[candidate_str]
+        # the candidate may not be a term of the other domain
+        their_term_id = their_ranking_data.vocab.get_id(candidate_str)
 
         our_term_maxsize = (
-            our_ranking_data.term_maxsize[candidate_str]
+            our_ranking_data.term_maxsize[our_term_id]
             if our_ranking_data.term_maxsize is not None
             else 1.0
         )
-        their_term_maxsize = (
-            their_ranking_data.term_maxsize.get(candidate_str, 0.0)
-            if their_ranking_data.term_maxsize is not None
-            else 1.0
-        )
+        if their_ranking_data.term_maxsize is None:
+            their_term_maxsize = 1.0
+        elif their_term_id is None:
+            their_term_maxsize = 0.0
+        else:
+            their_term_maxsize = their_ranking_data.term_maxsize[their_term_id]
 
-        our_term_freq = our_ranking_data.term_freq[candidate_str]
-        their_term_freq = their_ranking_data.term_freq.get(candidate_str, 0)
+        our_term_freq = our_ranking_data.term_freq[our_term_id]
+        their_term_freq = (
+            their_ranking_data.term_freq[their_term_id]
+            if their_term_id is not None
+            else 0
+        )
 
         our_inum_terms = 1 / our_ranking_data.num_terms
         their_inum_terms = 1 / their_ranking_data.num_terms
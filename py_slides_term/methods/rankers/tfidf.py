@@ -1,7 +1,8 @@
 from math import log10
-from typing import List, Literal
+from typing import List, Tuple, Any, Optional, Literal
 
-from .base import BaseMultiDomainRanker
+from .base import BaseMultiDomainRanker, RANKER_ENGINES
+from .corpus import TermCorpusFrequency, create_term_corpus_frequency
 from ..rankingdata import TFIDFRankingData
 from ..data import DomainTermRanking
 from py_slides_term.candidates import DomainCandidateTermList
@@ -15,15 +16,26 @@ class TFIDFRanker(BaseMultiDomainRanker[TFIDFRankingData]):
         self,
         tfmode: Literal["natural", "log", "augmented", "logave", "binary"] = "log",
         idfmode: Literal["natural", "smooth", "prob", "unary"] = "natural",
+        engine: Literal["python", "numpy"] = "python",
     ):
+        if engine not in RANKER_ENGINES:
+            raise ValueError(f"unknown ranker engine '{engine}'")
+
+        self._engine = engine
         self._tfmode = tfmode
         self._idfmode = idfmode
+        self._corpus_cache: Optional[
+            Tuple[List[TFIDFRankingData], TermCorpusFrequency]
+        ] = None
 
     def rank_terms(
         self,
         domain_candidates: DomainCandidateTermList,
         ranking_data_list: List[TFIDFRankingData],
     ) -> DomainTermRanking:
+        if self._engine == "numpy":
+            return self._rank_terms_numpy(domain_candidates, ranking_data_list)
+
         domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
         ranking_data = next(
             filter(
@@ -31,10 +43,11 @@ class TFIDFRanker(BaseMultiDomainRanker[TFIDFRankingData]):
                 ranking_data_list,
             )
         )
+        corpus_freq = self._get_corpus_frequency(ranking_data_list)
         ranking = list(
             map(
                 lambda candidate: self._calculate_score(
-                    candidate, ranking_data, ranking_data_list
+                    candidate, ranking_data, corpus_freq
                 ),
                 domain_candidates_dict.candidates.values(),
             )
@@ -43,18 +56,122 @@ class TFIDFRanker(BaseMultiDomainRanker[TFIDFRankingData]):
         return DomainTermRanking(domain_candidates.domain, ranking)
 
     # private
+    def _rank_terms_numpy(
+        self,
+        domain_candidates: DomainCandidateTermList,
+        ranking_data_list: List[TFIDFRankingData],
+    ) -> DomainTermRanking:
+        import numpy as np
+        from .arrays import extended_log10_array, create_ranking_from_scores
+
+        domain_candidates_dict = domain_candidates.to_domain_candidate_term_dict()
+        candidate_strs = list(domain_candidates_dict.candidates.keys())
+        ranking_data = next(
+            filter(
+                lambda item: item.domain == domain_candidates.domain,
+                ranking_data_list,
+            )
+        )
+
+        corpus_freq = self._get_corpus_frequency(ranking_data_list)
+        term_ids = np.array(
+            [ranking_data.vocab[c] for c in candidate_strs], dtype=np.int64
+        )
+        corpus_term_ids = np.array(
+            corpus_freq.domain_term_ids[ranking_data.domain], dtype=np.int64
+        )[term_ids]
+        tfs = np.array(ranking_data.term_freq, dtype=float)[term_ids]
+        max_tfs = np.array(corpus_freq.max_freq, dtype=float)[corpus_term_ids]
+        tf_sums = np.array(corpus_freq.freq_sum, dtype=float)[corpus_term_ids]
+        dfs = np.array(corpus_freq.doc_freq, dtype=float)[corpus_term_ids]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tf_scores = self._calculate_tf_array(
+                tfs, max_tfs, tf_sums / corpus_freq.num_domains
+            )
+            idf_scores = self._calculate_idf_array(corpus_freq.num_docs, dfs)
+
+        term_maxsizes = (
+            np.array(ranking_data.term_maxsize, dtype=float)[term_ids]
+            if ranking_data.term_maxsize is not None
+            else np.ones(len(candidate_strs))
+        )
+        scores = extended_log10_array(term_maxsizes * tf_scores * idf_scores)
+        return create_ranking_from_scores(
+            domain_candidates.domain, candidate_strs, scores
+        )
+
+    def _calculate_tf_array(self, tfs: Any, max_tfs: Any, ave_tfs: Any) -> Any:
+        import numpy as np
+
+        # the same quirk as _calculate_tf() is kept for parity with the "python" engine
+        if self._idfmode == "natural":
+            return tfs
+        elif self._tfmode == "log":
+            return np.where(tfs > 0.0, 1.0 * np.log10(tfs), 0.0)
+        elif self._tfmode == "augmented":
+            return 0.5 + 0.5 * tfs / max_tfs
+        elif self._tfmode == "logave":
+            return np.where(
+                tfs > 0.0, (1.0 + np.log10(tfs)) / (1.0 + np.log10(ave_tfs)), 0.0
+            )
+        else:
+            return np.where(tfs > 0.0, 1.0, 0.0)
+
+    def _calculate_idf_array(self, num_docs: int, dfs: Any) -> Any:
+        import numpy as np
+
+        if self._idfmode == "natural":
+            return np.log10(num_docs / dfs)
+        if self._idfmode == "smooth":
+            return np.log10(num_docs / (dfs + 1)) + 1.0
+        elif self._idfmode == "prob":
+            # the same as the "python" engine, see _calculate_idf()
+            return np.where(
+                dfs < num_docs, np.maximum(np.log10((num_docs - dfs) / dfs), 0.0), 0.0
+            )
+        else:
+            return np.ones(len(dfs))
+
+    def _get_corpus_frequency(
+        self, ranking_data_list: List[TFIDFRankingData]
+    ) -> TermCorpusFrequency:
+        # the corpus frequency is computed once and reused
+        # while the same ranking data are given, e.g. when all domains are ranked
+        if self._corpus_cache is not None:
+            cached_ranking_data_list, corpus_freq = self._corpus_cache
+            if len(cached_ranking_data_list) == len(ranking_data_list) and all(
+                map(
+                    lambda pair: pair[0] is pair[1],
+                    zip(cached_ranking_data_list, ranking_data_list),
+                )
+            ):
+                return corpus_freq
+
+        corpus_freq = create_term_corpus_frequency(
+            list(map(lambda data: data.domain, ranking_data_list)),
+            list(map(lambda data: data.vocab, ranking_data_list)),
+            list(map(lambda data: data.term_freq, ranking_data_list)),
+            list(map(lambda data: data.doc_freq, ranking_data_list)),
+            list(map(lambda data: data.num_docs, ranking_data_list)),
+        )
+        self._corpus_cache = (list(ranking_data_list), corpus_freq)
+        return corpus_freq
+
     def _calculate_score(
         self,
         candidate: Term,
         ranking_data: TFIDFRankingData,
-        ranking_data_list: List[TFIDFRankingData],
+        corpus_freq: TermCorpusFrequency,
     ) -> ScoredTerm:
         candidate_str = str(candidate)
+        term_id = ranking_data.vocab[candidate_str]
+        corpus_term_id = corpus_freq.domain_term_ids[ranking_data.domain][term_id]
 
-        tf = self._calculate_tf(candidate_str, ranking_data, ranking_data_list)
-        idf = self._calculate_idf(candidate_str, ranking_data, ranking_data_list)
+        tf = self._calculate_tf(term_id, corpus_term_id, ranking_data, corpus_freq)
+        idf = self._calculate_idf(corpus_term_id, ranking_data, corpus_freq)
         term_maxsize = (
-            ranking_data.term_maxsize[candidate_str]
+            ranking_data.term_maxsize[term_id]
             if ranking_data.term_maxsize is not None
             else 1.0
         )
@@ -63,19 +180,18 @@ class TFIDFRanker(BaseMultiDomainRanker[TFIDFRankingData]):
 
     def _calculate_tf(
         self,
-        candidate: str,
+        term_id: int,
+        corpus_term_id: int,
         ranking_data: TFIDFRankingData,
-        ranking_data_list: List[TFIDFRankingData],
+        corpus_freq: TermCorpusFrequency,
     ) -> float:
-        tf = ranking_data.term_freq[candidate]
-        max_tf = max(
-            map(lambda data: data.term_freq.get(candidate, 0), ranking_data_list)
-        )
-        tf_sum = sum(
-            map(lambda data: data.term_freq.get(candidate, 0), ranking_data_list)
-        )
-        ave_tf = tf_sum / len(ranking_data_list)
+        tf = ranking_data.term_freq[term_id]
+        max_tf = corpus_freq.max_freq[corpus_term_id]
+        ave_tf = corpus_freq.freq_sum[corpus_term_id] / corpus_freq.num_domains
 
+        # the tf is not scaled by tfmode when idfmode is "natural"
+        # this checks idfmode rather than tfmode on purpose
+        # since the default rankings (tfmode "log", idfmode "natural") depend on it
         if self._idfmode == "natural":
             return tf
         elif self._tfmode == "log":
@@ -89,18 +205,20 @@ class TFIDFRanker(BaseMultiDomainRanker[TFIDFRankingData]):
 
     def _calculate_idf(
         self,
-        candidate: str,
+        corpus_term_id: int,
         ranking_data: TFIDFRankingData,
-        ranking_data_list: List[TFIDFRankingData],
+        corpus_freq: TermCorpusFrequency,
     ) -> float:
-        num_docs = sum(map(lambda data: data.num_docs, ranking_data_list))
-        df = sum(map(lambda data: data.doc_freq.get(candidate, 0), ranking_data_list))
+        num_docs = corpus_freq.num_docs
+        df = corpus_freq.doc_freq[corpus_term_id]
 
         if self._idfmode == "natural":
             return log10(num_docs / df)
         if self._idfmode == "smooth":
             return log10(num_docs / (df + 1)) + 1.0
         elif self._idfmode == "prob":
-            return max(log10((num_docs - df) / df), 0.0)
+            # a term in all documents gets the clamped idf of zero
+            # instead of failing on log10(0)
+            return max(log10((num_docs - df) / df), 0.0) if df < num_docs else 0.0
         else:
             return 1.0
@@ -1,14 +1,18 @@
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import List, Dict, Any, Optional
 
 from .base import BaseRankingData
+from py_slides_term.analysis import TermVocabulary
 
 
 @dataclass(frozen=True)
 class FLRRankingData(BaseRankingData):
     domain: str
     # unique domain name
-    term_freq: Dict[str, int]
+    vocab: TermVocabulary
+    # vocabulary of candidate terms in the domain
+    # statistics of terms below are lists indexed by ids of the vocabulary
+    term_freq: List[int]
     # brute force counting of term occurrences in the domain
     # count even if the term occurs as a part of a phrase
     left_freq: Dict[str, Dict[str, int]]
@@ -19,6 +23,38 @@ class FLRRankingData(BaseRankingData):
     # number of occurrences of (morpheme, right) in the domain
     # if morpheme or right is meaningless (a modifying particle or a symbol),
     # this is fixed at zero
-    term_maxsize: Optional[Dict[str, float]] = None
+    term_maxsize: Optional[List[float]] = None
     # max fontsize of the term in the domain
     # default of this is 1.0
+
+    def to_json(self) -> Dict[str, Any]:
+        terms = self.vocab.terms()
+        term_maxsize = (
+            dict(zip(terms, self.term_maxsize))
+            if self.term_maxsize is not None
+            else None
+        )
+        return {
+            "domain": self.domain,
+            "term_freq": dict(zip(terms, self.term_freq)),
+            "left_freq": self.left_freq,
+            "right_freq": self.right_freq,
+            "term_maxsize": term_maxsize,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        vocab = TermVocabulary(obj["term_freq"])
+        term_maxsize = (
+            list(map(lambda term: obj["term_maxsize"][term], vocab.terms()))
+            if obj["term_maxsize"] is not None
+            else None
+        )
+        return cls(
+            obj["domain"],
+            vocab,
+            list(obj["term_freq"].values()),
+            obj["left_freq"],
+            obj["right_freq"],
+            term_maxsize,
+        )
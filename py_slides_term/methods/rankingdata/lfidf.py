@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import List, Dict, Any, Optional
 
 from .base import BaseRankingData
+from py_slides_term.analysis import TermVocabulary
 from py_slides_term.share.data import LinguSeq
 
 
@@ -9,6 +10,9 @@ from py_slides_term.share.data import LinguSeq
 class LFIDFRankingData(BaseRankingData):
     domain: str
     # unique domain name
+    vocab: TermVocabulary
+    # vocabulary of candidate terms in the domain
+    # term_maxsize is a list indexed by ids of the vocabulary
     lingu_freq: Dict[LinguSeq, int]
     # brute force counting of linguistic sequence occurrences in the domain
     # count even if the term occurs as a part of a phrase
@@ -17,6 +21,52 @@ class LFIDFRankingData(BaseRankingData):
     # count even if the term occurs as a part of a phrase
     num_docs: int
     # number of documents in the domain
-    term_maxsize: Optional[Dict[str, float]] = None
+    term_maxsize: Optional[List[float]] = None
     # max fontsize of the term in the domain
     # default of this is 1.0
+
+    def to_json(self) -> Dict[str, Any]:
+        # linguistic sequences are not valid keys of JSON objects
+        terms = self.vocab.terms()
+        term_maxsize = (
+            dict(zip(terms, self.term_maxsize))
+            if self.term_maxsize is not None
+            else None
+        )
+        return {
+            "domain": self.domain,
+            "terms": terms,
+            "lingu_freq": [
+                [list(map(list, lingu_seq)), freq]
+                for lingu_seq, freq in self.lingu_freq.items()
+            ],
+            "doc_freq": [
+                [list(map(list, lingu_seq)), freq]
+                for lingu_seq, freq in self.doc_freq.items()
+            ],
+            "num_docs": self.num_docs,
+            "term_maxsize": term_maxsize,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        vocab = TermVocabulary(obj["terms"])
+        lingu_freq = {
+            tuple(map(tuple, lingu_seq)): freq for lingu_seq, freq in obj["lingu_freq"]
+        }
+        doc_freq = {
+            tuple(map(tuple, lingu_seq)): freq for lingu_seq, freq in obj["doc_freq"]
+        }
+        term_maxsize = (
+            list(map(lambda term: obj["term_maxsize"][term], vocab.terms()))
+            if obj["term_maxsize"] is not None
+            else None
+        )
+        return cls(
+            obj["domain"],
+            vocab,
+            lingu_freq,
+            doc_freq,
+            obj["num_docs"],
+            term_maxsize,
+        )
@@ -1,40 +1,67 @@
 from dataclasses import dataclass
-from typing import Set, Dict, Any, Optional
+from typing import List, Set, Dict, Any, Optional
 
 from .base import BaseRankingData
+from py_slides_term.analysis import TermVocabulary
 
 
 @dataclass(frozen=True)
 class MCValueRankingData(BaseRankingData):
     domain: str
     # unique domain name
-    term_freq: Dict[str, int]
+    vocab: TermVocabulary
+    # vocabulary of candidate terms in the domain
+    # statistics of terms below are lists indexed by ids of the vocabulary
+    term_freq: List[int]
     # brute force counting of term occurrences in the domain
     # count even if the term occurs as a part of a phrase
-    container_terms: Dict[str, Set[str]]
+    container_terms: List[Set[int]]
     # set of containers of the term in the domain
     # (term, container) is valid iff the container contains the term
     # as a proper subsequence
-    term_maxsize: Optional[Dict[str, float]] = None
+    term_maxsize: Optional[List[float]] = None
     # max fontsize of the term in the domain
     # default of this is 1.0
 
     def to_json(self) -> Dict[str, Any]:
+        terms = self.vocab.terms()
         container_terms = {
-            term: list(containers) for term, containers in self.container_terms.items()
+            term: list(map(self.vocab.get_term, containers))
+            for term, containers in zip(terms, self.container_terms)
         }
+        term_maxsize = (
+            dict(zip(terms, self.term_maxsize))
+            if self.term_maxsize is not None
+            else None
+        )
         return {
             "domain": self.domain,
-            "term_freq": self.term_freq,
+            "term_freq": dict(zip(terms, self.term_freq)),
             "container_terms": container_terms,
-            "term_maxsize": self.term_maxsize,
+            "term_maxsize": term_maxsize,
         }
 
     @classmethod
     def from_json(cls, obj: Dict[str, Any]):
-        container_terms = {
-            term: set(containers) for term, containers in obj["container_terms"].items()
-        }
+        vocab = TermVocabulary(obj["term_freq"])
+        container_terms = [
+            set(
+                map(
+                    lambda container: vocab[container],
+                    obj["container_terms"].get(term, []),
+                )
+            )
+            for term in vocab.terms()
+        ]
+        term_maxsize = (
+            list(map(lambda term: obj["term_maxsize"][term], vocab.terms()))
+            if obj["term_maxsize"] is not None
+            else None
+        )
         return MCValueRankingData(
-            obj["domain"], obj["term_freq"], container_terms, obj["term_maxsize"]
+            obj["domain"],
+            vocab,
+            list(obj["term_freq"].values()),
+            container_terms,
+            term_maxsize,
         )
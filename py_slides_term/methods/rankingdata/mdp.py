@@ -1,22 +1,51 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import List, Dict, Any, Optional
 
 from .base import BaseRankingData
+from py_slides_term.analysis import TermVocabulary
 
 
 @dataclass(frozen=True)
 class MDPRankingData(BaseRankingData):
     domain: str
     # unique domain name
-    term_freq: Dict[str, int]
+    vocab: TermVocabulary
+    # vocabulary of candidate terms in the domain
+    # statistics of terms below are lists indexed by ids of the vocabulary
+    term_freq: List[int]
     # brute force counting of term occurrences in the domain
     # count even if the term occurs as a part of a phrase
     num_terms: int = field(init=False)
     # brute force counting of all terms occurrences in the domain
     # count even if the term occurs as a part of a phrase
-    term_maxsize: Optional[Dict[str, float]] = None
+    term_maxsize: Optional[List[float]] = None
     # max fontsize of the term in the domain
     # default of this is 1.0
 
     def __post_init__(self):
-        object.__setattr__(self, "num_terms", sum(self.term_freq.values()))
+        object.__setattr__(self, "num_terms", sum(self.term_freq))
+
+    def to_json(self) -> Dict[str, Any]:
+        terms = self.vocab.terms()
+        term_maxsize = (
+            dict(zip(terms, self.term_maxsize))
+            if self.term_maxsize is not None
+            else None
+        )
+        return {
+            "domain": self.domain,
+            "term_freq": dict(zip(terms, self.term_freq)),
+            "num_terms": self.num_terms,
+            "term_maxsize": term_maxsize,
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, Any]):
+        # num_terms is not an argument since it is computed from term_freq
+        vocab = TermVocabulary(obj["term_freq"])
+        term_maxsize = (
+            list(map(lambda term: obj["term_maxsize"][term], vocab.terms()))
+            if obj["term_maxsize"] is not None
+            else None
+        )
+        return cls(obj["domain"], vocab, list(obj["term_freq"].values()), term_maxsize)
@@ -13,11 +13,12 @@ class TFIDFMethod(BaseMultiDomainRankingMethod[TFIDFRankingData]):
         tfmode: Literal["natural", "log", "augmented", "logave", "binary"] = "log",
         idfmode: Literal["natural", "smooth", "prob", "unary"] = "natural",
         consider_charfont: bool = True,
+        engine: Literal["python", "numpy"] = "python",
     ):
         collector = TFIDFRankingDataCollector(collect_charfont=consider_charfont)
-        ranker = TFIDFRanker(tfmode=tfmode, idfmode=idfmode)
+        ranker = TFIDFRanker(tfmode=tfmode, idfmode=idfmode, engine=engine)
         super().__init__(collector, ranker)
 
     @classmethod
     def collect_data_from_json(cls, obj: Dict[str, Any]) -> TFIDFRankingData:
-        return TFIDFRankingData(**obj)
+        return TFIDFRankingData.from_json(obj)
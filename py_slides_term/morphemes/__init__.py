@@ -1,11 +1,17 @@
-from .tokenizer import SpaCyTokenizer
+from .tokenizer import SpaCyTokenizer, MORPHEME_ATTRS
+from .cache import TokenizationCache, TokenizationCacheInfo
 from .classifiers import JapaneseMorphemeClassifier, EnglishMorphemeClassifier
 from .data import BaseMorpheme, SpaCyMorpheme
+from .table import MorphemeTable
 
 __all__ = [
     "SpaCyTokenizer",
+    "MORPHEME_ATTRS",
+    "TokenizationCache",
+    "TokenizationCacheInfo",
     "JapaneseMorphemeClassifier",
     "EnglishMorphemeClassifier",
     "BaseMorpheme",
     "SpaCyMorpheme",
+    "MorphemeTable",
 ]
@@ -0,0 +1,134 @@
+import os
+import json
+from hashlib import sha256
+from tempfile import mkstemp
+from threading import Lock
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .data import SpaCyMorpheme
+
+
+@dataclass(frozen=True)
+class TokenizationCacheInfo:
+    hits: int
+    # number of texts whose morphemes are found in the cache
+    misses: int
+    # number of texts whose morphemes are not found in the cache
+    size: int
+    # number of texts in the in-memory cache
+    max_size: Optional[int]
+    # None means the in-memory cache is unbounded
+
+
+class TokenizationCache:
+    # public
+    def __init__(
+        self, max_size: Optional[int] = 10000, cache_dir: Optional[str] = None
+    ):
+        if max_size is not None and max_size < 0:
+            raise ValueError("max_size must be a non-negative integer or None")
+
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+        self._memory: "OrderedDict[str, List[SpaCyMorpheme]]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, model_key: str, text: str) -> Optional[List[SpaCyMorpheme]]:
+        key = self._create_key(model_key, text)
+
+        with self._lock:
+            morphemes = self._memory.get(key)
+            if morphemes is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return list(morphemes)
+
+        morphemes = self._load_file(key)
+
+        with self._lock:
+            if morphemes is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._store_memory(key, morphemes)
+
+        return list(morphemes)
+
+    def store(self, model_key: str, text: str, morphemes: List[SpaCyMorpheme]):
+        key = self._create_key(model_key, text)
+
+        with self._lock:
+            self._store_memory(key, list(morphemes))
+
+        self._store_file(key, morphemes)
+
+    def cache_info(self) -> TokenizationCacheInfo:
+        with self._lock:
+            return TokenizationCacheInfo(
+                self._hits, self._misses, len(self._memory), self._max_size
+            )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._hits = 0
+            self._misses = 0
+
+    # private
+    def _create_key(self, model_key: str, text: str) -> str:
+        return sha256(json.dumps([model_key, text]).encode()).hexdigest()
+
+    def _store_memory(self, key: str, morphemes: List[SpaCyMorpheme]):
+        if self._max_size == 0:
+            return
+
+        self._memory[key] = morphemes
+        self._memory.move_to_end(key)
+        if self._max_size is not None and len(self._memory) > self._max_size:
+            self._memory.popitem(last=False)
+
+    def _load_file(self, key: str) -> Optional[List[SpaCyMorpheme]]:
+        if self._cache_dir is None:
+            return None
+
+        cache_file_path = self._create_file_path(key)
+        # a broken file is treated in the same way as a missing file
+        try:
+            with open(cache_file_path, "r", encoding="utf-8") as json_file:
+                obj = json.load(json_file)
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+        return list(map(lambda item: SpaCyMorpheme.from_json(item), obj))
+
+    def _store_file(self, key: str, morphemes: List[SpaCyMorpheme]):
+        if self._cache_dir is None:
+            return
+
+        cache_file_path = self._create_file_path(key)
+        cache_dir_path = os.path.dirname(cache_file_path)
+        os.makedirs(cache_dir_path, exist_ok=True)
+
+        # the file is written to a temporary file and renamed to the cache file
+        # so that other workers never read a half-written cache file
+        temp_fd, temp_file_path = mkstemp(
+            dir=cache_dir_path, prefix=f".{key}.", suffix=".tmp"
+        )
+        try:
+            with open(temp_fd, "w", encoding="utf-8") as json_file:
+                obj = list(map(lambda morpheme: morpheme.to_json(), morphemes))
+                json.dump(obj, json_file, ensure_ascii=False)
+            os.replace(temp_file_path, cache_file_path)
+        except BaseException:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+            raise
+
+    def _create_file_path(self, key: str) -> str:
+        # files are distributed over subdirectories to keep each directory small
+        return os.path.join(self._cache_dir or "", key[:2], f"{key}.json")
@@ -2,7 +2,10 @@ from abc import ABCMeta
 from dataclasses import dataclass, asdict
 from typing import Dict, Literal, ClassVar
 
+from py_slides_term.share.slots import add_slots
 
+
+@add_slots
 @dataclass(frozen=True)
 class BaseMorpheme(metaclass=ABCMeta):
     NUM_ATTR: ClassVar[int] = 5
@@ -24,6 +27,7 @@ class BaseMorpheme(metaclass=ABCMeta):
         return cls(**obj)
 
 
+@add_slots
 @dataclass(frozen=True)
 class SpaCyMorpheme(BaseMorpheme):
     NUM_ATTR: ClassVar[int] = 11
@@ -0,0 +1,56 @@
+from importlib import import_module
+from importlib.metadata import version, PackageNotFoundError
+from threading import Lock
+from typing import List, Dict, Tuple, Any, Literal
+
+SPACY_MODEL_NAMES: Dict[str, str] = {
+    "ja": "ja_core_news_sm",
+    "en": "en_core_web_sm",
+}
+
+
+class SpaCyModelRegistry:
+    # public
+    def __init__(self):
+        self._models: Dict[Tuple[str, Tuple[str, ...]], Any] = dict()
+        self._versions: Dict[str, str] = dict()
+        self._lock = Lock()
+
+    def get_model(
+        self, lang: Literal["ja", "en"], excluded_components: List[str]
+    ) -> Any:
+        key = (lang, tuple(sorted(set(excluded_components))))
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                # models are imported on first use to keep importing this package fast
+                model_module = import_module(SPACY_MODEL_NAMES[lang])
+                model = model_module.load(exclude=list(key[1]))
+                self._models[key] = model
+
+        return model
+
+    def get_model_version(self, lang: Literal["ja", "en"]) -> str:
+        with self._lock:
+            model_version = self._versions.get(lang)
+
+        if model_version is None:
+            # the version is looked up without loading the model if possible
+            try:
+                model_version = version(SPACY_MODEL_NAMES[lang])
+            except PackageNotFoundError:
+                model_version = str(self.get_model(lang, []).meta["version"])
+
+            with self._lock:
+                self._versions[lang] = model_version
+
+        return model_version
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self._versions.clear()
+
+
+# the registry shared by all tokenizers in the process
+spacy_model_registry = SpaCyModelRegistry()
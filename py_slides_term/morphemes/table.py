@@ -0,0 +1,39 @@
+from typing import List, Dict, Optional
+
+from .data import BaseMorpheme
+
+
+class MorphemeTable:
+    # public
+    def __init__(self):
+        self._morpheme_ids: Dict[BaseMorpheme, int] = dict()
+        self._morphemes: List[BaseMorpheme] = []
+
+    def intern(self, morpheme: BaseMorpheme) -> int:
+        morpheme_id = self._morpheme_ids.get(morpheme)
+        if morpheme_id is None:
+            # ids are assigned in order of first occurrence
+            morpheme_id = len(self._morphemes)
+            self._morpheme_ids[morpheme] = morpheme_id
+            self._morphemes.append(morpheme)
+        return morpheme_id
+
+    def canonicalize(self, morphemes: List[BaseMorpheme]) -> List[BaseMorpheme]:
+        # equal morphemes are replaced with the single object in the table
+        # so that they are shared by all terms instead of being duplicated
+        return [self._morphemes[self.intern(morpheme)] for morpheme in morphemes]
+
+    def get_id(self, morpheme: BaseMorpheme) -> Optional[int]:
+        return self._morpheme_ids.get(morpheme)
+
+    def get_morpheme(self, morpheme_id: int) -> BaseMorpheme:
+        return self._morphemes[morpheme_id]
+
+    def morphemes(self) -> List[BaseMorpheme]:
+        return list(self._morphemes)
+
+    def __len__(self) -> int:
+        return len(self._morphemes)
+
+    def __contains__(self, morpheme: object) -> bool:
+        return morpheme in self._morpheme_ids
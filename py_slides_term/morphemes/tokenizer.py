@@ -1,47 +1,153 @@
 import re
-from typing import List, Any
-import ja_core_news_sm
-import en_core_web_sm
+from typing import List, Dict, Tuple, Any, Iterable, Iterator, Optional, Literal, cast
 
 from .data import BaseMorpheme, SpaCyMorpheme
+from .cache import TokenizationCache, TokenizationCacheInfo
+from .registry import spacy_model_registry, SPACY_MODEL_NAMES
 from py_slides_term.share.consts import JAPANESE_REGEX, ALPHABET_REGEX, SYMBOL_REGEX
 
+MORPHEME_ATTRS = [
+    "pos",
+    "category",
+    "subcategory",
+    "subsubcategory",
+    "universal_tag",
+    "dep_relations",
+    "original_form",
+    "shape",
+    "is_stop",
+]
+
+# morpheme attributes which depend on the spaCy pipeline component
+# a component is not loaded unless some of its dependent attributes are needed
+# the other components (tokenizer, tok2vec) are always loaded
+COMPONENT_DEPENDENT_ATTRS: Dict[str, List[str]] = {
+    "tagger": ["pos", "category", "universal_tag", "original_form"],
+    "morphologizer": ["universal_tag"],
+    "attribute_ruler": ["pos", "universal_tag", "original_form"],
+    "lemmatizer": ["original_form"],
+    "parser": ["dep_relations"],
+    "senter": [],
+    "ner": [],
+}
+
 
 class SpaCyTokenizer:
     # public
-    def __init__(self):
-        # pyright:reportUnknownMemberType=false
-        self._ja_model = ja_core_news_sm.load()
-        self._en_model = en_core_web_sm.load()
+    def __init__(
+        self,
+        morpheme_attrs: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+        cache: Optional[TokenizationCache] = None,
+    ):
+        if morpheme_attrs is None:
+            morpheme_attrs = MORPHEME_ATTRS
+
+        for attr in morpheme_attrs:
+            if attr not in MORPHEME_ATTRS:
+                raise ValueError(f"unknown morpheme attribute '{attr}'")
+
+        # models are loaded lazily and shared through the registry
+        self._excluded_components = [
+            component
+            for component, dependent_attrs in COMPONENT_DEPENDENT_ATTRS.items()
+            if not any(map(lambda attr: attr in morpheme_attrs, dependent_attrs))
+        ]
+        self._batch_size = batch_size
+        self._n_process = n_process
+        self._cache = cache
+        self._ja_regex = re.compile(JAPANESE_REGEX)
+        self._en_regex = re.compile(ALPHABET_REGEX)
         self._symbol_regex = re.compile(SYMBOL_REGEX)
 
     def tokenize(self, text: str) -> List[BaseMorpheme]:
+        return self.tokenize_many([text])[0]
+
+    def tokenize_many(self, texts: Iterable[str]) -> List[List[BaseMorpheme]]:
+        texts = list(texts)
+        morphemes_list: List[List[BaseMorpheme]] = [[] for _ in texts]
+
+        # the same text is tokenized only once
+        lang_text_indices: Dict[str, Dict[str, List[int]]] = {"ja": {}, "en": {}}
+        for idx, text in enumerate(texts):
+            lang = self._detect_lang(text)
+            if lang is not None:
+                lang_text_indices[lang].setdefault(text, []).append(idx)
+
+        for lang, text_indices in lang_text_indices.items():
+            lang = cast(Literal["ja", "en"], lang)
+            for text, morphemes in self._tokenize_texts(lang, list(text_indices)):
+                for idx in text_indices[text]:
+                    morphemes_list[idx] = list(morphemes)
+
+        return morphemes_list
+
+    def cache_info(self) -> Optional[TokenizationCacheInfo]:
+        return self._cache.cache_info() if self._cache is not None else None
+
+    # private
+    def _tokenize_texts(
+        self, lang: Literal["ja", "en"], texts: List[str]
+    ) -> Iterator[Tuple[str, List[SpaCyMorpheme]]]:
+        if not texts:
+            return
+
+        uncached_texts = texts
+        if self._cache is not None:
+            model_key = self._get_model_key(lang)
+            uncached_texts = []
+            for text in texts:
+                morphemes = self._cache.load(model_key, text)
+                if morphemes is None:
+                    uncached_texts.append(text)
+                else:
+                    yield text, morphemes
+
+        # a model is not loaded unless there are texts to be tokenized by it
+        if not uncached_texts:
+            return
+
+        create_morpheme = (
+            self._create_japanese_morpheme
+            if lang == "ja"
+            else self._create_english_morpheme
+        )
+        model = self._get_model(lang)
+        # worker processes are not started for texts fewer than a batch
+        # since starting them costs more than tokenizing the texts
+        batch_size = (
+            self._batch_size if self._batch_size is not None else model.batch_size
+        )
+        n_process = self._n_process if len(uncached_texts) >= batch_size else 1
+        # pyright:reportUnknownVariableType=false
+        docs = model.pipe(
+            uncached_texts, batch_size=self._batch_size, n_process=n_process
+        )
+        for text, doc in zip(uncached_texts, docs):
+            morphemes = list(map(create_morpheme, doc))
+            if self._cache is not None:
+                self._cache.store(self._get_model_key(lang), text, morphemes)
+            yield text, morphemes
+
+    def _get_model_key(self, lang: Literal["ja", "en"]) -> str:
+        model_name = SPACY_MODEL_NAMES[lang]
+        model_version = spacy_model_registry.get_model_version(lang)
+        return f"{model_name}-{model_version}-{','.join(self._excluded_components)}"
+
+    def _get_model(self, lang: Literal["ja", "en"]) -> Any:
+        return spacy_model_registry.get_model(lang, self._excluded_components)
+
+    def _detect_lang(self, text: str) -> Optional[Literal["ja", "en"]]:
         if not text:
-            return []
-
-        ja_regex = re.compile(JAPANESE_REGEX)
-        en_regex = re.compile(ALPHABET_REGEX)
-
-        # pyright:reportUnknownArgumentType=false
-        # pyright:reportUnknownLambdaType=false
-        if ja_regex.search(text):
-            return list(
-                map(
-                    lambda token: self._create_japanese_morpheme(token),
-                    self._ja_model(text),
-                )
-            )
-        elif en_regex.search(text):
-            return list(
-                map(
-                    lambda token: self._create_english_morpheme(token),
-                    self._en_model(text),
-                )
-            )
+            return None
+        if self._ja_regex.search(text):
+            return "ja"
+        elif self._en_regex.search(text):
+            return "en"
         else:
-            return []
+            return None
 
-    # private
     def _create_japanese_morpheme(self, token: Any) -> SpaCyMorpheme:
         if self._symbol_regex.fullmatch(token.text):
             return SpaCyMorpheme(
@@ -1,5 +1,6 @@
-from io import BytesIO
-from xml.etree.ElementTree import fromstring
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from xml.etree.ElementTree import Element
+from typing import List, Dict, Tuple, Iterator, Optional
 
 from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdfpage import PDFPage
@@ -8,6 +9,8 @@ from pdfminer.layout import LAParams
 from .textful import TextfulXMLConverter
 from .data import PDFnXMLPath, PDFnXMLElement
 
+PageRange = Tuple[int, Optional[int]]
+
 
 class PDFtoXMLConverter:
     # public
@@ -36,27 +39,136 @@ class PDFtoXMLConverter:
         return PDFnXMLPath(pdf_path, xml_path)
 
     def convert_as_element(
-        self, pdf_path: str, apply_nfc_normalization: bool = True
+        self,
+        pdf_path: str,
+        apply_nfc_normalization: bool = True,
+        max_workers: Optional[int] = 1,
+        pages_per_chunk: Optional[int] = None,
     ) -> PDFnXMLElement:
-        manager = PDFResourceManager()
-        params = LAParams()
+        if max_workers == 1 or pages_per_chunk is None:
+            return _convert_page_range(pdf_path, apply_nfc_normalization, (0, None))
 
-        with open(pdf_path, "rb") as pdf_file, BytesIO() as xml_stream:
-            converter = TextfulXMLConverter(
-                manager,
-                xml_stream,
-                laparams=params,
-                stripcontrol=True,
-                nfcnorm=apply_nfc_normalization,
-            )
-            page_interpreter = PDFPageInterpreter(manager, converter)
+        pdfnxmls = self.convert_many(
+            [pdf_path],
+            apply_nfc_normalization=apply_nfc_normalization,
+            max_workers=max_workers,
+            pages_per_chunk=pages_per_chunk,
+        )
+        return next(pdfnxmls)
+
+    def convert_as_page_elements(
+        self, pdf_path: str, apply_nfc_normalization: bool = True
+    ) -> Iterator[Element]:
+        return _generate_page_elements(pdf_path, apply_nfc_normalization, (0, None))
+
+    def convert_many(
+        self,
+        pdf_paths: List[str],
+        apply_nfc_normalization: bool = True,
+        max_workers: Optional[int] = None,
+        ordered: bool = True,
+        pages_per_chunk: Optional[int] = None,
+    ) -> Iterator[PDFnXMLElement]:
+        if max_workers == 1:
+            for pdf_path in pdf_paths:
+                yield self.convert_as_element(pdf_path, apply_nfc_normalization)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # all page ranges of all PDFs share the pool,
+            # so that a large PDF does not keep the other workers idle
+            chunk_futures_list: List[List["Future[PDFnXMLElement]"]] = [
+                [
+                    executor.submit(
+                        _convert_page_range, pdf_path, apply_nfc_normalization, pages
+                    )
+                    for pages in self._split_pages(pdf_path, pages_per_chunk)
+                ]
+                for pdf_path in pdf_paths
+            ]
+
+            if ordered:
+                for chunk_futures in chunk_futures_list:
+                    yield self._join_chunks(chunk_futures)
+                return
+
+            pdf_ids: Dict["Future[PDFnXMLElement]", int] = dict()
+            num_remaining_chunks: List[int] = []
+            for pdf_id, chunk_futures in enumerate(chunk_futures_list):
+                pdf_ids.update({future: pdf_id for future in chunk_futures})
+                num_remaining_chunks.append(len(chunk_futures))
+
+            for future in as_completed(pdf_ids):
+                pdf_id = pdf_ids[future]
+                num_remaining_chunks[pdf_id] -= 1
+                if num_remaining_chunks[pdf_id] == 0:
+                    yield self._join_chunks(chunk_futures_list[pdf_id])
+
+    # private
+    def _split_pages(
+        self, pdf_path: str, pages_per_chunk: Optional[int]
+    ) -> List[PageRange]:
+        if pages_per_chunk is None:
+            return [(0, None)]
+
+        with open(pdf_path, "rb") as pdf_file:
             pages = PDFPage.get_pages(pdf_file)  # pyright:reportUnknownMemberType=false
+            num_pages = sum(1 for _ in pages)
 
-            converter.write_header()
-            for page in pages:
-                page_interpreter.process_page(page)
-            converter.write_footer()
+        if num_pages <= pages_per_chunk:
+            return [(0, None)]
+
+        return [
+            (start, min(start + pages_per_chunk, num_pages))
+            for start in range(0, num_pages, pages_per_chunk)
+        ]
+
+    def _join_chunks(
+        self, chunk_futures: List["Future[PDFnXMLElement]"]
+    ) -> PDFnXMLElement:
+        pdfnxml = chunk_futures[0].result()
+        for future in chunk_futures[1:]:
+            pdfnxml.xml_root.extend(future.result().xml_root)
+
+        return pdfnxml
+
+
+def _convert_page_range(
+    pdf_path: str, apply_nfc_normalization: bool, pages: PageRange
+) -> PDFnXMLElement:
+    # top-level function so that it can be pickled into worker processes
+    xml_root = Element("pages")
+    xml_root.text = "\n"
+    xml_root.extend(_generate_page_elements(pdf_path, apply_nfc_normalization, pages))
+    return PDFnXMLElement(pdf_path, xml_root)
+
+
+def _generate_page_elements(
+    pdf_path: str, apply_nfc_normalization: bool, pages: PageRange
+) -> Iterator[Element]:
+    page_start, page_stop = pages
+    manager = PDFResourceManager()
+    params = LAParams()
 
-            xml_element = fromstring(xml_stream.getvalue().decode("utf-8"))
+    with open(pdf_path, "rb") as pdf_file:
+        converter = TextfulXMLConverter(
+            manager,
+            pageno=page_start + 1,
+            laparams=params,
+            stripcontrol=True,
+            nfcnorm=apply_nfc_normalization,
+        )
+        page_interpreter = PDFPageInterpreter(manager, converter)
+        pages_iter = PDFPage.get_pages(  # pyright:reportUnknownMemberType=false
+            pdf_file,
+            pagenos=range(page_start, page_stop) if page_stop is not None else None,
+            maxpages=page_stop if page_stop is not None else 0,
+        )
 
-        return PDFnXMLElement(pdf_path, xml_element)
+        xml_root = converter.get_xml_root()
+        for page in pages_iter:
+            page_interpreter.process_page(page)
+            # hand over the rendered page so that the converter keeps no pages
+            page_elements = list(xml_root)
+            del xml_root[:]
+            yield from page_elements
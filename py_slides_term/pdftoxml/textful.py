@@ -1,14 +1,14 @@
 import re
 from io import BufferedWriter, BytesIO
 from unicodedata import normalize
-from dataclasses import dataclass
-from typing import Any, Union, Optional, cast
+from dataclasses import dataclass, field
+from xml.etree.ElementTree import Element, SubElement, tostring
+from typing import Any, Dict, Union, Optional, cast
 
 from pdfminer.pdfinterp import PDFResourceManager
 from pdfminer.converter import PDFConverter
 from pdfminer.layout import LTPage, LTTextBox, LTTextLine, LTChar, LTAnno, LTText
 from pdfminer.layout import LAParams
-from pdfminer.utils import enc
 
 
 @dataclass
@@ -17,6 +17,7 @@ class TextfulState:
     ncolor: str = ""
     size: float = 0.0
     text: str = ""
+    attrib: Dict[str, str] = field(default_factory=dict)
 
 
 class TextfulXMLConverter(PDFConverter):
@@ -28,7 +29,7 @@ class TextfulXMLConverter(PDFConverter):
     def __init__(
         self,
         rsrcmgr: PDFResourceManager,
-        outfp: Union[BufferedWriter, BytesIO],
+        outfp: Optional[Union[BufferedWriter, BytesIO]] = None,
         codec: str = "utf-8",
         pageno: int = 1,
         laparams: Optional[LAParams] = None,
@@ -40,6 +41,10 @@ class TextfulXMLConverter(PDFConverter):
         )  # pyright:reportUnknownMemberType=false
         self._stripcontrol = stripcontrol
         self._nfcnorm = nfcnorm
+        # if outfp is None, rendered pages are appended to this element
+        # instead of being written to outfp
+        self._xml_root = Element("pages")
+        self._xml_root.text = "\n"
 
     def write_header(self):
         if self.codec:
@@ -50,35 +55,42 @@ class TextfulXMLConverter(PDFConverter):
         self._write("<pages>\n")
 
     def receive_layout(self, ltpage: LTPage):
-        self._render(ltpage)
+        page_element = self._render_page(ltpage)
+        if self.outfp is None:
+            self._xml_root.append(page_element)
+        else:
+            self._write(tostring(page_element, encoding="unicode"))
 
     def write_footer(self):
         self._write("</pages>\n")
 
+    def get_xml_root(self) -> Element:
+        return self._xml_root
+
     # private
-    def _render(self, item: Any):
-        if isinstance(item, LTPage):
-            pageid: str = item.pageid
-            self._write('<page id="%s">\n' % pageid)
-            for child in item:  # pyright:reportUnknownVariableType=false
-                self._render(child)
-            self._write("</page>\n")
-        elif isinstance(item, LTTextBox):
-            self._render_textlike_item(item)
+    def _render_page(self, ltpage: LTPage) -> Element:
+        pageid: str = str(ltpage.pageid)
+        page_element = Element("page", {"id": pageid})
+        page_element.text = "\n"
+        page_element.tail = "\n"
+        for child in ltpage:  # pyright:reportUnknownVariableType=false
+            self._render(child, page_element)
+        return page_element
+
+    def _render(self, item: Any, parent: Element):
+        if isinstance(item, LTTextBox):
+            self._render_textlike_item(item, parent)
         elif isinstance(item, LTTextLine):
-            self._render_textlike_item(item)
+            self._render_textlike_item(item, parent)
         elif isinstance(item, LTChar):
             ncolor: str = item.graphicstate.ncolor
             size: float = item.size
-            self._write('<text ncolour="%s" size="%.3f">' % (ncolor, size))
-            self._write_text(self._get_text(item))
-            self._write("</text>\n")
+            attrib = {"ncolour": str(ncolor), "size": "%.3f" % size}
+            self._add_text_element(parent, self._get_text(item), attrib)
         elif isinstance(item, LTText):
-            self._write("<text>")
-            self._write_text(self._get_text(item))
-            self._write("</text>\n")
+            self._add_text_element(parent, self._get_text(item), dict())
 
-    def _render_textlike_item(self, item: Any):
+    def _render_textlike_item(self, item: Any, parent: Element):
         state = TextfulState()
 
         def rec_render_textlike_item(rec_item: Any):
@@ -89,26 +101,25 @@ class TextfulXMLConverter(PDFConverter):
                 for child in rec_item:  # pyright:reportUnknownVariableType=false
                     rec_render_textlike_item(child)
             else:
-                self._render_charlike_item(rec_item, state)
+                self._render_charlike_item(rec_item, parent, state)
 
         def finalize_textlike_item_rendering():
             if not state.in_text_section:
                 return
-            self._write_text(state.text)
-            self._write("</text>\n")
+            self._add_text_element(parent, state.text, state.attrib)
 
         rec_render_textlike_item(item)
         finalize_textlike_item_rendering()
 
-    def _render_charlike_item(self, item: Any, state: TextfulState):
+    def _render_charlike_item(self, item: Any, parent: Element, state: TextfulState):
         def enter_text_section():
             ncolor = cast(str, item.graphicstate.ncolor)
             size = cast(float, item.size)
-            self._write('<text ncolour="%s" size="%.3f">' % (ncolor, size))
             state.in_text_section = True
             state.ncolor = ncolor
             state.size = size
             state.text = self._get_text(item)
+            state.attrib = {"ncolour": str(ncolor), "size": "%.3f" % size}
 
         def text_section_continues() -> bool:
             return (
@@ -118,12 +129,12 @@ class TextfulXMLConverter(PDFConverter):
             )
 
         def exit_text_section():
-            self._write_text(state.text)
-            self._write("</text>\n")
+            self._add_text_element(parent, state.text, state.attrib)
             state.in_text_section = False
             state.ncolor = ""
             state.size = 0.0
             state.text = ""
+            state.attrib = dict()
 
         if state.in_text_section:
             if isinstance(item, LTChar):
@@ -137,6 +148,11 @@ class TextfulXMLConverter(PDFConverter):
         elif isinstance(item, LTChar):
             enter_text_section()
 
+    def _add_text_element(self, parent: Element, text: str, attrib: Dict[str, str]):
+        text_element = SubElement(parent, "text", attrib)
+        text_element.text = self._clean_text(text)
+        text_element.tail = "\n"
+
     def _write(self, text: str):
         if self.codec:
             text = text.encode(
@@ -144,12 +160,12 @@ class TextfulXMLConverter(PDFConverter):
             )  # pyright:reportGeneralTypeIssues=false
         cast(Union[BufferedWriter, BytesIO], self.outfp).write(text)
 
-    def _write_text(self, text: str):
+    def _clean_text(self, text: str) -> str:
         if self._stripcontrol:
             text = self.CONTROL.sub("", text)
         if self._nfcnorm:
             text = normalize("NFC", text)
-        self._write(enc(text))  # pyright:reportUnknownArgumentType=false
+        return text
 
     def _get_text(self, item: Union[LTText, LTChar]) -> str:
         text = cast(str, item.get_text())  # pyright:reportGeneralTypeIssues=false
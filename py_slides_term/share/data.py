@@ -1,44 +1,35 @@
-import re
-from dataclasses import dataclass, asdict
-from typing import List, Tuple, Dict, Any, Type
-
-from py_slides_term.morphemes import BaseMorpheme, SpaCyMorpheme
-from py_slides_term.share.consts import JAPANESE_REGEX
+from dataclasses import dataclass, field, asdict
+from typing import List, Tuple, Dict, Any, Type, Optional, cast
 
+from py_slides_term.morphemes import BaseMorpheme, SpaCyMorpheme, MorphemeTable
+from py_slides_term.share.slots import add_slots
+from py_slides_term.share.utils import term_separator
 
 LinguSeq = Tuple[Tuple[str, str, str], ...]
 
 
+@add_slots
 @dataclass(frozen=True)
 class Term:
     morphemes: List[BaseMorpheme]
     fontsize: float = 0.0
     augmented: bool = False
+    _term_str: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # string representation of the term, which is created on the first call of str()
+    # morphemes of the term must not be modified
 
-    def __str__(self) -> str:
-        num_morphemes = len(self.morphemes)
-        if not num_morphemes:
-            return ""
-
-        japanese_regex = re.compile(rf"{JAPANESE_REGEX}*")
-        hyphen_regex = re.compile("-")
+    def __hash__(self) -> int:
+        return hash((tuple(self.morphemes), self.fontsize, self.augmented))
 
-        term_str = str(self.morphemes[0])
-        for i in range(1, num_morphemes):
-            prev_morpheme_str = str(self.morphemes[i - 1])
-            morpheme_str = str(self.morphemes[i])
-            if (
-                japanese_regex.fullmatch(prev_morpheme_str) is None
-                or japanese_regex.fullmatch(morpheme_str) is None
-            ) and (
-                hyphen_regex.fullmatch(prev_morpheme_str) is None
-                and hyphen_regex.fullmatch(morpheme_str) is None
-            ):
-                term_str += " "
-
-            term_str += morpheme_str
-
-        return term_str
+    def __str__(self) -> str:
+        # the slot of _term_str is empty until the first call of str()
+        term_str = getattr(self, "_term_str", None)
+        if term_str is None:
+            term_str = self._create_str()
+            object.__setattr__(self, "_term_str", term_str)
+        return cast(str, term_str)
 
     def linguistic_sequence(self) -> LinguSeq:
         return tuple(
@@ -58,14 +49,36 @@ class Term:
         cls,
         obj: Dict[str, Any],
         morpheme_cls: Type[BaseMorpheme] = SpaCyMorpheme,
+        morpheme_table: Optional[MorphemeTable] = None,
     ):
+        # if morpheme_table is given, morphemes are shared with other terms through it
+        morphemes = list(
+            map(lambda item: morpheme_cls.from_json(item), obj["morphemes"])
+        )
+        if morpheme_table is not None:
+            morphemes = morpheme_table.canonicalize(morphemes)
         return cls(
-            list(map(lambda item: morpheme_cls.from_json(item), obj["morphemes"])),
+            morphemes,
             obj.get("fontsize", 0),
             obj.get("augmented", False),
         )
 
+    # private
+    def _create_str(self) -> str:
+        num_morphemes = len(self.morphemes)
+        if not num_morphemes:
+            return ""
+
+        term_str = str(self.morphemes[0])
+        for i in range(1, num_morphemes):
+            prev_morpheme_str = str(self.morphemes[i - 1])
+            morpheme_str = str(self.morphemes[i])
+            term_str += term_separator(prev_morpheme_str, morpheme_str) + morpheme_str
+
+        return term_str
+
 
+@add_slots
 @dataclass(frozen=True)
 class ScoredTerm:
     term: str
@@ -0,0 +1,50 @@
+from dataclasses import fields
+from typing import Set, Dict, Any, Type, TypeVar
+
+DataclassType = TypeVar("DataclassType")
+
+
+def add_slots(cls: Type[DataclassType]) -> Type[DataclassType]:
+    # backport of dataclass(slots=True), which is not available before Python 3.10
+    # instances of the returned class have no __dict__,
+    # which saves memory and makes them faster to create
+    inherited_slots: Set[str] = set()
+    for base_cls in cls.__mro__[1:]:
+        inherited_slots.update(base_cls.__dict__.get("__slots__", ()))
+
+    field_names = [
+        dataclass_field.name
+        for dataclass_field in fields(cls)  # type: ignore
+        if dataclass_field.name not in inherited_slots
+    ]
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(field_names)
+    # default values are passed to __init__ by dataclass
+    # and class attributes of the same names conflict with the slots
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    # frozen instances cannot be unpickled by setattr
+    cls_dict["__getstate__"] = _getstate
+    cls_dict["__setstate__"] = _setstate
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _getstate(self: Any) -> Dict[str, Any]:
+    # slots of fields with init=False are empty until they are set
+    return {
+        dataclass_field.name: getattr(self, dataclass_field.name)
+        for dataclass_field in fields(self)
+        if hasattr(self, dataclass_field.name)
+    }
+
+
+def _setstate(self: Any, state: Dict[str, Any]):
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
@@ -1,8 +1,26 @@
+import re
 from typing import List, SupportsFloat, TypeVar
 from math import log, log2, log10
 
+from .consts import JAPANESE_REGEX
+
 __T = TypeVar("__T")
 
+_japanese_regex = re.compile(rf"{JAPANESE_REGEX}*")
+_hyphen_regex = re.compile("-")
+
+
+def term_separator(prev_morpheme_str: str, morpheme_str: str) -> str:
+    if (
+        _japanese_regex.fullmatch(prev_morpheme_str) is None
+        or _japanese_regex.fullmatch(morpheme_str) is None
+    ) and (
+        _hyphen_regex.fullmatch(prev_morpheme_str) is None
+        and _hyphen_regex.fullmatch(morpheme_str) is None
+    ):
+        return " "
+    return ""
+
 
 def extended_log(x: SupportsFloat, base: SupportsFloat) -> float:
     float_x = float(x)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .data import DomainTechnicalTermList, PDFTechnicalTermList
 from .converter import RankingToScoreDictConverter
 from .selector import TechnicalTermSelector
@@ -15,10 +17,12 @@ class TechnicalTermExtractor:
         self,
         domain_candidates: DomainCandidateTermList,
         domain_term_ranking: DomainTermRanking,
+        max_workers: Optional[int] = 1,
     ) -> DomainTechnicalTermList:
+        # the ranking is converted only once for all PDFs in the domain
         domain_term_scores = self._converter.convert(domain_term_ranking)
         technical_terms = self._selector.select_from_domain(
-            domain_candidates, domain_term_scores
+            domain_candidates, domain_term_scores, max_workers=max_workers
         )
         return technical_terms
 
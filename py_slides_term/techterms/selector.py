@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
 from .data import (
     DomainTechnicalTermList,
     PDFTechnicalTermList,
@@ -22,13 +25,27 @@ class TechnicalTermSelector:
         self,
         domain_candidates: DomainCandidateTermList,
         domain_term_scores: DomainTermScoreDict,
+        max_workers: Optional[int] = 1,
     ) -> DomainTechnicalTermList:
-        pdfs = list(
-            map(
-                lambda pdfs: self.select_from_pdf(pdfs, domain_term_scores),
-                domain_candidates.pdfs,
+        if max_workers == 1 or len(domain_candidates.pdfs) <= 1:
+            pdfs = list(
+                map(
+                    lambda pdfs: self.select_from_pdf(pdfs, domain_term_scores),
+                    domain_candidates.pdfs,
+                )
             )
-        )
+            return DomainTechnicalTermList(domain_candidates.domain, pdfs)
+
+        # the selector and the scores are sent to each worker process only once
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(self, domain_term_scores),
+        ) as executor:
+            pdfs = list(
+                executor.map(_select_from_pdf_in_worker, domain_candidates.pdfs)
+            )
+
         return DomainTechnicalTermList(domain_candidates.domain, pdfs)
 
     def select_from_pdf(
@@ -67,3 +84,24 @@ class TechnicalTermSelector:
             )
 
         return PageTechnicalTermList(page_candidates.page_num, scored_terms)
+
+
+_worker_selector: Optional[TechnicalTermSelector] = None
+_worker_term_scores: Optional[DomainTermScoreDict] = None
+
+
+def _initialize_worker(
+    selector: TechnicalTermSelector, domain_term_scores: DomainTermScoreDict
+):
+    # top-level function so that it can be pickled into worker processes
+    global _worker_selector, _worker_term_scores
+    _worker_selector = selector
+    _worker_term_scores = domain_term_scores
+
+
+def _select_from_pdf_in_worker(
+    pdf_candidates: PDFCandidateTermList,
+) -> PDFTechnicalTermList:
+    if _worker_selector is None or _worker_term_scores is None:
+        raise RuntimeError("worker process is not initialized")
+    return _worker_selector.select_from_pdf(pdf_candidates, _worker_term_scores)
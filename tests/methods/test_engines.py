@@ -0,0 +1,158 @@
+from typing import List
+
+from pytest import approx, importorskip
+
+from py_slides_term.candidates import (
+    DomainCandidateTermList,
+    PDFCandidateTermList,
+    PageCandidateTermList,
+)
+from py_slides_term.methods import (
+    MCValueMethod,
+    FLRMethod,
+    TFIDFMethod,
+    LFIDFMethod,
+    MDPMethod,
+)
+from py_slides_term.methods.data import DomainTermRanking
+from py_slides_term.morphemes import SpaCyMorpheme
+from py_slides_term.share.data import Term
+
+TF_MODES = ["natural", "log", "augmented", "logave", "binary"]
+IDF_MODES = ["natural", "smooth", "prob", "unary"]
+
+
+def noun(surface_form: str) -> SpaCyMorpheme:
+    return SpaCyMorpheme(
+        "en",
+        surface_form,
+        "NOUN",
+        "NN",
+        "*",
+        "*",
+        "NOUN",
+        "compound",
+        surface_form,
+        "xxxx",
+        False,
+    )
+
+
+def term(text: str, fontsize: float) -> Term:
+    return Term(list(map(noun, text.split())), fontsize)
+
+
+DOMAIN_CANDIDATES_LIST = [
+    DomainCandidateTermList(
+        "nlp",
+        [
+            PDFCandidateTermList(
+                "nlp.pdf",
+                [
+                    PageCandidateTermList(
+                        1,
+                        [
+                            term("natural language processing", 24.0),
+                            term("language model", 18.0),
+                            term("language model training", 12.0),
+                        ],
+                    ),
+                    PageCandidateTermList(
+                        2,
+                        [
+                            term("language model", 12.0),
+                            term("model training", 12.0),
+                            term("training data", 10.0),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    ),
+    DomainCandidateTermList(
+        "vision",
+        [
+            PDFCandidateTermList(
+                "vision.pdf",
+                [
+                    PageCandidateTermList(
+                        1,
+                        [
+                            term("image recognition", 24.0),
+                            term("image model", 18.0),
+                            term("training data", 12.0),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    ),
+]
+
+
+def test_single_domain_numpy_engine():
+    importorskip("numpy")
+    for method_cls in [MCValueMethod, FLRMethod]:
+        for domain_candidates in DOMAIN_CANDIDATES_LIST:
+            assert_same_scores(
+                method_cls().rank_terms(domain_candidates),
+                method_cls(engine="numpy").rank_terms(domain_candidates),
+            )
+
+
+def test_multi_domain_numpy_engine():
+    importorskip("numpy")
+    for method_cls in [TFIDFMethod, LFIDFMethod, MDPMethod]:
+        assert_same_rankings(
+            list(method_cls().rank_terms(DOMAIN_CANDIDATES_LIST)),
+            list(method_cls(engine="numpy").rank_terms(DOMAIN_CANDIDATES_LIST)),
+        )
+
+
+def test_tfidf_modes_numpy_engine():
+    importorskip("numpy")
+    for method_cls in [TFIDFMethod, LFIDFMethod]:
+        for tfmode in TF_MODES:
+            for idfmode in IDF_MODES:
+                assert_same_rankings(
+                    list(
+                        method_cls(tfmode=tfmode, idfmode=idfmode).rank_terms(
+                            DOMAIN_CANDIDATES_LIST
+                        )
+                    ),
+                    list(
+                        method_cls(
+                            tfmode=tfmode, idfmode=idfmode, engine="numpy"
+                        ).rank_terms(DOMAIN_CANDIDATES_LIST)
+                    ),
+                )
+
+
+def test_tfidf_prob_idf_of_term_in_all_documents():
+    # "training data" is in both documents of the corpus
+    for engine in ["python", "numpy"]:
+        if engine == "numpy":
+            importorskip("numpy")
+        method = TFIDFMethod(tfmode="binary", idfmode="prob", engine=engine)
+        for ranking in method.rank_terms(DOMAIN_CANDIDATES_LIST):
+            scores = {term.term: term.score for term in ranking.ranking}
+            assert scores["training data"] == 0.0
+
+
+def assert_same_rankings(
+    python_rankings: List[DomainTermRanking], numpy_rankings: List[DomainTermRanking]
+):
+    assert len(python_rankings) == len(numpy_rankings)
+    for python_ranking, numpy_ranking in zip(python_rankings, numpy_rankings):
+        assert python_ranking.domain == numpy_ranking.domain
+        assert_same_scores(python_ranking, numpy_ranking)
+
+
+def assert_same_scores(
+    python_ranking: DomainTermRanking, numpy_ranking: DomainTermRanking
+):
+    # scores are equal up to rounding errors,
+    # so the order of terms with nearly equal scores is not compared
+    python_scores = {term.term: term.score for term in python_ranking.ranking}
+    numpy_scores = {term.term: term.score for term in numpy_ranking.ranking}
+    assert numpy_scores == approx(python_scores, rel=1e-12, abs=1e-12)
@@ -0,0 +1,159 @@
+from pytest import approx
+
+from py_slides_term.analysis import DomainTermStatistics
+from py_slides_term.candidates import (
+    DomainCandidateTermList,
+    PDFCandidateTermList,
+    PageCandidateTermList,
+)
+from py_slides_term.methods import FLRMethod, FLRHMethod, HITSMethod
+from py_slides_term.morphemes import SpaCyMorpheme
+from py_slides_term.share.data import Term
+
+
+def noun(surface_form: str) -> SpaCyMorpheme:
+    return SpaCyMorpheme(
+        "ja",
+        surface_form,
+        "名詞",
+        "普通名詞",
+        "一般",
+        "*",
+        "NOUN",
+        "compound",
+        surface_form,
+        "x",
+        False,
+    )
+
+
+def particle(surface_form: str) -> SpaCyMorpheme:
+    return SpaCyMorpheme(
+        "ja",
+        surface_form,
+        "助詞",
+        "格助詞",
+        "*",
+        "*",
+        "ADP",
+        "case",
+        surface_form,
+        "x",
+        True,
+    )
+
+
+# "の" is a meaningless modifying particle in "言語のモデル",
+# but a meaningful noun in "の言語", which comes first in the same PDF
+# "言語処理" appears twice in the same PDF
+DOMAIN_CANDIDATES = DomainCandidateTermList(
+    "test",
+    [
+        PDFCandidateTermList(
+            "a.pdf",
+            [
+                PageCandidateTermList(
+                    1,
+                    [
+                        Term([noun("自然"), noun("言語"), noun("処理")], 20.0),
+                        Term([noun("の"), noun("言語")], 10.0),
+                    ],
+                ),
+                PageCandidateTermList(
+                    2,
+                    [
+                        Term([noun("言語"), noun("処理")], 10.0),
+                        Term([noun("言語"), particle("の"), noun("モデル")], 10.0),
+                        Term([noun("処理"), noun("速度")], 10.0),
+                    ],
+                ),
+            ],
+        ),
+        PDFCandidateTermList(
+            "b.pdf",
+            [
+                PageCandidateTermList(
+                    1,
+                    [
+                        Term([noun("言語"), noun("モデル")], 10.0),
+                        Term([noun("言語"), noun("処理")], 10.0),
+                    ],
+                ),
+            ],
+        ),
+    ],
+)
+
+
+def test_left_right_frequency():
+    ranking_data = FLRMethod().collect_data(DOMAIN_CANDIDATES)
+    assert ranking_data.left_freq == {
+        "自然": {},
+        "言語": {"自然": 2, "の": 2},
+        "処理": {"言語": 6},
+        "の": {},
+        "モデル": {"言語": 2},
+        "速度": {"処理": 2},
+    }
+    assert ranking_data.right_freq == {
+        "自然": {"言語": 2},
+        "言語": {"処理": 6, "モデル": 2},
+        "処理": {"速度": 2},
+        "の": {"言語": 2},
+        "モデル": {},
+        "速度": {},
+    }
+
+
+def test_flr_ranking():
+    assert_ranking(
+        FLRMethod(),
+        {
+            "言語処理": 2.522009,
+            "自然言語処理": 1.876456,
+            "の言語": 1.532583,
+            "言語のモデル": 1.532583,
+            "言語モデル": 1.532583,
+            "処理速度": 1.449835,
+        },
+    )
+
+
+def test_flrh_ranking():
+    assert_ranking(
+        FLRHMethod(max_iterations=100),
+        {
+            "言語処理": 4.498089,
+            "自然言語処理": 3.375414,
+            "の言語": 2.730512,
+            "言語のモデル": 2.730512,
+            "言語モデル": 2.730512,
+            "処理速度": 2.449835,
+        },
+    )
+
+
+def test_hits_ranking():
+    assert_ranking(
+        HITSMethod(max_iterations=100),
+        {
+            "言語処理": 1.976079,
+            "自然言語処理": 1.498958,
+            "の言語": 1.197928,
+            "言語のモデル": 1.197928,
+            "言語モデル": 1.197928,
+            "処理速度": 1.0,
+        },
+    )
+
+
+def assert_ranking(method, expected_scores):
+    ranking = method.rank_terms(DOMAIN_CANDIDATES).ranking
+    assert {term.term: term.score for term in ranking} == approx(expected_scores)
+
+    # rankings from per-PDF statistics are the same as rankings from candidates
+    domain_stats = DomainTermStatistics(DOMAIN_CANDIDATES.domain)
+    for pdf_candidates in DOMAIN_CANDIDATES.pdfs:
+        domain_stats.add(method.collect_pdf_statistics(pdf_candidates))
+    ranking_data = method.collect_data_from_statistics(domain_stats)
+    assert method.rank_terms(DOMAIN_CANDIDATES, ranking_data).ranking == ranking
@@ -0,0 +1,43 @@
+import json
+
+from .test_engines import DOMAIN_CANDIDATES_LIST
+from py_slides_term.methods import (
+    MCValueMethod,
+    FLRMethod,
+    HITSMethod,
+    FLRHMethod,
+    TFIDFMethod,
+    LFIDFMethod,
+    MDPMethod,
+)
+
+
+def test_single_domain_ranking_data_json():
+    for method_cls in [MCValueMethod, FLRMethod, HITSMethod, FLRHMethod]:
+        method = method_cls()
+        for domain_candidates in DOMAIN_CANDIDATES_LIST:
+            ranking_data = method.collect_data(domain_candidates)
+            obj = json.loads(json.dumps(ranking_data.to_json()))
+            assert method.collect_data_from_json(obj) == ranking_data
+
+
+def test_multi_domain_ranking_data_json():
+    for method_cls in [TFIDFMethod, LFIDFMethod, MDPMethod]:
+        method = method_cls()
+        ranking_data_list = list(map(method.collect_data, DOMAIN_CANDIDATES_LIST))
+        loaded_ranking_data_list = [
+            method.collect_data_from_json(json.loads(json.dumps(data.to_json())))
+            for data in ranking_data_list
+        ]
+        assert loaded_ranking_data_list == ranking_data_list
+        assert list(
+            method.rank_terms(DOMAIN_CANDIDATES_LIST, loaded_ranking_data_list)
+        ) == list(method.rank_terms(DOMAIN_CANDIDATES_LIST, ranking_data_list))
+
+
+def test_ranking_data_json_is_keyed_by_terms():
+    # ids of terms are not written to caches
+    ranking_data = MCValueMethod().collect_data(DOMAIN_CANDIDATES_LIST[0])
+    obj = ranking_data.to_json()
+    assert obj["term_freq"]["language model"] == 3
+    assert set(obj["container_terms"]["language model"]) == {"language model training"}